@@ -0,0 +1,51 @@
+"""
+Benchmark: streaming pattern accumulators
+Throughput per record batch and state size as the stream grows
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.swarm_coordination.accumulators import PatternAccumulator
+
+REASONS = np.array(["Overassessment", "Clerical error", "Market decline", "Exemption"], dtype=object)
+
+
+def state_size(accumulator: PatternAccumulator) -> int:
+    """Centroids plus heavy-hitter counters currently held"""
+    return (len(accumulator.assessed_quantiles.means) + len(accumulator.ratio_quantiles.means)
+            + len(accumulator.reasons.counts) + len(accumulator.streets.counts))
+
+
+def main(count: int = 1_000_000, batch_size: int = 500):
+    rng = np.random.default_rng(0)
+    accumulator = PatternAccumulator()
+    print(f"Streaming {count:,} properties and appeals in batches of {batch_size}...")
+    
+    start = time.perf_counter()
+    for offset in range(0, count, batch_size):
+        size = min(batch_size, count - offset)
+        assessed_value = rng.lognormal(12, 0.4, size)
+        accumulator.update_properties(
+            assessed_value,
+            assessed_value * rng.uniform(0.8, 1.2, size),
+            [f"Street {i}" for i in rng.zipf(1.5, size) % 5000]
+        )
+        accumulator.update_appeals(REASONS[rng.integers(0, len(REASONS), size)], assessed_value * 0.15)
+        if offset // batch_size % (count // batch_size // 4 or 1) == 0:
+            print(f"  {offset + size:>9,} records  state {state_size(accumulator):4} entries")
+    elapsed = time.perf_counter() - start
+    
+    distributions = accumulator.distributions(top=3)
+    print(f"{count / elapsed:,.0f} records/s, final state {state_size(accumulator)} entries")
+    print(f"assessed p50 {distributions['assessed_value']['p50']:,.0f}  p99 {distributions['assessed_value']['p99']:,.0f}  "
+          f"top streets {list(distributions['top_streets'])}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
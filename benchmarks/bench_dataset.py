@@ -0,0 +1,51 @@
+"""
+Benchmark: record lists vs columnar RecordDataset
+Measures retained memory and pattern-total aggregation time over a county roll
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data_collection.dataset import RecordDataset
+from src.swarm_coordination.agents import compute_pattern_totals
+from bench_handoff import build_records
+
+
+def main(count: int = 100_000):
+    print(f"Building {count:,} property + appeal records...")
+    
+    tracemalloc.start()
+    properties, appeals = build_records(count)
+    records_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    start = time.perf_counter()
+    dataset = RecordDataset.from_records(properties, appeals)
+    build_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    compute_pattern_totals({"property_records": properties, "appeal_records": appeals})
+    records_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    compute_pattern_totals({"dataset": dataset})
+    dataset_time = time.perf_counter() - start
+    
+    # Keep only the columns alive to see what the dataset itself retains
+    del properties, appeals
+    tracemalloc.start()
+    dataset = RecordDataset.from_records(*build_records(count))
+    dataset_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    print(f"records   retained {records_bytes / 1e6:8.1f} MB  totals {records_time:7.3f}s")
+    print(f"dataset   retained {dataset_bytes / 1e6:8.1f} MB  totals {dataset_time:7.3f}s  (built in {build_time:.3f}s)")
+    print(f"Memory reduced {records_bytes / max(dataset_bytes, 1):.1f}x, aggregation {records_time / max(dataset_time, 1e-9):.0f}x faster")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,80 @@
+"""
+Benchmark: one task per appeal vs process_appeal_batch dispatch
+Measures scheduler and TaskResult overhead per appeal with the simulated latency removed
+"""
+
+import asyncio
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data_collection.property_index import PropertyIndex
+from src.swarm_coordination.agents import ProcessorAgent, expand_batch_result
+from src.swarm_coordination.models import WorkflowTask
+from src.swarm_coordination.scheduler import WorkScheduler
+from bench_handoff import build_records
+
+
+async def _no_latency(delay, result=None):
+    return result
+
+
+async def per_appeal_dispatch(joined, agents):
+    """Baseline: one WorkflowTask and one TaskResult per appeal"""
+    tasks = (
+        WorkflowTask(task_id=f"T003_process_appeal_{i:03d}", task_type="process_appeal", parameters={"appeal": appeal})
+        for i, appeal in enumerate(joined)
+    )
+    return await WorkScheduler(agents).run(tasks)
+
+
+async def batched_dispatch(joined, agents, batch_size: int = 100):
+    """One task per chunk, expanded into per-appeal views on arrival"""
+    batch_appeals = {}
+    
+    def tasks():
+        for n, start in enumerate(range(0, len(joined), batch_size)):
+            chunk = joined[start:start + batch_size]
+            task_id = f"T003_process_batch_{n:03d}"
+            batch_appeals[task_id] = [appeal["appeal_id"] for appeal in chunk]
+            yield WorkflowTask(task_id=task_id, task_type="process_appeal_batch", parameters={"appeals": chunk})
+    
+    results = []
+    async for result in WorkScheduler(agents).stream(tasks()):
+        results.extend(expand_batch_result(result, batch_appeals.pop(result.task_id)))
+    return results
+
+
+def measure(label: str, dispatch, joined):
+    agents = [ProcessorAgent(f"processor_{i:03d}") for i in range(1, 6)]
+    tracemalloc.start()
+    start = time.perf_counter()
+    with patch("src.swarm_coordination.agents.asyncio.sleep", _no_latency):
+        results = asyncio.run(dispatch(joined, agents))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    count = len(results)
+    print(f"{label:<10} {elapsed:8.3f}s  {elapsed / count * 1e6:8.1f} us/appeal  peak {peak / 1e6:8.1f} MB")
+    return elapsed
+
+
+def main(counts=(10_000, 100_000)):
+    for count in counts:
+        print(f"Dispatching {count:,} appeals across 5 processors...")
+        properties, appeals = build_records(count)
+        index = PropertyIndex(properties)
+        joined = [index.join(appeal) for appeal in appeals]
+        
+        baseline = measure("per-appeal", per_appeal_dispatch, joined)
+        batched = measure("batched", batched_dispatch, joined)
+        print(f"Dispatch overhead reduced {baseline / max(batched, 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or (10_000, 100_000))
@@ -0,0 +1,94 @@
+"""
+Benchmark: dict round-trip vs by-reference record handoff between agents
+Measures allocations per record for the collector → analyzer → processor hops
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data_collection.models import PropertyRecord, AppealRecord
+from src.data_collection.property_index import PropertyIndex
+
+
+def build_records(count: int):
+    """Build validated property and appeal records, as the collector would"""
+    properties = [
+        PropertyRecord(
+            property_id=f"{i // 10000:02d}-{i // 100 % 100:03d}-{i % 100:02d}",
+            address=f"{100 + i % 9000} Main St, Scranton, PA",
+            assessed_value=100000 + i % 50000,
+            market_value=110000 + i % 40000,
+            owner_name="John Smith",
+            property_type="Residential"
+        )
+        for i in range(count)
+    ]
+    appeals = [
+        AppealRecord(
+            appeal_id=f"AP-2024-{i:06d}",
+            property_id=record.property_id,
+            appeal_date="2024-01-15",
+            status="Pending",
+            requested_value=int(record.assessed_value * 0.85),
+            reason="Overassessment"
+        )
+        for i, record in enumerate(properties)
+    ]
+    return properties, appeals
+
+
+def dict_handoff(properties, appeals):
+    """Baseline: dump in the collector, rebuild in the manager, dump again per hop"""
+    collected = {
+        "property_records": [record.model_dump() for record in properties],
+        "appeal_records": [record.model_dump() for record in appeals]
+    }
+    rebuilt_properties = [PropertyRecord(**record) for record in collected["property_records"]]
+    rebuilt_appeals = [AppealRecord(**record) for record in collected["appeal_records"]]
+    analysis = {
+        "property_records": [record.model_dump() for record in rebuilt_properties],
+        "appeal_records": [record.model_dump() for record in rebuilt_appeals]
+    }
+    index = PropertyIndex(rebuilt_properties)
+    joined = [index.join(appeal) for appeal in rebuilt_appeals]
+    return analysis, joined
+
+
+def reference_handoff(properties, appeals):
+    """Typed records passed by reference, joined through read-only views"""
+    analysis = {"property_records": properties, "appeal_records": appeals}
+    index = PropertyIndex(properties)
+    joined = [index.view(appeal) for appeal in appeals]
+    return analysis, joined
+
+
+def measure(label: str, handoff, properties, appeals):
+    tracemalloc.start()
+    start = time.perf_counter()
+    retained = handoff(properties, appeals)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del retained
+    
+    count = len(appeals)
+    print(f"{label:<12} {elapsed:8.3f}s  peak {peak / 1e6:8.1f} MB  "
+          f"{peak / count:8.0f} B/record  retained {current / count:8.0f} B/record")
+    return peak
+
+
+def main(count: int = 100_000):
+    print(f"Building {count:,} property + appeal records...")
+    properties, appeals = build_records(count)
+    
+    baseline = measure("dict", dict_handoff, properties, appeals)
+    reference = measure("reference", reference_handoff, properties, appeals)
+    print(f"Peak allocation reduced {baseline / max(reference, 1):.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
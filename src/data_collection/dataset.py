@@ -0,0 +1,244 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+from .models import PropertyRecord, AppealRecord, CollectionResult
+
+
+# Column kinds: "str" and "object" are object arrays, "int" is int64, "float" is float64
+# with NaN for missing values, and "category" is dictionary-encoded (see DictionaryColumn)
+PROPERTY_COLUMNS = {
+    "property_id": "str",
+    "address": "str",
+    "assessed_value": "int",
+    "market_value": "int",
+    "owner_name": "str",
+    "property_type": "category",
+    "last_updated": "object"
+}
+
+APPEAL_COLUMNS = {
+    "appeal_id": "str",
+    "property_id": "str",
+    "appeal_date": "str",
+    "status": "category",
+    "requested_value": "int",
+    "reason": "category",
+    "hearing_date": "str",
+    "resolution": "str",
+    "final_value": "float"
+}
+
+Column = Union[np.ndarray, "DictionaryColumn"]
+
+
+def street_of(address: str) -> str:
+    """Street part of an address: '123 Main St, Scranton, PA' -> 'Main St'"""
+    street = address.split(",", 1)[0].strip()
+    number, _, rest = street.partition(" ")
+    return rest if rest and number[:1].isdigit() else street
+
+
+class DictionaryColumn:
+    """Dictionary-encoded strings: small integer codes into a list of distinct values.
+    
+    A county roll has a handful of property types, statuses and reasons, so
+    each row costs one or two bytes instead of a pointer to a string.
+    Missing values have code -1.
+    """
+    
+    __slots__ = ("codes", "categories")
+    
+    def __init__(self, codes: np.ndarray, categories: List[str]):
+        self.codes = codes
+        self.categories = categories
+    
+    @classmethod
+    def encode(cls, values: Iterable[Optional[str]]) -> "DictionaryColumn":
+        codes, categories = pd.factorize(np.asarray(list(values), dtype=object))
+        if len(categories) < np.iinfo(np.int8).max:
+            dtype = np.int8
+        elif len(categories) < np.iinfo(np.int16).max:
+            dtype = np.int16
+        else:
+            dtype = np.int32
+        return cls(codes.astype(dtype), list(categories))
+    
+    def __len__(self) -> int:
+        return len(self.codes)
+    
+    def __getitem__(self, index: int) -> Optional[str]:
+        code = self.codes[index]
+        return self.categories[code] if code >= 0 else None
+    
+    def equals(self, value: str) -> np.ndarray:
+        """Boolean mask of rows holding value, compared on codes"""
+        if value not in self.categories:
+            return np.zeros(len(self.codes), dtype=bool)
+        return self.codes == self.categories.index(value)
+    
+    def value_counts(self) -> Dict[str, int]:
+        counts = np.bincount(self.codes[self.codes >= 0], minlength=len(self.categories))
+        return {category: int(count) for category, count in zip(self.categories, counts)}
+    
+    def to_categorical(self) -> pd.Categorical:
+        return pd.Categorical.from_codes(self.codes, categories=self.categories)
+    
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes
+
+
+def _build_column(values: List[Any], kind: str) -> Column:
+    if kind == "category":
+        return DictionaryColumn.encode(values)
+    if kind == "int":
+        return np.asarray(values, dtype=np.int64)
+    if kind == "float":
+        return np.asarray([np.nan if value is None else value for value in values], dtype=np.float64)
+    return np.asarray(values, dtype=object)
+
+
+class ColumnarTable:
+    """Fixed-schema table stored as one NumPy array (or DictionaryColumn) per field"""
+    
+    def __init__(self, columns: Dict[str, Column], schema: Dict[str, str]):
+        self.columns = columns
+        self.schema = schema
+    
+    @classmethod
+    def from_records(cls, records: Iterable[Any], schema: Dict[str, str]) -> "ColumnarTable":
+        """Build columns from typed records, compact rows or dicts"""
+        records = records if isinstance(records, list) else list(records)
+        if records and isinstance(records[0], dict):
+            values = {name: [record.get(name) for record in records] for name in schema}
+        else:
+            values = {name: [getattr(record, name) for record in records] for name in schema}
+        return cls({name: _build_column(values[name], kind) for name, kind in schema.items()}, schema)
+    
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+    
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+    
+    def row(self, index: int) -> Dict[str, Any]:
+        """One row as a plain dict, with missing floats read back as None"""
+        row = {}
+        for name, kind in self.schema.items():
+            value = self.columns[name][index]
+            if kind == "int":
+                value = int(value)
+            elif kind == "float":
+                value = None if np.isnan(value) else int(value)
+            row[name] = value
+        return row
+    
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        for index in range(len(self)):
+            yield self.row(index)
+    
+    def to_records(self, model: Type[BaseModel]) -> List[BaseModel]:
+        """Validate every row into a pydantic model at an export boundary"""
+        return [model(**row) for row in self.rows()]
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """DataFrame view with dictionary-encoded columns as pandas categoricals"""
+        return pd.DataFrame({
+            name: column.to_categorical() if isinstance(column, DictionaryColumn) else column
+            for name, column in self.columns.items()
+        })
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column buffers (object columns count their pointers only)"""
+        return sum(column.nbytes for column in self.columns.values())
+
+
+class RecordDataset:
+    """Columnar properties and appeals from one collection run.
+    
+    Aggregations over a full county roll run as NumPy operations over whole
+    columns instead of attribute reads per record object.
+    """
+    
+    def __init__(self, properties: ColumnarTable, appeals: ColumnarTable):
+        self.properties = properties
+        self.appeals = appeals
+        self._property_positions: Optional[np.ndarray] = None
+        if "street" not in properties.columns:
+            # Derived once here so group-bys by street never touch the address strings
+            properties.columns["street"] = DictionaryColumn.encode(
+                street_of(address) if address else None for address in properties["address"]
+            )
+    
+    @classmethod
+    def from_records(cls, property_records: Iterable[Any] = (), appeal_records: Iterable[Any] = ()) -> "RecordDataset":
+        return cls(
+            ColumnarTable.from_records(property_records, PROPERTY_COLUMNS),
+            ColumnarTable.from_records(appeal_records, APPEAL_COLUMNS)
+        )
+    
+    @classmethod
+    def from_collection(cls, result: CollectionResult) -> "RecordDataset":
+        return cls.from_records(result.property_records, result.appeal_records)
+    
+    def property_records(self) -> List[PropertyRecord]:
+        return self.properties.to_records(PropertyRecord)
+    
+    def appeal_records(self) -> List[AppealRecord]:
+        return self.appeals.to_records(AppealRecord)
+    
+    def property_positions(self) -> np.ndarray:
+        """Row of each appeal's property in the properties table, -1 where unmatched
+        
+        Like PropertyIndex, a property_id collected twice resolves to its last row.
+        Computed once and shared by the join, analysis and reporting.
+        """
+        if self._property_positions is None:
+            self._property_positions = self._join_positions()
+        return self._property_positions
+    
+    def _join_positions(self) -> np.ndarray:
+        if not len(self.properties):
+            return np.full(len(self.appeals), -1)
+        property_ids = pd.Index(self.properties["property_id"])
+        rows = np.arange(len(property_ids))
+        if not property_ids.is_unique:
+            keep = ~property_ids.duplicated(keep="last")
+            property_ids, rows = property_ids[keep], rows[keep]
+        positions = property_ids.get_indexer(self.appeals["property_id"])
+        return np.where(positions >= 0, rows[positions], -1)
+    
+    def joined_appeals(self) -> pd.DataFrame:
+        """Appeals joined to their property's values in one vectorized pass
+        
+        The block evaluate_appeal_block expects; unmatched appeals get NaN
+        property values.
+        """
+        positions = self.property_positions()
+        matched = positions >= 0
+        
+        def take(name: str) -> np.ndarray:
+            if not len(self.properties):
+                return np.full(len(positions), np.nan)
+            return np.where(matched, self.properties[name][np.where(matched, positions, 0)], np.nan)
+        
+        return pd.DataFrame({
+            "appeal_id": self.appeals["appeal_id"],
+            "property_id": self.appeals["property_id"],
+            "requested_value": self.appeals["requested_value"],
+            "reason": self.appeals["reason"].to_categorical(),
+            "assessed_value": take("assessed_value"),
+            "market_value": take("market_value")
+        })
+    
+    def average_requested_reduction(self) -> float:
+        """Mean of assessed minus requested value over appeals with a known property"""
+        joined = self.joined_appeals()
+        reductions = (joined["assessed_value"] - joined["requested_value"]).dropna()
+        return float(reductions.clip(lower=0).mean()) if len(reductions) else 0.0
+    
+    @property
+    def nbytes(self) -> int:
+        return self.properties.nbytes + self.appeals.nbytes
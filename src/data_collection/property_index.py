@@ -0,0 +1,86 @@
+from collections.abc import Mapping
+from typing import Dict, Any, Iterable, Iterator, Optional
+from .models import PropertyRecord, AppealRecord
+from .records import record_dict
+
+
+JOINED_PROPERTY_FIELDS = ("assessed_value", "market_value", "property_type", "address")
+
+
+class JoinedAppeal(Mapping):
+    """Read-only mapping view of an appeal joined to its property.
+    
+    Reads through to both records by reference, so joining allocates one
+    small object per appeal instead of a dumped and enriched dict.
+    """
+    
+    __slots__ = ("appeal", "property")
+    
+    def __init__(self, appeal: AppealRecord, property: Optional[PropertyRecord] = None):
+        self.appeal = appeal
+        self.property = property
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in JOINED_PROPERTY_FIELDS:
+            if self.property is None:
+                raise KeyError(key)
+            return getattr(self.property, key)
+        if key in AppealRecord.model_fields:
+            return getattr(self.appeal, key)
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        yield from AppealRecord.model_fields
+        if self.property is not None:
+            yield from JOINED_PROPERTY_FIELDS
+    
+    def __len__(self) -> int:
+        return len(AppealRecord.model_fields) + (len(JOINED_PROPERTY_FIELDS) if self.property is not None else 0)
+
+
+class PropertyIndex:
+    """Hash index of property records keyed by property_id.
+    
+    Built once per workflow so each appeal can be joined to its property in
+    O(1), keeping the join O(properties + appeals) instead of a scan per appeal.
+    """
+    
+    def __init__(self, records: Iterable[PropertyRecord] = ()):
+        self._records: Dict[str, PropertyRecord] = {}
+        self.unmatched_appeals = 0
+        for record in records:
+            self.add(record)
+    
+    def add(self, record: PropertyRecord):
+        """Index a property record, replacing any earlier record with the same ID"""
+        self._records[record.property_id] = record
+    
+    def get(self, property_id: str) -> Optional[PropertyRecord]:
+        """Look up a property record by ID"""
+        return self._records.get(property_id)
+    
+    def join(self, appeal: AppealRecord) -> Dict[str, Any]:
+        """Return the appeal as a dict enriched with its property's values"""
+        appeal_data = record_dict(appeal)
+        record = self._records.get(appeal.property_id)
+        
+        if record is None:
+            self.unmatched_appeals += 1
+            return appeal_data
+        
+        for field in JOINED_PROPERTY_FIELDS:
+            appeal_data[field] = getattr(record, field)
+        return appeal_data
+    
+    def view(self, appeal: AppealRecord) -> JoinedAppeal:
+        """Join without copying: return a read-through view of the appeal and its property"""
+        record = self._records.get(appeal.property_id)
+        if record is None:
+            self.unmatched_appeals += 1
+        return JoinedAppeal(appeal, record)
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def __contains__(self, property_id: str) -> bool:
+        return property_id in self._records
@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Union
+from .models import PropertyRecord, AppealRecord
+
+
+@dataclass(slots=True)
+class PropertyRow:
+    """Slotted, unvalidated counterpart of PropertyRecord for the swarm hot path.
+    
+    Built from an already validated PropertyRecord at ingestion and turned
+    back into one (validating again) only when it leaves the process.
+    """
+    
+    property_id: str
+    address: str
+    assessed_value: int
+    market_value: int
+    owner_name: str
+    property_type: str
+    last_updated: Optional[datetime] = None
+    
+    @classmethod
+    def from_record(cls, record: PropertyRecord) -> "PropertyRow":
+        return cls(**record.__dict__)
+    
+    def to_record(self) -> PropertyRecord:
+        """Validate back into a PropertyRecord at an export boundary"""
+        return PropertyRecord(**self.to_dict())
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass(slots=True)
+class AppealRow:
+    """Slotted, unvalidated counterpart of AppealRecord for the swarm hot path"""
+    
+    appeal_id: str
+    property_id: str
+    appeal_date: str
+    status: str
+    requested_value: int
+    reason: str
+    hearing_date: Optional[str] = None
+    resolution: Optional[str] = None
+    final_value: Optional[int] = None
+    
+    @classmethod
+    def from_record(cls, record: AppealRecord) -> "AppealRow":
+        return cls(**record.__dict__)
+    
+    def to_record(self) -> AppealRecord:
+        """Validate back into an AppealRecord at an export boundary"""
+        return AppealRecord(**self.to_dict())
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def compact_properties(records: Iterable[Union[PropertyRecord, PropertyRow]]) -> List[PropertyRow]:
+    """Convert validated property records to rows, leaving rows as they are"""
+    return [record if isinstance(record, PropertyRow) else PropertyRow.from_record(record) for record in records]
+
+
+def compact_appeals(records: Iterable[Union[AppealRecord, AppealRow]]) -> List[AppealRow]:
+    """Convert validated appeal records to rows, leaving rows as they are"""
+    return [record if isinstance(record, AppealRow) else AppealRow.from_record(record) for record in records]
+
+
+def record_dict(record: Union[PropertyRecord, AppealRecord, PropertyRow, AppealRow]) -> Dict[str, Any]:
+    """Plain dict of a record in either representation"""
+    if isinstance(record, (PropertyRow, AppealRow)):
+        return record.to_dict()
+    return record.model_dump()
+
+
+def export_record(record: Union[PropertyRecord, AppealRecord, PropertyRow, AppealRow]) -> Union[PropertyRecord, AppealRecord]:
+    """The pydantic model for a record about to be serialized, validating rows on the way out"""
+    if isinstance(record, (PropertyRow, AppealRow)):
+        return record.to_record()
+    return record
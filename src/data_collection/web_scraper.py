@@ -4,6 +4,7 @@ from typing import List, Dict, Any
 import pandas as pd
 from playwright.async_api import async_playwright, Page
 from .models import PropertyRecord, AppealRecord, CollectionResult
+from .dataset import ColumnarTable, RecordDataset, PROPERTY_COLUMNS
 
 
 class LackawannaDataCollector:
@@ -25,7 +26,7 @@ class LackawannaDataCollector:
         """Set up anti-detection measures for the browser"""
         if not self.page:
             return
-            
+        
         # Rotate user agent
         user_agent = random.choice(self.user_agents)
         await self.page.set_user_agent(user_agent)
@@ -76,15 +77,21 @@ class LackawannaDataCollector:
         else:
             return {}
     
+    async def _fetch_property_row(self, property_id: str) -> Dict[str, Any]:
+        endpoint = f"/property/{property_id}"
+        return await self._make_request(endpoint)
+    
+    async def _fetch_appeal_rows(self) -> List[Dict[str, Any]]:
+        return await self._make_request("/appeals")
+    
     async def fetch_property_data(self, property_id: str) -> PropertyRecord:
         """Fetch property data for a specific property ID"""
-        endpoint = f"/property/{property_id}"
-        data = await self._make_request(endpoint)
+        data = await self._fetch_property_row(property_id)
         return PropertyRecord(**data)
     
     async def fetch_appeals_data(self) -> List[AppealRecord]:
         """Fetch all appeals data"""
-        data = await self._make_request("/appeals")
+        data = await self._fetch_appeal_rows()
         return [AppealRecord(**appeal) for appeal in data]
     
     async def collect_batch(self, property_ids: List[str]) -> List[PropertyRecord]:
@@ -95,10 +102,19 @@ class LackawannaDataCollector:
             results.append(property_data)
         return results
     
+    async def collect_dataset(self, property_ids: List[str]) -> RecordDataset:
+        """Collect properties and appeals into a columnar dataset
+        
+        Columns are built from the fetched dicts, without a PropertyRecord
+        or AppealRecord per row; use to_records on the tables to validate.
+        """
+        property_rows = [await self._fetch_property_row(property_id) for property_id in property_ids]
+        appeal_rows = await self._fetch_appeal_rows()
+        return RecordDataset.from_records(property_rows, appeal_rows)
+    
     def to_dataframe(self, records: List[PropertyRecord]) -> pd.DataFrame:
         """Convert property records to pandas DataFrame"""
-        data = [record.model_dump() for record in records]
-        return pd.DataFrame(data)
+        return ColumnarTable.from_records(records, PROPERTY_COLUMNS).to_dataframe()
     
     async def __aenter__(self):
         """Async context manager entry"""
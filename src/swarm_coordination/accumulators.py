@@ -0,0 +1,261 @@
+import math
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+import numpy as np
+from ..data_collection.dataset import RecordDataset, street_of
+from ..data_collection.models import AppealRecord
+from ..data_collection.records import AppealRow
+
+
+class RunningMoments:
+    """Count, mean and variance by Welford's method, updated a batch at a time.
+    
+    Batches and other accumulators are combined with Chan et al.'s parallel
+    update, so the result does not depend on how the stream was split.
+    """
+    
+    __slots__ = ("count", "mean", "m2")
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+    
+    def update(self, values: np.ndarray):
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return
+        mean = float(values.mean())
+        self._combine(len(values), mean, float(((values - mean) ** 2).sum()))
+    
+    def merge(self, other: "RunningMoments"):
+        if other.count:
+            self._combine(other.count, other.mean, other.m2)
+    
+    def _combine(self, count: int, mean: float, m2: float):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+    
+    @property
+    def variance(self) -> float:
+        return self.m2 / self.count if self.count else 0.0
+    
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class QuantileDigest:
+    """Approximate quantiles from a merging t-digest with bounded centroids.
+    
+    Values are folded into at most ``compression / 2`` weighted centroids,
+    small near the tails and large near the median, so extreme quantiles
+    stay accurate while memory stays constant.
+    """
+    
+    def __init__(self, compression: float = 200.0):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.count = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def update(self, values: np.ndarray):
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._absorb(values, np.ones(len(values)))
+    
+    def merge(self, other: "QuantileDigest"):
+        if other.count:
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+            self._absorb(other.means, other.weights)
+    
+    def _absorb(self, means: np.ndarray, weights: np.ndarray):
+        means = np.concatenate([self.means, means])
+        weights = np.concatenate([self.weights, weights])
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        
+        # Centroids span at most one unit of the arcsine k-scale
+        total = weights.sum()
+        q_left = (np.cumsum(weights) - weights) / total
+        k = self.compression / (2 * math.pi) * np.arcsin(2 * q_left - 1)
+        buckets = np.floor(k + self.compression / 4).astype(np.int64)
+        
+        weight_sums = np.bincount(buckets, weights=weights)
+        mean_sums = np.bincount(buckets, weights=means * weights)
+        occupied = weight_sums > 0
+        self.means = mean_sums[occupied] / weight_sums[occupied]
+        self.weights = weight_sums[occupied]
+        self.count = float(total)
+    
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        centers = np.cumsum(self.weights) - self.weights / 2
+        return float(np.interp(
+            q * self.count,
+            np.concatenate([[0.0], centers, [self.count]]),
+            np.concatenate([[self.min], self.means, [self.max]])
+        ))
+
+
+class HeavyHitters:
+    """Most frequent values in bounded memory (mergeable Misra-Gries summary).
+    
+    Keeps at most ``capacity`` counters; each reported count is low by at
+    most total / (capacity + 1), so any value above that share is kept.
+    """
+    
+    def __init__(self, capacity: int = 32):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.total = 0
+    
+    def update(self, values: Iterable[Optional[str]]):
+        self.add_counts(Counter(value for value in values if value is not None))
+    
+    def merge(self, other: "HeavyHitters"):
+        self.add_counts(other.counts, other.total)
+    
+    def add_counts(self, counts: Dict[str, int], total: Optional[int] = None):
+        """Fold in pre-aggregated counts (total defaults to their sum)"""
+        for value, count in counts.items():
+            if count:
+                self.counts[value] = self.counts.get(value, 0) + int(count)
+        self.total += int(sum(counts.values()) if total is None else total)
+        
+        if len(self.counts) > self.capacity:
+            # Subtracting the (capacity + 1)-th largest count keeps merges within the error bound
+            cutoff = sorted(self.counts.values(), reverse=True)[self.capacity]
+            self.counts = {value: count - cutoff for value, count in self.counts.items() if count > cutoff}
+    
+    def top(self, n: int = 10) -> Dict[str, int]:
+        return dict(Counter(self.counts).most_common(n))
+
+
+class PatternAccumulator:
+    """Running pattern statistics for streaming analysis, in constant memory.
+    
+    Updated per record batch (or per columnar dataset) and mergeable, so
+    shards can each accumulate and combine their results. ``totals()``
+    has the same keys as PatternAnalyzerAgent.new_totals.
+    """
+    
+    def __init__(self, compression: float = 200.0, capacity: int = 32):
+        self.property_count = 0
+        self.appeal_count = 0
+        self.overassessment_count = 0
+        self.assessed_value = RunningMoments()
+        self.market_value = RunningMoments()
+        self.assessment_ratio = RunningMoments()
+        self.requested_reduction = RunningMoments()
+        self.assessed_quantiles = QuantileDigest(compression)
+        self.ratio_quantiles = QuantileDigest(compression)
+        self.reasons = HeavyHitters(capacity)
+        self.streets = HeavyHitters(capacity)
+    
+    def update_properties(self, assessed_value: np.ndarray, market_value: np.ndarray, streets: Iterable[Optional[str]]):
+        """Fold in a batch of properties as columns"""
+        assessed_value = np.asarray(assessed_value, dtype=np.float64)
+        market_value = np.asarray(market_value, dtype=np.float64)
+        ratio = assessed_value / np.maximum(market_value, 1)
+        
+        self.property_count += len(assessed_value)
+        self.assessed_value.update(assessed_value)
+        self.market_value.update(market_value)
+        self.assessment_ratio.update(ratio)
+        self.assessed_quantiles.update(assessed_value)
+        self.ratio_quantiles.update(ratio)
+        self.streets.update(streets)
+    
+    def update_appeals(self, reasons: Sequence[Optional[str]], requested_reduction: np.ndarray):
+        """Fold in a batch of appeals; requested_reduction covers only appeals with a known property"""
+        self.appeal_count += len(reasons)
+        self.overassessment_count += sum(1 for reason in reasons if reason == "Overassessment")
+        self.requested_reduction.update(requested_reduction)
+        self.reasons.update(reasons)
+    
+    def update(self, records: Sequence[Any], lookup: Optional[Callable[[str], Any]] = None):
+        """Fold in a mixed batch of typed property and appeal records
+        
+        lookup maps a property_id to its property record, if known, so
+        appeals can contribute their requested reduction.
+        """
+        appeals = [record for record in records if isinstance(record, (AppealRecord, AppealRow))]
+        properties = [record for record in records if not isinstance(record, (AppealRecord, AppealRow))]
+        
+        if properties:
+            self.update_properties(
+                np.fromiter((record.assessed_value for record in properties), dtype=np.float64, count=len(properties)),
+                np.fromiter((record.market_value for record in properties), dtype=np.float64, count=len(properties)),
+                [street_of(record.address) if record.address else None for record in properties]
+            )
+        if appeals:
+            reductions: List[float] = []
+            if lookup is not None:
+                for appeal in appeals:
+                    record = lookup(appeal.property_id)
+                    if record is not None:
+                        reductions.append(record.assessed_value - appeal.requested_value)
+            self.update_appeals([appeal.reason for appeal in appeals], np.asarray(reductions))
+    
+    def update_dataset(self, dataset: RecordDataset):
+        """Fold in a whole columnar dataset with vectorized updates"""
+        properties, appeals = dataset.properties, dataset.appeals
+        streets, reasons = properties["street"], appeals["reason"]
+        
+        self.update_properties(properties["assessed_value"], properties["market_value"], ())
+        self.streets.add_counts(streets.value_counts())
+        
+        positions = dataset.property_positions()
+        matched = positions >= 0
+        self.appeal_count += len(appeals)
+        self.overassessment_count += int(reasons.equals("Overassessment").sum())
+        self.requested_reduction.update(properties["assessed_value"][positions[matched]] - appeals["requested_value"][matched])
+        self.reasons.add_counts(reasons.value_counts())
+    
+    def merge(self, other: "PatternAccumulator"):
+        """Combine another accumulator, e.g. from another shard, into this one"""
+        self.property_count += other.property_count
+        self.appeal_count += other.appeal_count
+        self.overassessment_count += other.overassessment_count
+        for name in ("assessed_value", "market_value", "assessment_ratio", "requested_reduction",
+                     "assessed_quantiles", "ratio_quantiles", "reasons", "streets"):
+            getattr(self, name).merge(getattr(other, name))
+    
+    def totals(self) -> Dict[str, float]:
+        return {
+            "property_count": self.property_count,
+            "appeal_count": self.appeal_count,
+            "overassessment_count": self.overassessment_count,
+            "assessment_ratio_sum": self.assessment_ratio.mean * self.assessment_ratio.count,
+            "assessed_value_sum": self.assessed_value.mean * self.assessed_value.count,
+            "market_value_sum": self.market_value.mean * self.market_value.count
+        }
+    
+    def distributions(self, top: int = 10) -> Dict[str, Any]:
+        """Spread, quantiles and most frequent values seen so far"""
+        
+        def spread(moments: RunningMoments, digest: Optional[QuantileDigest] = None) -> Dict[str, Optional[float]]:
+            summary = {"mean": moments.mean, "std": moments.std}
+            if digest is not None:
+                summary.update({f"p{round(q * 100)}": digest.quantile(q) for q in (0.1, 0.5, 0.9, 0.99)})
+            return summary
+        
+        return {
+            "assessed_value": spread(self.assessed_value, self.assessed_quantiles),
+            "market_value": spread(self.market_value),
+            "assessment_ratio": spread(self.assessment_ratio, self.ratio_quantiles),
+            "requested_reduction": spread(self.requested_reduction),
+            "top_reasons": self.reasons.top(top),
+            "top_streets": self.streets.top(top)
+        }
@@ -1,10 +1,36 @@
 import asyncio
 import random
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
-from .models import WorkflowTask, TaskResult, TaskStatus, AgentStatus, ValidationResult
+from typing import Dict, Any, List, AsyncIterator, Awaitable, Optional, TypeVar, Union
+from datetime import datetime
+from .models import WorkflowTask, TaskResult, TaskStatus, AgentStatus, AgentInfo, ValidationResult
+from .batch_evaluation import SCORING_RULES_VERSION, evaluate_appeal_block, score_appeals
+from .executors import ExecutionBackend, InlineBackend
+from .result_cache import ResultCache, content_key
+from .pattern_analysis import analyze_dataset
+from .accumulators import PatternAccumulator
+import pandas as pd
 from ..data_collection.web_scraper import LackawannaDataCollector
 from ..data_collection.models import PropertyRecord, AppealRecord
+from ..data_collection.dataset import RecordDataset
+
+
+T = TypeVar("T")
+
+# Bump when the per-result validation rules change, invalidating cached scores
+# (the recommendation rules are versioned in batch_evaluation as SCORING_RULES_VERSION)
+VALIDATION_RULES_VERSION = "1"
+
+# Items a multi-item task works through between heartbeats, so long tasks are not taken for hung agents
+HEARTBEAT_EVERY = 25
+
+
+def _field(record: Any, name: str, default: Any) -> Any:
+    """Read a field from either a record dict or a typed record passed by reference"""
+    if isinstance(record, dict):
+        return record.get(name, default)
+    return getattr(record, name, default)
 
 
 class BaseAgent(ABC):
@@ -16,6 +42,80 @@ class BaseAgent(ABC):
         self.current_task = None
         self.tasks_completed = 0
         self.capabilities = []
+        self.backend: ExecutionBackend = InlineBackend()
+        self.cache: Optional[ResultCache] = None
+        self._task_started_at = None
+        self.lock = asyncio.Lock()
+        self.last_heartbeat = time.time()
+        self.timeout: Optional[float] = None
+        self.retries = 0
+        self.retry_backoff = 0.5
+    
+    async def run_task(self, task: WorkflowTask) -> TaskResult:
+        """Execute a task exclusively, so agents can be shared by concurrent workflows
+        
+        With a timeout set, an attempt that overruns is cancelled and retried
+        with exponential backoff; once retries are exhausted the task is
+        returned as FAILED instead of blocking the stage.
+        """
+        async with self.lock:
+            for attempt in range(self.retries + 1):
+                if attempt:
+                    await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+                try:
+                    if self.timeout is None:
+                        return await self.execute_task(task)
+                    return await asyncio.wait_for(self.execute_task(task), self.timeout)
+                except asyncio.TimeoutError:
+                    self._abandon_task(task)
+                except asyncio.CancelledError:
+                    # Abandoned, e.g. because another agent finished a stolen copy first
+                    self._abandon_task(task)
+                    raise
+            
+            return TaskResult(
+                task_id=task.task_id,
+                agent_id=self.agent_id,
+                status=TaskStatus.FAILED,
+                error_message=f"Timed out after {self.timeout}s ({self.retries + 1} attempts)"
+            )
+    
+    def set_timeout(self, timeout: Optional[float], retries: int = 0, retry_backoff: float = 0.5):
+        """Bound each task attempt to timeout seconds, retrying up to retries times"""
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+    
+    def _abandon_task(self, task: WorkflowTask):
+        if self.current_task == task.task_id:
+            self.status = AgentStatus.IDLE
+            self.current_task = None
+            self._task_started_at = None
+            self.heartbeat()
+    
+    def heartbeat(self):
+        """Signal liveness; long-running tasks call this to avoid being treated as stuck"""
+        self.last_heartbeat = time.time()
+    
+    def info(self) -> AgentInfo:
+        """Snapshot of this agent's state"""
+        return AgentInfo(
+            agent_id=self.agent_id,
+            agent_type=self.agent_type,
+            status=self.status,
+            current_task=self.current_task,
+            tasks_completed=self.tasks_completed,
+            last_heartbeat=datetime.utcfromtimestamp(self.last_heartbeat),
+            capabilities=self.capabilities
+        )
+    
+    def set_backend(self, backend: ExecutionBackend):
+        """Choose where this agent runs its CPU-bound work (inline or a process pool)"""
+        self.backend = backend
+    
+    def set_cache(self, cache: Optional[ResultCache]):
+        """Share a content-addressed result cache so unchanged inputs are not recomputed"""
+        self.cache = cache
     
     @abstractmethod
     async def execute_task(self, task: WorkflowTask) -> TaskResult:
@@ -26,18 +126,24 @@ class BaseAgent(ABC):
         """Mark task as started"""
         self.status = AgentStatus.BUSY
         self.current_task = task.task_id
+        self._task_started_at = time.perf_counter()
+        self.heartbeat()
     
     async def _complete_task(self, task: WorkflowTask, result: Dict[str, Any]) -> TaskResult:
         """Mark task as completed"""
+        execution_time = time.perf_counter() - self._task_started_at if self._task_started_at is not None else None
         self.status = AgentStatus.IDLE
         self.current_task = None
+        self._task_started_at = None
         self.tasks_completed += 1
+        self.heartbeat()
         
         return TaskResult(
             task_id=task.task_id,
             agent_id=self.agent_id,
             status=TaskStatus.COMPLETED,
-            result=result
+            result=result,
+            execution_time=execution_time
         )
 
 
@@ -46,19 +152,41 @@ class DataCollectorAgent(BaseAgent):
     def __init__(self, agent_id: str):
         super().__init__(agent_id, "data_collector")
         self.capabilities = ["web_scraping", "api_calls", "file_processing"]
+        self.request_timeout: Optional[float] = None
+    
+    def set_request_timeout(self, timeout: Optional[float]):
+        """Bound each scrape request; the collection task as a whole is bounded by set_timeout"""
+        self.request_timeout = timeout
     
     async def execute_task(self, task: WorkflowTask) -> TaskResult:
         await self._start_task(task)
         
         if task.task_type == "data_collection":
-            property_records = await self._scrape_property_data(task.parameters)
-            appeal_records = await self._scrape_appeal_data(task.parameters)
+            try:
+                property_records = await self._request(self._scrape_property_data(task.parameters))
+                appeal_records = await self._request(self._scrape_appeal_data(task.parameters))
+            except asyncio.TimeoutError:
+                self._abandon_task(task)
+                return TaskResult(
+                    task_id=task.task_id,
+                    agent_id=self.agent_id,
+                    status=TaskStatus.FAILED,
+                    error_message=f"Scrape request timed out after {self.request_timeout}s"
+                )
             
-            result = {
-                "property_records": [record.model_dump() for record in property_records],
-                "appeal_records": [record.model_dump() for record in appeal_records],
-                "collection_timestamp": "2024-07-14T10:00:00Z"
-            }
+            # Records are validated once here; by-reference handoff skips the dict round-trip
+            if task.parameters.get("handoff") == "reference":
+                result = {
+                    "property_records": property_records,
+                    "appeal_records": appeal_records,
+                    "collection_timestamp": "2024-07-14T10:00:00Z"
+                }
+            else:
+                result = {
+                    "property_records": [record.model_dump() for record in property_records],
+                    "appeal_records": [record.model_dump() for record in appeal_records],
+                    "collection_timestamp": "2024-07-14T10:00:00Z"
+                }
             
             return await self._complete_task(task, result)
         
@@ -69,6 +197,33 @@ class DataCollectorAgent(BaseAgent):
             error_message=f"Unknown task type: {task.task_type}"
         )
     
+    async def _request(self, scrape: Awaitable[T]) -> T:
+        """Await one scrape request within request_timeout"""
+        if self.request_timeout is None:
+            return await scrape
+        return await asyncio.wait_for(scrape, self.request_timeout)
+    
+    async def stream_records(self, task: WorkflowTask) -> AsyncIterator[Union[PropertyRecord, AppealRecord]]:
+        """Yield property records, then appeal records, as they are scraped"""
+        await self._start_task(task)
+        
+        property_count = 0
+        for record in await self._scrape_property_data(task.parameters):
+            property_count += 1
+            self.heartbeat()
+            yield record
+        
+        appeal_count = 0
+        for record in await self._scrape_appeal_data(task.parameters):
+            appeal_count += 1
+            self.heartbeat()
+            yield record
+        
+        await self._complete_task(task, {
+            "property_records": property_count,
+            "appeal_records": appeal_count
+        })
+    
     async def _scrape_property_data(self, parameters: Dict[str, Any]) -> List[PropertyRecord]:
         """Mock property data scraping"""
         await asyncio.sleep(0.1)  # Simulate scraping delay
@@ -109,12 +264,12 @@ class PatternAnalyzerAgent(BaseAgent):
         
         if task.task_type == "pattern_analysis":
             data = task.parameters.get("data", {})
-            patterns = await self._analyze_patterns(data)
-            statistics = await self._calculate_statistics(data)
+            analysis = await self._analyze(data)
             
             result = {
-                "patterns": patterns,
-                "statistics": statistics,
+                "patterns": self._patterns_from_totals(analysis["totals"]),
+                "statistics": self._statistics_from_totals(analysis["totals"]),
+                "groups": analysis["groups"],
                 "analysis_timestamp": "2024-07-14T10:00:00Z"
             }
             
@@ -127,53 +282,104 @@ class PatternAnalyzerAgent(BaseAgent):
             error_message=f"Unknown task type: {task.task_type}"
         )
     
-    async def _analyze_patterns(self, data: Dict[str, Any]) -> List[str]:
-        """Analyze patterns in the data"""
+    async def _analyze(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute totals (and, for a dataset, group-bys) in one pass that patterns and statistics share"""
         await asyncio.sleep(0.1)  # Simulate analysis time
+        self.heartbeat()
         
+        return await self.backend.run(compute_pattern_analysis, data)
+    
+    def summarize(self, accumulator: PatternAccumulator) -> Dict[str, Any]:
+        """Patterns, statistics and distributions from a streaming accumulator (see new_accumulator)"""
+        totals = accumulator.totals()
+        return {
+            "patterns": self._patterns_from_totals(totals),
+            "statistics": self._statistics_from_totals(totals),
+            "distributions": accumulator.distributions()
+        }
+    
+    @staticmethod
+    def new_accumulator() -> PatternAccumulator:
+        """Empty mergeable accumulator for incremental (streaming) analysis"""
+        return PatternAccumulator()
+    
+    @staticmethod
+    def new_totals() -> Dict[str, float]:
+        """Empty running totals for a one-shot reduction (see compute_pattern_totals)"""
+        return {
+            "property_count": 0,
+            "appeal_count": 0,
+            "overassessment_count": 0,
+            "assessment_ratio_sum": 0.0,
+            "assessed_value_sum": 0,
+            "market_value_sum": 0
+        }
+    
+    def _patterns_from_totals(self, totals: Dict[str, float]) -> List[str]:
+        """Derive pattern flags from running totals"""
         patterns = []
         
         # Analyze appeal patterns
-        appeal_records = data.get("appeal_records", [])
-        if appeal_records:
-            overassessment_count = sum(1 for appeal in appeal_records if appeal.get("reason") == "Overassessment")
-            if overassessment_count > len(appeal_records) * 0.5:
-                patterns.append("overassessment_trend")
+        appeal_count = totals["appeal_count"]
+        if appeal_count and totals["overassessment_count"] > appeal_count * 0.5:
+            patterns.append("overassessment_trend")
         
         # Analyze property value patterns
-        property_records = data.get("property_records", [])
-        if property_records:
-            avg_assessment_ratio = sum(
-                record.get("assessed_value", 0) / record.get("market_value", 1)
-                for record in property_records
-            ) / len(property_records)
-            
-            if avg_assessment_ratio > 0.9:
-                patterns.append("high_assessment_ratio")
+        property_count = totals["property_count"]
+        if property_count and totals["assessment_ratio_sum"] / property_count > 0.9:
+            patterns.append("high_assessment_ratio")
         
         return patterns
     
-    async def _calculate_statistics(self, data: Dict[str, Any]) -> Dict[str, float]:
-        """Calculate statistics from the data"""
-        await asyncio.sleep(0.1)  # Simulate calculation time
-        
-        property_records = data.get("property_records", [])
-        appeal_records = data.get("appeal_records", [])
+    def _statistics_from_totals(self, totals: Dict[str, float]) -> Dict[str, float]:
+        """Derive summary statistics from running totals"""
+        property_count = totals["property_count"]
+        appeal_count = totals["appeal_count"]
         
         return {
-            "total_properties": len(property_records),
-            "total_appeals": len(appeal_records),
-            "appeal_rate": len(appeal_records) / max(len(property_records), 1),
-            "avg_assessed_value": sum(record.get("assessed_value", 0) for record in property_records) / max(len(property_records), 1),
-            "avg_market_value": sum(record.get("market_value", 0) for record in property_records) / max(len(property_records), 1)
+            "total_properties": property_count,
+            "total_appeals": appeal_count,
+            "appeal_rate": appeal_count / max(property_count, 1),
+            "avg_assessed_value": totals["assessed_value_sum"] / max(property_count, 1),
+            "avg_market_value": totals["market_value_sum"] / max(property_count, 1)
         }
 
 
+def compute_pattern_analysis(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Totals and group-by statistics; group-bys need a columnar dataset"""
+    if "dataset" in data:
+        return analyze_dataset(data["dataset"])
+    return {"totals": compute_pattern_totals(data), "groups": {}}
+
+
+def compute_pattern_totals(data: Dict[str, Any]) -> Dict[str, float]:
+    """Reduce records to the running totals the patterns are derived from"""
+    if "dataset" in data:
+        return analyze_dataset(data["dataset"])["totals"]
+    
+    property_records = data.get("property_records", [])
+    appeal_records = data.get("appeal_records", [])
+    
+    totals = PatternAnalyzerAgent.new_totals()
+    totals["property_count"] = len(property_records)
+    totals["appeal_count"] = len(appeal_records)
+    totals["overassessment_count"] = sum(1 for appeal in appeal_records if _field(appeal, "reason", None) == "Overassessment")
+    
+    # One pass over the properties for all three sums
+    for record in property_records:
+        assessed_value = _field(record, "assessed_value", 0)
+        market_value = _field(record, "market_value", 0)
+        totals["assessment_ratio_sum"] += assessed_value / (market_value or 1)
+        totals["assessed_value_sum"] += assessed_value
+        totals["market_value_sum"] += market_value
+    return totals
+
+
 class ProcessorAgent(BaseAgent):
     
     def __init__(self, agent_id: str):
         super().__init__(agent_id, "processor")
-        self.capabilities = ["appeal_processing", "recommendation_generation", "value_assessment"]
+        self.capabilities = ["appeal_processing", "recommendation_generation", "value_assessment", "batch_evaluation", "batch_processing"]
     
     async def execute_task(self, task: WorkflowTask) -> TaskResult:
         await self._start_task(task)
@@ -190,6 +396,40 @@ class ProcessorAgent(BaseAgent):
                 "processed_timestamp": "2024-07-14T10:00:00Z"
             }
             
+            # Validator feedback: this is a targeted re-run of a flagged appeal
+            if "correction_round" in task.parameters:
+                result["correction_round"] = task.parameters["correction_round"]
+            
+            return await self._complete_task(task, result)
+        
+        elif task.task_type == "process_appeal_batch":
+            # Many appeals per task: one dispatch, one TaskResult and columnar outputs
+            appeals = task.parameters.get("appeals", [])
+            recommendations = await self._process_batch(appeals)
+            
+            result = {
+                "appeal_ids": [appeal.get("appeal_id") for appeal in appeals],
+                "recommendations": [recommendation["recommendation"] for recommendation in recommendations],
+                "confidence_scores": [recommendation["confidence_score"] for recommendation in recommendations],
+                "reasonings": [recommendation["reasoning"] for recommendation in recommendations],
+                "batch_size": len(appeals),
+                "processed_timestamp": "2024-07-14T10:00:00Z"
+            }
+            if "correction_round" in task.parameters:
+                result["correction_round"] = task.parameters["correction_round"]
+            
+            return await self._complete_task(task, result)
+        
+        elif task.task_type == "evaluate_appeal_block":
+            # Columnar block (DataFrame or mapping of arrays) scored in one vectorized pass
+            evaluations = await self._evaluate_block(task.parameters["appeals"])
+            
+            result = {
+                "evaluations": evaluations,
+                "evaluated_count": len(evaluations),
+                "processed_timestamp": "2024-07-14T10:00:00Z"
+            }
+            
             return await self._complete_task(task, result)
         
         return TaskResult(
@@ -200,37 +440,106 @@ class ProcessorAgent(BaseAgent):
         )
     
     async def _process_appeal(self, appeal_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process an individual appeal"""
+        """Process an individual appeal, reusing the cached recommendation if its inputs are unchanged"""
+        if self.cache is not None:
+            key = content_key("process_appeal", SCORING_RULES_VERSION, appeal_data)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
         await asyncio.sleep(0.1)  # Simulate processing time
         
-        assessed_value = appeal_data.get("assessed_value", 0)
-        market_value = appeal_data.get("market_value", assessed_value)
-        requested_value = appeal_data.get("requested_value", 0)
-        reason = appeal_data.get("reason", "")
+        recommendation = await self.backend.run(score_appeal, appeal_data)
+        if self.cache is not None:
+            self.cache.put(key, recommendation)
+        return recommendation
+    
+    async def _process_batch(self, appeals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Process a chunk of appeals in one round-trip, scoring uncached ones with the vectorized rules"""
+        recommendations: List[Optional[Dict[str, Any]]] = [None] * len(appeals)
+        keys = []
+        if self.cache is not None:
+            keys = [content_key("process_appeal", SCORING_RULES_VERSION, appeal) for appeal in appeals]
+            recommendations = [self.cache.get(key) for key in keys]
         
-        # Simple processing logic
-        assessment_ratio = assessed_value / max(market_value, 1)
-        reduction_requested = (assessed_value - requested_value) / max(assessed_value, 1)
+        misses = [i for i, recommendation in enumerate(recommendations) if recommendation is None]
+        if misses:
+            await asyncio.sleep(0.1)  # Simulate processing time, paid once per batch
+            for start in range(0, len(misses), HEARTBEAT_EVERY):
+                chunk = misses[start:start + HEARTBEAT_EVERY]
+                scored = await self.backend.run(score_appeals, [appeals[i] for i in chunk])
+                for i, recommendation in zip(chunk, scored):
+                    recommendations[i] = recommendation
+                    if self.cache is not None:
+                        self.cache.put(keys[i], recommendation)
+                self.heartbeat()
         
-        if reason == "Overassessment" and assessment_ratio > 0.9:
-            if reduction_requested <= 0.2:  # Up to 20% reduction
-                recommendation = "Approve reduction"
-                confidence_score = 0.85
-                reasoning = "Assessment appears inflated compared to market value"
-            else:
-                recommendation = "Partial reduction"
-                confidence_score = 0.65
-                reasoning = "Significant reduction requested, approve partial adjustment"
-        else:
-            recommendation = "Deny appeal"
-            confidence_score = 0.75
-            reasoning = "Assessment appears reasonable based on available data"
+        return recommendations
+    
+    async def _evaluate_block(self, appeals: Any) -> pd.DataFrame:
+        """Evaluate a columnar block, split into backend-sized chunks"""
+        if isinstance(appeals, RecordDataset):
+            appeals = appeals.joined_appeals()
+        frame = appeals if isinstance(appeals, pd.DataFrame) else pd.DataFrame(appeals)
+        size = self.backend.batch_size
+        if len(frame) <= size:
+            return await self.backend.run(evaluate_appeal_block, frame)
         
-        return {
-            "recommendation": recommendation,
-            "confidence_score": confidence_score,
-            "reasoning": reasoning
-        }
+        chunks = [frame.iloc[start:start + size] for start in range(0, len(frame), size)]
+        return pd.concat(await self.backend.map(evaluate_appeal_block, chunks, batch_size=1))
+
+
+def expand_batch_result(result: TaskResult, appeal_ids: List[str]) -> List[TaskResult]:
+    """Per-appeal views of a process_appeal_batch result, shaped like process_appeal results
+    
+    Built with model_construct and sharing the batch's timings, so there is
+    no per-appeal validation or timestamp. A failed batch fails every appeal
+    in it; appeal_ids are the IDs the batch was dispatched with.
+    """
+    if result.status != TaskStatus.COMPLETED:
+        return [
+            TaskResult.model_construct(
+                task_id=result.task_id,
+                agent_id=result.agent_id,
+                status=result.status,
+                result={},
+                execution_time=result.execution_time,
+                queue_wait=result.queue_wait,
+                error_message=result.error_message,
+                completed_at=result.completed_at
+            )
+            for _ in appeal_ids
+        ]
+    
+    batch = result.result
+    extra = {"correction_round": batch["correction_round"]} if "correction_round" in batch else {}
+    return [
+        TaskResult.model_construct(
+            task_id=result.task_id,
+            agent_id=result.agent_id,
+            status=result.status,
+            result={
+                "appeal_id": appeal_id,
+                "recommendation": recommendation,
+                "confidence_score": confidence_score,
+                "reasoning": reasoning,
+                "processed_timestamp": batch["processed_timestamp"],
+                **extra
+            },
+            execution_time=result.execution_time,
+            queue_wait=result.queue_wait,
+            error_message=None,
+            completed_at=result.completed_at
+        )
+        for appeal_id, recommendation, confidence_score, reasoning in zip(
+            batch["appeal_ids"], batch["recommendations"], batch["confidence_scores"], batch["reasonings"]
+        )
+    ]
+
+
+def score_appeal(appeal_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Recommendation for one joined appeal (pure, so it can run in a worker process)"""
+    return score_appeals([appeal_data])[0]
 
 
 class ValidatorAgent(BaseAgent):
@@ -244,7 +553,7 @@ class ValidatorAgent(BaseAgent):
         
         if task.task_type == "validation":
             results = task.parameters.get("results", [])
-            validation_result = await self._validate_results(results)
+            validation_result = await self._validate_results(results, task.parameters.get("flag_below"))
             
             result = {
                 "validation_result": validation_result.model_dump(),
@@ -261,30 +570,57 @@ class ValidatorAgent(BaseAgent):
             error_message=f"Unknown task type: {task.task_type}"
         )
     
-    async def _validate_results(self, results: List[Dict[str, Any]]) -> ValidationResult:
-        """Validate processing results"""
-        await asyncio.sleep(0.1)  # Simulate validation time
-        
+    async def _validate_results(self, results: List[Dict[str, Any]], flag_below: Optional[float] = None) -> ValidationResult:
+        """Validate processing results, flagging individual results below flag_below"""
         if not results:
+            await asyncio.sleep(0.1)  # Simulate validation time
             return ValidationResult(confidence=0.0, validated=False, validator_count=1)
         
         # Calculate average confidence of results
-        confidence_scores = [result.get("confidence_score", 0.0) for result in results]
+        confidence_scores = await self._score_results(results)
         average_confidence = sum(confidence_scores) / len(confidence_scores)
         
         # Validate based on confidence threshold
         validated = average_confidence >= 0.7
         
+        details = {
+            "results_count": len(results),
+            "average_confidence": average_confidence,
+            "validation_threshold": 0.7
+        }
+        
+        # Flag individual appeals for targeted re-processing
+        if flag_below is not None:
+            details["flagged_appeals"] = {
+                result.get("appeal_id"): score
+                for result, score in zip(results, confidence_scores)
+                if score < flag_below
+            }
+        
         return ValidationResult(
             confidence=average_confidence,
             validated=validated,
             validator_count=1,
-            details={
-                "results_count": len(results),
-                "average_confidence": average_confidence,
-                "validation_threshold": 0.7
-            }
+            details=details
         )
+    
+    async def _score_results(self, results: List[Dict[str, Any]]) -> List[float]:
+        """Per-result confidence scores, computing only those missing from the cache"""
+        if self.cache is None:
+            await asyncio.sleep(0.1)  # Simulate validation time
+            return [result.get("confidence_score", 0.0) for result in results]
+        
+        keys = [content_key("validate_result", VALIDATION_RULES_VERSION, result) for result in results]
+        scores = [self.cache.get(key) for key in keys]
+        misses = [i for i, score in enumerate(scores) if score is None]
+        if misses:
+            await asyncio.sleep(0.1)  # Simulate validation time
+            for n, i in enumerate(misses, 1):
+                scores[i] = results[i].get("confidence_score", 0.0)
+                self.cache.put(keys[i], scores[i])
+                if n % HEARTBEAT_EVERY == 0:
+                    self.heartbeat()
+        return scores
 
 
 class ReportGeneratorAgent(BaseAgent):
@@ -0,0 +1,67 @@
+import math
+from typing import Callable, List, Optional
+from .metrics import LatencyHistogram
+from .agents import BaseAgent
+
+
+class PoolAutoscaler:
+    """Sizes an agent pool from queue depth and per-task latency.
+    
+    Every ``interval`` seconds the scheduler asks for the desired number of
+    workers: enough to drain the current backlog (queued plus in-flight
+    tasks) within ``target_latency`` seconds at the median task run time,
+    clamped to [min_size, max_size]. Runs start at min_size, so small jobs
+    never wake idle agents; new agents come from ``factory`` once the pool
+    is exhausted and are trimmed again when the run finishes.
+    """
+    
+    def __init__(
+        self,
+        pool: List[BaseAgent],
+        factory: Callable[[], BaseAgent],
+        min_size: int = 1,
+        max_size: int = 8,
+        target_latency: float = 1.0,
+        interval: float = 0.25
+    ):
+        if not 1 <= min_size <= max_size:
+            raise ValueError("PoolAutoscaler requires 1 <= min_size <= max_size")
+        
+        self.pool = pool
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.interval = interval
+        self.run_times = LatencyHistogram()
+        self.peak_size = 0
+        self.resizes = 0
+        self.created: List[BaseAgent] = []
+    
+    def record(self, run_time: Optional[float]):
+        """Fold a completed task's run time into the latency estimate"""
+        if run_time is not None:
+            self.run_times.record(run_time)
+    
+    def desired_size(self, backlog: int, current: int) -> int:
+        """Workers needed to drain backlog tasks within target_latency"""
+        median = self.run_times.quantile(0.5)
+        if median is None:
+            return current  # No latency observed yet
+        wanted = math.ceil(backlog * median / self.target_latency)
+        return min(max(wanted, self.min_size), self.max_size)
+    
+    def acquire(self, in_use) -> BaseAgent:
+        """An agent not already running a worker, growing the pool if none is free"""
+        agent = next((agent for agent in self.pool if agent not in in_use), None)
+        if agent is None:
+            agent = self.factory()
+            self.pool.append(agent)
+            self.created.append(agent)
+        self.peak_size = max(self.peak_size, len(in_use) + 1)
+        return agent
+    
+    def trim(self):
+        """Drop the agents this run added once it has finished, keeping the original pool"""
+        self.pool[:] = [agent for agent in self.pool if agent not in self.created]
+        self.created.clear()
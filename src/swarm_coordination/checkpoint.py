@@ -0,0 +1,117 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+from .models import TaskResult, ValidationResult
+
+
+class WorkflowCheckpoint:
+    """Append-only record of workflow progress, used to resume after a crash.
+    
+    Processed results are buffered and flushed every ``interval`` results.
+    Validation progress is written as one line holding the newly validated
+    (or corrected) appeal IDs together with the cumulative consensus
+    snapshot covering them, so the two can never disagree. On load, later
+    lines win and a truncated final line (crash mid-write) is ignored.
+    """
+    
+    def __init__(self, path: str, interval: int = 100):
+        self.path = Path(path)
+        self.interval = interval
+        self.processed: Dict[str, TaskResult] = {}
+        self.validated: Set[str] = set()
+        self.corrected: Set[str] = set()
+        self.handed_off: Set[str] = set()
+        self.validation: Optional[ValidationResult] = None
+        self.completed = False
+        self._buffer: List[str] = []
+    
+    def load(self) -> "WorkflowCheckpoint":
+        """Read existing progress from disk"""
+        if not self.path.exists():
+            return self
+        
+        with open(self.path, 'r') as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                
+                if entry["type"] == "processed":
+                    self.processed[entry["appeal_id"]] = TaskResult(**entry["result"])
+                elif entry["type"] == "validation":
+                    self.validated.update(entry["appeal_ids"])
+                    self.corrected.update(entry.get("corrected_ids", []))
+                    self.validation = ValidationResult(**entry["result"])
+                elif entry["type"] == "handoff":
+                    self.handed_off.update(entry["appeal_ids"])
+                elif entry["type"] == "complete":
+                    self.completed = True
+        return self
+    
+    def reset(self):
+        """Discard any previous progress and start a fresh checkpoint"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text("")
+        self.processed.clear()
+        self.validated.clear()
+        self.corrected.clear()
+        self.handed_off.clear()
+        self.validation = None
+        self.completed = False
+        self._buffer.clear()
+    
+    def record_processed(self, appeal_id: str, result: TaskResult):
+        """Note a processed appeal, flushing to disk every interval results"""
+        self.processed[appeal_id] = result
+        self._buffer.append(json.dumps({
+            "type": "processed",
+            "appeal_id": appeal_id,
+            "result": result.model_dump(mode="json")
+        }))
+        if len(self._buffer) >= self.interval:
+            self.flush()
+    
+    def record_validation(
+        self,
+        appeal_ids: Iterable[str],
+        validation: ValidationResult,
+        corrected_ids: Iterable[str] = ()
+    ):
+        """Note newly validated or corrected appeals together with the consensus covering them"""
+        appeal_ids, corrected_ids = list(appeal_ids), list(corrected_ids)
+        self.validated.update(appeal_ids)
+        self.corrected.update(corrected_ids)
+        self.validation = validation
+        self._buffer.append(json.dumps({
+            "type": "validation",
+            "appeal_ids": appeal_ids,
+            "corrected_ids": corrected_ids,
+            "result": validation.model_dump(mode="json")
+        }))
+        self.flush(sync=True)
+    
+    def record_handoff(self, appeal_ids: Iterable[str]):
+        """Note appeals already queued for human review so a resume does not re-queue them"""
+        appeal_ids = list(appeal_ids)
+        self.handed_off.update(appeal_ids)
+        self._buffer.append(json.dumps({"type": "handoff", "appeal_ids": appeal_ids}))
+        self.flush(sync=True)
+    
+    def mark_complete(self):
+        """Note that the workflow finished; a resume then only re-assembles the report"""
+        self.completed = True
+        self._buffer.append(json.dumps({"type": "complete"}))
+        self.flush(sync=True)
+    
+    def flush(self, sync: bool = False):
+        """Write buffered progress; sync also forces it to stable storage"""
+        if not self._buffer:
+            return
+        with open(self.path, 'a') as file:
+            file.write("\n".join(self._buffer) + "\n")
+            file.flush()
+            if sync:
+                os.fsync(file.fileno())
+        self._buffer.clear()
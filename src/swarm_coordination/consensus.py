@@ -0,0 +1,217 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+from .models import WorkflowTask, TaskResult, TaskStatus, ValidationResult
+from .agents import ValidatorAgent
+
+
+class ConsensusAccumulator:
+    """Running consensus over validated shards, merged in O(1) per shard"""
+    
+    def __init__(self, threshold: float = 0.7):
+        self.threshold = threshold
+        self.validated_count = 0
+        self.confidence_sum = 0.0
+        self.cross_checked_count = 0
+        self.disagreement_sum = 0.0
+        self.validators_seen = set()
+        self.prior_validator_count = 0
+    
+    def merge(self, validator_id: str, confidence: float, count: int):
+        """Merge a validator's confidence over count primary (non-overlapping) results"""
+        self.validators_seen.add(validator_id)
+        self.validated_count += count
+        self.confidence_sum += confidence * count
+    
+    def retract(self, confidence_sum: float, count: int):
+        """Remove results that are about to be replaced by corrected ones
+        
+        Exact because validator confidence is the mean of per-result scores.
+        """
+        self.validated_count -= count
+        self.confidence_sum -= confidence_sum
+    
+    def merge_cross_check(self, primary_confidence: float, cross_confidence: float, count: int):
+        """Record how far two validators disagree over the same count results"""
+        self.cross_checked_count += count
+        self.disagreement_sum += abs(primary_confidence - cross_confidence) * count
+    
+    @property
+    def confidence(self) -> float:
+        return self.confidence_sum / self.validated_count if self.validated_count else 0.0
+    
+    @property
+    def agreement(self) -> Optional[float]:
+        if not self.cross_checked_count:
+            return None
+        return 1.0 - self.disagreement_sum / self.cross_checked_count
+    
+    @classmethod
+    def from_result(cls, result: ValidationResult) -> "ConsensusAccumulator":
+        """Rebuild running totals from a consensus snapshot so more shards can be merged"""
+        accumulator = cls(result.details.get("validation_threshold", 0.7))
+        accumulator.validated_count = result.details.get("results_count", 0)
+        accumulator.confidence_sum = result.confidence * accumulator.validated_count
+        accumulator.cross_checked_count = result.details.get("cross_checked_count", 0)
+        if accumulator.cross_checked_count and result.consensus_score is not None:
+            accumulator.disagreement_sum = (1.0 - result.consensus_score) * accumulator.cross_checked_count
+        accumulator.prior_validator_count = result.validator_count
+        return accumulator
+    
+    def merge_snapshot(self, result: ValidationResult):
+        """Fold in a consensus snapshot computed elsewhere, e.g. by a shard worker"""
+        other = ConsensusAccumulator.from_result(result)
+        self.validated_count += other.validated_count
+        self.confidence_sum += other.confidence_sum
+        self.cross_checked_count += other.cross_checked_count
+        self.disagreement_sum += other.disagreement_sum
+        self.prior_validator_count += other.prior_validator_count
+    
+    def result(self) -> ValidationResult:
+        """Snapshot of the consensus so far"""
+        confidence = self.confidence
+        agreement = self.agreement
+        return ValidationResult(
+            confidence=confidence,
+            validated=confidence >= self.threshold,
+            consensus_score=confidence if agreement is None else agreement,
+            validator_count=max(len(self.validators_seen), self.prior_validator_count, 1),
+            details={
+                "results_count": self.validated_count,
+                "cross_checked_count": self.cross_checked_count,
+                "average_confidence": confidence,
+                "validation_threshold": self.threshold
+            }
+        )
+
+
+class ConsensusEngine:
+    """Sharded validation: each result is validated once, plus a sampled overlap.
+    
+    Results are split into one shard per validator. A stride sample of
+    ``overlap`` of each shard is also validated by the next validator as a
+    cross-check, so total work is (1 + overlap) x results rather than
+    results x validators. Shard outcomes are merged as they complete.
+    """
+    
+    def __init__(
+        self,
+        validators: List[ValidatorAgent],
+        overlap: float = 0.0,
+        threshold: float = 0.7,
+        flag_below: Optional[float] = None,
+        accumulator: Optional[ConsensusAccumulator] = None
+    ):
+        if not validators:
+            raise ValueError("ConsensusEngine requires at least one validator")
+        if not 0.0 <= overlap <= 1.0:
+            raise ValueError("overlap must be between 0.0 and 1.0")
+        
+        self.validators = validators
+        self.overlap = overlap
+        self.accumulator = accumulator or ConsensusAccumulator(threshold)
+        self.flag_below = flag_below
+        self.flagged: Dict[str, float] = {}
+        self.disputed: Dict[str, float] = {}
+        self.tasks_issued = 0
+    
+    async def validate(self, results: List[Dict[str, Any]]) -> List[TaskResult]:
+        """Validate a batch of processing results and merge it into the running consensus"""
+        shard_count = min(len(self.validators), len(results))
+        if shard_count == 0:
+            return []
+        
+        shard_size = -(-len(results) // shard_count)
+        shards = [results[i * shard_size:(i + 1) * shard_size] for i in range(shard_count)]
+        
+        # validator i validates shard i; if cross-checking, it also re-validates shard i - 1's sample
+        plans = [[] for _ in range(shard_count)]
+        for i, shard in enumerate(shards):
+            sample, remainder = self._split_sample(shard)
+            if sample and shard_count > 1:
+                plans[i].append(("sample", i, sample))
+                plans[(i + 1) % shard_count].append(("cross_check", i, sample))
+            else:
+                remainder = shard
+            if remainder:
+                plans[i].append(("primary", i, remainder))
+        
+        sample_confidence: Dict[int, float] = {}
+        cross_confidence: Dict[int, float] = {}
+        sample_flags: Dict[int, Dict[str, float]] = {}
+        cross_flags: Dict[int, Dict[str, float]] = {}
+        task_results: List[TaskResult] = []
+        
+        async def run_plan(validator: ValidatorAgent, plan):
+            for kind, shard_index, items in plan:
+                parameters = {"results": items}
+                if self.flag_below is not None:
+                    parameters["flag_below"] = self.flag_below
+                
+                task = WorkflowTask(
+                    task_id=f"T004_validation_{self.tasks_issued:03d}",
+                    task_type="validation",
+                    parameters=parameters
+                )
+                self.tasks_issued += 1
+                result = await validator.run_task(task)
+                task_results.append(result)
+                if result.status == TaskStatus.FAILED:
+                    continue  # Timed out: this part of the shard stays unvalidated
+                
+                validation = result.result['validation_result']
+                confidence = validation['confidence']
+                flags = validation['details'].get("flagged_appeals", {})
+                if kind == "cross_check":
+                    cross_confidence[shard_index] = confidence
+                    cross_flags[shard_index] = flags
+                else:
+                    self.flagged.update(flags)
+                    self.accumulator.merge(validator.agent_id, confidence, len(items))
+                    if kind == "sample":
+                        sample_confidence[shard_index] = confidence
+                        sample_flags[shard_index] = flags
+                
+                if shard_index in sample_confidence and shard_index in cross_confidence:
+                    self.accumulator.merge_cross_check(
+                        sample_confidence.pop(shard_index),
+                        cross_confidence.pop(shard_index),
+                        len(items)
+                    )
+                    # Appeals the two validators flag differently are disputed
+                    primary, cross = sample_flags.pop(shard_index), cross_flags.pop(shard_index)
+                    for appeal_id in primary.keys() ^ cross.keys():
+                        self.disputed[appeal_id] = primary.get(appeal_id, cross.get(appeal_id))
+        
+        await asyncio.gather(*(
+            run_plan(validator, plan)
+            for validator, plan in zip(self.validators, plans)
+            if plan
+        ))
+        
+        return task_results
+    
+    def retract(self, appeal_ids: List[str]) -> Dict[str, float]:
+        """Withdraw flagged results ahead of re-validating their corrections"""
+        retracted = {appeal_id: self.flagged.pop(appeal_id) for appeal_id in appeal_ids if appeal_id in self.flagged}
+        for appeal_id in appeal_ids:
+            self.disputed.pop(appeal_id, None)
+        self.accumulator.retract(sum(retracted.values()), len(retracted))
+        return retracted
+    
+    def _split_sample(self, shard: List[Dict[str, Any]]):
+        """Split a shard into an evenly spaced cross-check sample and the remainder"""
+        if self.overlap <= 0.0 or not shard:
+            return [], shard
+        stride = max(1, round(1 / self.overlap))
+        sample = shard[::stride]
+        remainder = [item for i, item in enumerate(shard) if i % stride]
+        return sample, remainder
+    
+    def result(self) -> ValidationResult:
+        """Consensus across everything validated so far, including outstanding flags"""
+        result = self.accumulator.result()
+        if self.flag_below is not None:
+            result.details["flag_threshold"] = self.flag_below
+            result.details["flagged_appeals"] = dict(self.flagged)
+            result.details["disputed_appeals"] = dict(self.disputed)
+        return result
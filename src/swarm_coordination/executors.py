@@ -0,0 +1,89 @@
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence
+
+
+class ExecutionBackend(ABC):
+    """Where an agent runs its CPU-bound work.
+    
+    Functions handed to a backend must be module-level and their arguments
+    picklable, so the same agent code runs inline or in worker processes.
+    """
+    
+    def __init__(self, batch_size: int = 1000):
+        self.batch_size = batch_size
+    
+    @abstractmethod
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run fn(*args) and return its result"""
+        pass
+    
+    @abstractmethod
+    async def map(self, fn: Callable[[Any], Any], items: Sequence[Any], batch_size: Optional[int] = None) -> List[Any]:
+        """Apply fn to every item, submitting work in batches, preserving order"""
+        pass
+    
+    def shutdown(self):
+        """Release any worker resources"""
+        pass
+
+
+class InlineBackend(ExecutionBackend):
+    """Run work directly on the event loop thread (the default)"""
+    
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        return fn(*args)
+    
+    async def map(self, fn: Callable[[Any], Any], items: Sequence[Any], batch_size: Optional[int] = None) -> List[Any]:
+        return [fn(item) for item in items]
+
+
+def _apply_batch(fn: Callable[[Any], Any], items: Sequence[Any]) -> List[Any]:
+    return [fn(item) for item in items]
+
+
+class ProcessPoolBackend(ExecutionBackend):
+    """Run work in a ProcessPoolExecutor so CPU-bound agents use every core
+    
+    map() ships items in batches of batch_size so inter-process overhead is
+    paid per batch rather than per item. The pool starts on first use.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, batch_size: int = 1000):
+        super().__init__(batch_size)
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+    
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+    
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, fn, *args)
+    
+    async def map(self, fn: Callable[[Any], Any], items: Sequence[Any], batch_size: Optional[int] = None) -> List[Any]:
+        loop = asyncio.get_running_loop()
+        size = batch_size or self.batch_size
+        batches = await asyncio.gather(*(
+            loop.run_in_executor(self.executor, _apply_batch, fn, items[start:start + size])
+            for start in range(0, len(items), size)
+        ))
+        return [result for batch in batches for result in batch]
+    
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def create_backend(name: str, max_workers: Optional[int] = None, batch_size: int = 1000) -> ExecutionBackend:
+    """Build an execution backend by name ("inline" or "process")"""
+    if name == "inline":
+        return InlineBackend(batch_size)
+    if name == "process":
+        return ProcessPoolBackend(max_workers, batch_size)
+    raise ValueError(f"Unknown execution backend: {name}")
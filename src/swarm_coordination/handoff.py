@@ -0,0 +1,119 @@
+import heapq
+import itertools
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from .models import HandoffCase
+
+
+# Cases without a hearing date sort after every scheduled one
+_NO_HEARING = "9999-12-31"
+
+
+class HumanHandoffQueue:
+    """Priority queue of high-uncertainty appeals awaiting human review.
+    
+    Cases are ordered by dollar value at stake (largest first), then by
+    earliest hearing date. Pushes are O(log n) and never block the
+    automated path. With a path, every push and pop is appended to a
+    JSON Lines journal that is replayed on open, so the queue survives
+    restarts.
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self._heap: List[Tuple[int, str, int, str]] = []
+        self._cases: Dict[str, HandoffCase] = {}
+        self._entry_ids: Dict[str, int] = {}
+        self._counter = itertools.count()
+        
+        if self.path and self.path.exists():
+            self._replay()
+    
+    def push(self, case: HandoffCase):
+        """Queue a case for review, replacing any earlier entry for the same appeal"""
+        self._insert(case)
+        self._journal({"op": "push", "case": case.model_dump(mode="json")})
+    
+    def pop(self) -> Optional[HandoffCase]:
+        """Claim the highest-priority case, or None if the queue is empty"""
+        case = self._take()
+        if case is not None:
+            self._journal({"op": "pop", "appeal_id": case.appeal_id})
+        return case
+    
+    def peek(self) -> Optional[HandoffCase]:
+        """Highest-priority case without claiming it"""
+        self._discard_stale()
+        if not self._heap:
+            return None
+        return self._cases[self._heap[0][3]]
+    
+    def pending(self) -> List[HandoffCase]:
+        """All queued cases in review order"""
+        return sorted(self._cases.values(), key=self._sort_key)
+    
+    def compact(self):
+        """Rewrite the journal to hold only the cases still queued"""
+        if not self.path:
+            return
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, 'w') as file:
+            for case in self.pending():
+                file.write(json.dumps({"op": "push", "case": case.model_dump(mode="json")}) + "\n")
+        tmp_path.replace(self.path)
+    
+    def __len__(self) -> int:
+        return len(self._cases)
+    
+    def __contains__(self, appeal_id: str) -> bool:
+        return appeal_id in self._cases
+    
+    @staticmethod
+    def _sort_key(case: HandoffCase) -> Tuple[int, str]:
+        return -case.dollar_at_stake, case.hearing_date or _NO_HEARING
+    
+    def _insert(self, case: HandoffCase):
+        entry_id = next(self._counter)
+        self._cases[case.appeal_id] = case
+        self._entry_ids[case.appeal_id] = entry_id
+        heapq.heappush(self._heap, (*self._sort_key(case), entry_id, case.appeal_id))
+    
+    def _take(self) -> Optional[HandoffCase]:
+        self._discard_stale()
+        if not self._heap:
+            return None
+        *_, appeal_id = heapq.heappop(self._heap)
+        del self._entry_ids[appeal_id]
+        return self._cases.pop(appeal_id)
+    
+    def _discard_stale(self):
+        """Drop heap entries superseded by a re-push or removed by a pop (lazy deletion)"""
+        while self._heap:
+            _, _, entry_id, appeal_id = self._heap[0]
+            if self._entry_ids.get(appeal_id) == entry_id:
+                return
+            heapq.heappop(self._heap)
+    
+    def _remove(self, appeal_id: str):
+        if appeal_id in self._cases:
+            del self._cases[appeal_id]
+            del self._entry_ids[appeal_id]
+    
+    def _journal(self, entry: Dict):
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a') as file:
+            file.write(json.dumps(entry) + "\n")
+    
+    def _replay(self):
+        with open(self.path, 'r') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if entry["op"] == "push":
+                    self._insert(HandoffCase(**entry["case"]))
+                elif entry["op"] == "pop":
+                    self._remove(entry["appeal_id"])
@@ -0,0 +1,121 @@
+import json
+import os
+import tempfile
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from .models import TaskResult, TaskStatus
+
+
+class TaskLedger:
+    """Completed-task audit trail with a bounded in-memory window.
+    
+    The most recent results stay in ``window`` (a plain list, so callers can
+    keep using it as one). Once it exceeds ``window_size``, the oldest half
+    is appended to a JSON Lines spill file and dropped from memory.
+    Aggregate counters are always kept in memory, and query() reads the
+    spill file and the window together, so the full trail stays queryable.
+    Without a spill_path, a temporary file is created on first spill and
+    deleted by close(). Entries are tagged with the ledger's id, so several
+    ledgers can share one file.
+    """
+    
+    def __init__(self, window_size: Optional[int] = None, spill_path: Optional[str] = None):
+        if window_size is not None and window_size < 2:
+            raise ValueError("window_size must be at least 2")
+        
+        self.ledger_id = uuid.uuid4().hex
+        self.window_size = window_size
+        self.spill_path = Path(spill_path) if spill_path else None
+        self._owns_spill_file = False
+        self.window: List[TaskResult] = []
+        self._window_stages: List[str] = []
+        
+        self.total = 0
+        self.spilled = 0
+        self.status_counts: Counter = Counter()
+        self.stage_counts: Counter = Counter()
+    
+    def record(self, stage: str, results: List[TaskResult]):
+        """Append completed results for a workflow stage"""
+        for result in results:
+            self.window.append(result)
+            self._window_stages.append(stage)
+            self.total += 1
+            self.status_counts[result.status.value] += 1
+            self.stage_counts[stage] += 1
+        
+        if self.window_size is not None and len(self.window) > self.window_size:
+            self._spill(len(self.window) - self.window_size // 2)
+    
+    def query(
+        self,
+        stage: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        agent_id: Optional[str] = None,
+        task_id: Optional[str] = None
+    ) -> Iterator[TaskResult]:
+        """Iterate over every recorded result, oldest first, matching the given filters"""
+        def matches(result_stage: str, result: TaskResult) -> bool:
+            return (
+                (stage is None or result_stage == stage)
+                and (status is None or result.status == status)
+                and (agent_id is None or result.agent_id == agent_id)
+                and (task_id is None or result.task_id == task_id)
+            )
+        
+        if self.spilled and self.spill_path is not None:
+            with open(self.spill_path, 'r') as file:
+                for line in file:
+                    entry = json.loads(line)
+                    if entry.pop("ledger") != self.ledger_id:
+                        continue
+                    result_stage = entry.pop("stage")
+                    result = TaskResult(**entry)
+                    if matches(result_stage, result):
+                        yield result
+        
+        for result_stage, result in zip(list(self._window_stages), list(self.window)):
+            if matches(result_stage, result):
+                yield result
+    
+    def summary(self) -> Dict[str, Any]:
+        """In-memory aggregate counters"""
+        completed = self.status_counts[TaskStatus.COMPLETED.value]
+        return {
+            "total": self.total,
+            "in_memory": len(self.window),
+            "spilled": self.spilled,
+            "by_status": dict(self.status_counts),
+            "by_stage": dict(self.stage_counts),
+            "success_rate": completed / self.total if self.total else 0.0
+        }
+    
+    def close(self):
+        """Delete the temporary spill file, if this ledger created one; spilled entries are no longer queryable"""
+        if self._owns_spill_file and self.spill_path is not None:
+            self.spill_path.unlink(missing_ok=True)
+            self.spill_path = None
+            self._owns_spill_file = False
+    
+    def __len__(self) -> int:
+        return self.total
+    
+    def _spill(self, count: int):
+        """Move the oldest count results to the append-only spill file"""
+        if self.spill_path is None:
+            fd, path = tempfile.mkstemp(prefix="swarm_ledger_", suffix=".jsonl")
+            os.close(fd)
+            self.spill_path = Path(path)
+            self._owns_spill_file = True
+        
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.spill_path, 'a') as file:
+            for result_stage, result in zip(self._window_stages[:count], self.window[:count]):
+                file.write(json.dumps({"ledger": self.ledger_id, "stage": result_stage, **result.model_dump(mode="json")}) + "\n")
+        
+        # Trim in place so references to the window list stay valid
+        del self.window[:count]
+        del self._window_stages[:count]
+        self.spilled += count
@@ -0,0 +1,85 @@
+import math
+from typing import Dict, Iterable, Optional
+from .models import TaskResult
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with constant memory.
+    
+    Buckets grow geometrically by ``growth`` from ``min_value`` seconds, so
+    reported quantiles are within one bucket (about 5% by default) of the
+    true value no matter how many samples are recorded.
+    """
+    
+    def __init__(self, min_value: float = 1e-6, growth: float = 1.05):
+        self.min_value = min_value
+        self.growth = growth
+        self._log_growth = math.log(growth)
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def record(self, value: float):
+        """Add one sample, in seconds"""
+        index = 0 if value <= self.min_value else int(math.log(value / self.min_value) / self._log_growth) + 1
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th quantile"""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self.min_value * self.growth ** index, self.max)
+        return self.max
+    
+    def summary(self) -> Dict[str, Optional[float]]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": self.max if self.count else None
+        }
+
+
+class TaskTimings:
+    """Run-time and queue-wait histograms per agent and per workflow stage"""
+    
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self.agents: Dict[str, Dict[str, LatencyHistogram]] = {}
+    
+    def record(self, stage: str, results: Iterable[TaskResult]):
+        """Fold the timings of completed tasks into the stage and agent histograms"""
+        for result in results:
+            for group in (self._histograms(self.stages, stage), self._histograms(self.agents, result.agent_id)):
+                if result.execution_time is not None:
+                    group["run"].record(result.execution_time)
+                if result.queue_wait is not None:
+                    group["wait"].record(result.queue_wait)
+    
+    def report(self) -> Dict[str, Dict[str, Dict[str, Dict[str, Optional[float]]]]]:
+        """p50/p95/p99 summaries, keyed by stage and by agent"""
+        return {
+            "stages": {name: self._summarize(group) for name, group in self.stages.items()},
+            "agents": {name: self._summarize(group) for name, group in self.agents.items()}
+        }
+    
+    @staticmethod
+    def _histograms(groups: Dict[str, Dict[str, LatencyHistogram]], key: str) -> Dict[str, LatencyHistogram]:
+        if key not in groups:
+            groups[key] = {"run": LatencyHistogram(), "wait": LatencyHistogram()}
+        return groups[key]
+    
+    @staticmethod
+    def _summarize(group: Dict[str, LatencyHistogram]) -> Dict[str, Dict[str, Optional[float]]]:
+        return {kind: histogram.summary() for kind, histogram in group.items()}
@@ -24,7 +24,43 @@ class SwarmConfig(BaseModel):
     coordination_protocol: str = Field(default="consensus", description="Coordination protocol")
     processor_agents: int = Field(default=8, description="Number of processor agents")
     validator_agents: int = Field(default=3, description="Number of validator agents")
-    request_timeout: int = Field(default=30, description="Request timeout in seconds")
+    request_timeout: int = Field(default=30, description="Request timeout in seconds: per processor/validator task and per scrape request")
+    stage_timeout: Optional[float] = Field(default=None, description="Timeout in seconds for the whole collection, analysis and reporting tasks (None leaves them unbounded)")
+    task_retries: int = Field(default=0, description="Retries for a task attempt that exceeds request_timeout")
+    retry_backoff: float = Field(default=0.5, description="Seconds before the first retry, doubling for each further retry")
+    queue_size: int = Field(default=100, description="Maximum number of tasks buffered ahead of the processor swarm")
+    max_in_flight: Optional[int] = Field(default=None, description="Maximum concurrently executing processor tasks (defaults to processor_agents)")
+    analysis_batch_size: int = Field(default=500, description="Records folded into the streaming analysis accumulators at a time")
+    columnar_dataset: bool = Field(default=True, description="Build a columnar RecordDataset after collection for pattern analysis and reporting")
+    compact_records: bool = Field(default=True, description="Carry collected records through the swarm as slotted rows, validating only at collection and export")
+    process_batch_size: int = Field(default=100, description="Appeals per processing task (1 dispatches one task per appeal)")
+    zero_copy_handoff: bool = Field(default=True, description="Pass typed records between agents by reference instead of dumping to dicts")
+    validation_overlap: float = Field(default=0.1, description="Fraction of each validator shard re-validated by a second validator")
+    correction_threshold: Optional[float] = Field(default=0.7, description="Appeals validated below this confidence are re-queued to processors (None disables)")
+    max_correction_rounds: int = Field(default=2, description="Maximum validator → processor correction rounds")
+    execution_backend: str = Field(default="inline", description="Where processor and analyzer agents run CPU work: inline or process")
+    backend_workers: Optional[int] = Field(default=None, description="Worker processes for the process backend (defaults to CPU count)")
+    backend_batch_size: int = Field(default=1000, description="Items per submission when the backend maps over a batch")
+    ledger_window: Optional[int] = Field(default=10000, description="Completed task results kept in memory before spilling (None keeps all)")
+    ledger_path: Optional[str] = Field(default=None, description="JSON Lines file receiving spilled task results (temporary file if unset)")
+    handoff_path: Optional[str] = Field(default=None, description="JSON Lines file backing the human handoff queue (None keeps it in memory)")
+    validation_window: int = Field(default=100, description="Results per validation task in streaming mode")
+    checkpoint_path: Optional[str] = Field(default=None, description="JSON Lines file recording workflow progress for resume (None disables checkpointing)")
+    checkpoint_interval: int = Field(default=100, description="Processed appeals buffered between checkpoint writes")
+    result_cache: bool = Field(default=False, description="Reuse processor and validator outputs for appeals whose inputs are unchanged")
+    cache_path: Optional[str] = Field(default=None, description="SQLite file backing the result cache (in memory if unset)")
+    cache_max_entries: Optional[int] = Field(default=100000, description="Result cache entries kept before evicting the least recently used")
+    cache_max_bytes: Optional[int] = Field(default=None, description="Result cache size budget in bytes of stored values (None for no limit)")
+    shard_workers: List[str] = Field(default_factory=list, description="host:port addresses of shard workers; when set, processing and validation run sharded by property_id")
+    shard_count: Optional[int] = Field(default=None, description="Number of property_id hash shards (defaults to one per shard worker)")
+    work_stealing: bool = Field(default=True, description="Let idle processors take over tasks from straggling ones at the end of the queue")
+    straggler_factor: float = Field(default=3.0, description="A busy agent silent for this multiple of the median task time is a straggler")
+    straggler_min_seconds: float = Field(default=1.0, description="Minimum heartbeat silence before a busy agent counts as a straggler")
+    autoscale: bool = Field(default=False, description="Grow and shrink the processor pool within max_agents from queue depth and task latency")
+    min_processor_agents: int = Field(default=1, description="Smallest processor pool when autoscaling")
+    autoscale_target_latency: float = Field(default=1.0, description="Seconds the autoscaler aims to drain the current backlog in")
+    autoscale_interval: float = Field(default=0.25, description="Seconds between autoscaling decisions")
+    state_endpoint: Optional[str] = Field(default=None, description="Serve live SwarmState JSON on host:port or unix:/path (None disables)")
 
 
 class WorkflowTask(BaseModel):
@@ -42,6 +78,7 @@ class TaskResult(BaseModel):
     status: TaskStatus = Field(..., description="Task completion status")
     result: Dict[str, Any] = Field(default_factory=dict, description="Task result data")
     execution_time: Optional[float] = Field(default=None, description="Execution time in seconds")
+    queue_wait: Optional[float] = Field(default=None, description="Seconds spent queued before an agent picked the task up")
     error_message: Optional[str] = Field(default=None, description="Error message if failed")
     completed_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -54,6 +91,17 @@ class ValidationResult(BaseModel):
     details: Dict[str, Any] = Field(default_factory=dict, description="Validation details")
 
 
+class HandoffCase(BaseModel):
+    appeal_id: str = Field(..., description="Appeal needing human review")
+    property_id: Optional[str] = Field(default=None, description="Associated property ID")
+    reason: str = Field(..., description="Why the case left the automated path")
+    confidence: float = Field(..., description="Processor confidence at handoff")
+    recommendation: Optional[str] = Field(default=None, description="Automated recommendation, for reference")
+    dollar_at_stake: int = Field(default=0, description="Assessed value minus requested value")
+    hearing_date: Optional[str] = Field(default=None, description="Scheduled hearing date")
+    queued_at: datetime = Field(default_factory=datetime.utcnow)
+
+
 class AgentInfo(BaseModel):
     agent_id: str = Field(..., description="Unique agent identifier")
     agent_type: str = Field(..., description="Type of agent")
@@ -71,6 +119,13 @@ class SwarmState(BaseModel):
     failed_tasks: List[TaskResult] = Field(default_factory=list)
     total_processed: int = Field(default=0, description="Total tasks processed")
     success_rate: float = Field(default=0.0, description="Success rate (0.0-1.0)")
+    completed_count: int = Field(default=0, description="Tasks completed successfully")
+    failed_count: int = Field(default=0, description="Tasks failed, including timeouts")
+    queue_depth: int = Field(default=0, description="Tasks buffered ahead of the processor swarm")
+    in_flight: int = Field(default=0, description="Tasks currently executing")
+    throughput: float = Field(default=0.0, description="Tasks finished per second over the recent window")
+    agent_utilization: Dict[str, float] = Field(default_factory=dict, description="Fraction of uptime each agent spent executing tasks")
+    uptime: float = Field(default=0.0, description="Seconds since tracking started")
 
 
 class WorkflowResult(BaseModel):
@@ -0,0 +1,42 @@
+import time
+from typing import Iterable, List, Optional
+from .models import AgentStatus
+from .metrics import LatencyHistogram
+from .agents import BaseAgent
+
+
+class AgentMonitor:
+    """Detects straggling agents from their heartbeats.
+    
+    An agent is straggling when it is busy and has not sent a heartbeat for
+    longer than ``factor`` times the median task run time seen so far (and
+    at least ``min_seconds``). Run times are kept in a LatencyHistogram, so
+    the baseline costs constant memory however many tasks are observed.
+    """
+    
+    def __init__(self, factor: float = 3.0, min_seconds: float = 1.0):
+        self.factor = factor
+        self.min_seconds = min_seconds
+        self.run_times = LatencyHistogram()
+        self.tasks_stolen = 0
+    
+    def record(self, run_time: Optional[float]):
+        """Fold a completed task's run time into the baseline"""
+        if run_time is not None:
+            self.run_times.record(run_time)
+    
+    def threshold(self) -> float:
+        """Seconds without a heartbeat after which a busy agent counts as straggling"""
+        median = self.run_times.quantile(0.5) or 0.0
+        return max(self.min_seconds, self.factor * median)
+    
+    def silent_for(self, agent: BaseAgent, now: Optional[float] = None) -> float:
+        return (now if now is not None else time.time()) - agent.last_heartbeat
+    
+    def is_straggling(self, agent: BaseAgent, now: Optional[float] = None) -> bool:
+        return agent.status == AgentStatus.BUSY and self.silent_for(agent, now) > self.threshold()
+    
+    def stragglers(self, agents: Iterable[BaseAgent]) -> List[BaseAgent]:
+        """Busy agents whose heartbeat is overdue"""
+        now = time.time()
+        return [agent for agent in agents if self.is_straggling(agent, now)]
@@ -0,0 +1,88 @@
+from typing import Any, Dict, List
+import numpy as np
+from ..data_collection.dataset import DictionaryColumn, RecordDataset
+
+
+def _grouped(codes: np.ndarray, categories: List[str], columns: Dict[str, np.ndarray], count_name: str) -> Dict[str, Dict[str, float]]:
+    """Row count and the mean of each column per category, one bincount per column"""
+    valid = codes >= 0
+    codes = codes[valid]
+    counts = np.bincount(codes, minlength=len(categories))
+    means = {
+        name: np.bincount(codes, weights=values[valid], minlength=len(categories)) / np.maximum(counts, 1)
+        for name, values in columns.items()
+    }
+    return {
+        category: {count_name: int(counts[i]), **{name: float(mean[i]) for name, mean in means.items()}}
+        for i, category in enumerate(categories)
+        if counts[i]
+    }
+
+
+def _property_groups(column: DictionaryColumn, columns: Dict[str, np.ndarray], appeal_rows: np.ndarray) -> Dict[str, Dict[str, float]]:
+    """Per-category property statistics plus how many appeals each category received"""
+    groups = _grouped(column.codes, column.categories, columns, "property_count")
+    appeal_codes = column.codes[appeal_rows]
+    appeal_counts = np.bincount(appeal_codes[appeal_codes >= 0], minlength=len(column.categories))
+    for i, category in enumerate(column.categories):
+        if category in groups:
+            groups[category]["appeal_count"] = int(appeal_counts[i])
+            groups[category]["appeal_rate"] = int(appeal_counts[i]) / groups[category]["property_count"]
+    return groups
+
+
+def analyze_dataset(dataset: RecordDataset) -> Dict[str, Any]:
+    """Pattern totals and group-by statistics for a whole roll in one vectorized pass.
+    
+    Derived columns (assessment ratio, the appeal-to-property join) are
+    computed once and shared by the totals and every group-by; groups are
+    by property_type, street and appeal reason.
+    """
+    properties, appeals = dataset.properties, dataset.appeals
+    assessed_value = properties["assessed_value"].astype(np.float64)
+    market_value = properties["market_value"].astype(np.float64)
+    assessment_ratio = assessed_value / np.maximum(market_value, 1)
+    
+    positions = dataset.property_positions()
+    matched = positions >= 0
+    appeal_rows = positions[matched]
+    requested_value = appeals["requested_value"].astype(np.float64)
+    reason = appeals["reason"]
+    
+    totals = {
+        "property_count": len(properties),
+        "appeal_count": len(appeals),
+        "overassessment_count": int(reason.equals("Overassessment").sum()),
+        "assessment_ratio_sum": float(assessment_ratio.sum()),
+        "assessed_value_sum": int(properties["assessed_value"].sum()),
+        "market_value_sum": int(properties["market_value"].sum())
+    }
+    
+    property_columns = {
+        "avg_assessed_value": assessed_value,
+        "avg_market_value": market_value,
+        "avg_assessment_ratio": assessment_ratio
+    }
+    by_reason = _grouped(reason.codes, reason.categories, {"avg_requested_value": requested_value}, "appeal_count")
+    
+    # Requested reductions only exist for appeals whose property was collected
+    reduction_codes = reason.codes[matched]
+    valid = reduction_codes >= 0
+    reduction_counts = np.bincount(reduction_codes[valid], minlength=len(reason.categories))
+    reduction_sums = np.bincount(
+        reduction_codes[valid],
+        weights=(assessed_value[appeal_rows] - requested_value[matched])[valid],
+        minlength=len(reason.categories)
+    )
+    for i, category in enumerate(reason.categories):
+        if category in by_reason:
+            by_reason[category]["avg_requested_reduction"] = float(reduction_sums[i] / max(reduction_counts[i], 1))
+    
+    return {
+        "totals": totals,
+        "groups": {
+            "by_property_type": _property_groups(properties["property_type"], property_columns, appeal_rows),
+            "by_street": _property_groups(properties["street"], property_columns, appeal_rows),
+            "by_reason": by_reason
+        }
+    }
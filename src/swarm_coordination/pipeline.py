@@ -0,0 +1,199 @@
+import asyncio
+from datetime import date
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional, TypeVar, Union
+from .models import WorkflowTask, TaskResult, TaskStatus, ValidationResult
+from .scheduler import WorkScheduler
+from .priority import appeal_priority
+from ..data_collection.models import PropertyRecord, AppealRecord
+from ..data_collection.property_index import PropertyIndex
+from ..data_collection.records import PropertyRow, AppealRow
+
+
+T = TypeVar("T")
+
+_END = object()
+
+
+class _StageFailure:
+    
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+async def buffered(source: AsyncIterator[T], maxsize: int) -> AsyncIterator[T]:
+    """Run an upstream stage concurrently, connected to its consumer by a bounded queue"""
+    queue = asyncio.Queue(maxsize=maxsize)
+    
+    async def pump():
+        try:
+            async for item in source:
+                await queue.put(item)
+        except Exception as e:
+            await queue.put(_StageFailure(e))
+        else:
+            await queue.put(_END)
+        finally:
+            if hasattr(source, 'aclose'):
+                await source.aclose()
+    
+    pump_task = asyncio.create_task(pump())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END:
+                break
+            if isinstance(item, _StageFailure):
+                raise item.error
+            yield item
+    finally:
+        pump_task.cancel()
+        await asyncio.gather(pump_task, return_exceptions=True)
+
+
+class StreamingPipeline:
+    """Streaming execution of collector → analyzer → processor_swarm → validator → reporter.
+    
+    Every stage is an async generator and adjacent stages are connected by
+    bounded queues, so recommendations are produced while collection is
+    still running and only running totals are kept for the final report.
+    """
+    
+    def __init__(self, manager, source: Optional[AsyncIterable[Union[PropertyRecord, AppealRecord]]] = None):
+        self.manager = manager
+        self.config = manager.config
+        self.source = source
+        
+        self.analysis = None
+        self.property_index = PropertyIndex()
+        self.processed_count = 0
+        self.failed_count = 0
+        self.sample_results: List[Dict[str, Any]] = []
+        self.validation_result: Optional[ValidationResult] = None
+        self.patterns: Dict[str, Any] = {}
+        self.report: Dict[str, Any] = {}
+    
+    async def stream(self) -> AsyncIterator[TaskResult]:
+        """Run all stages concurrently, yielding processing results as they are validated"""
+        buffer_size = self.config.queue_size
+        
+        records = buffered(self._collect(), buffer_size)
+        appeals = buffered(self._analyze(records), buffer_size)
+        results = self._process(appeals)
+        
+        async for result in self._validate(results):
+            self.processed_count += 1
+            if len(self.sample_results) < 5:
+                self.sample_results.append(result)
+            yield result
+        
+        self.report = await self.manager._generate_partial_report(
+            processed_appeals=self.processed_count,
+            total_appeals=self.analysis.appeal_count,
+            sample_appeals=self.sample_results
+        )
+    
+    async def _collect(self) -> AsyncIterator[Union[PropertyRecord, AppealRecord]]:
+        """Collector stage: yield records as they are scraped"""
+        if self.source is not None:
+            async for record in self.source:
+                yield record
+            return
+        
+        collector = self.manager.active_agents['data_collector']
+        task = WorkflowTask(
+            task_id="T001_data_collection",
+            task_type="data_collection",
+            parameters={"source": "lackawanna"}
+        )
+        timeout = self.config.request_timeout
+        async with collector.lock:
+            records = collector.stream_records(task)
+            while True:
+                # A stalled scrape fails the stage instead of hanging the pipeline
+                try:
+                    record = await asyncio.wait_for(records.__anext__(), timeout)
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    raise TimeoutError(f"Data collection produced no record for {timeout}s") from None
+                if self.config.compact_records:
+                    # Validated by the collector; downstream stages carry slotted rows
+                    record = PropertyRow.from_record(record) if isinstance(record, PropertyRecord) else AppealRow.from_record(record)
+                yield record
+    
+    async def _analyze(self, records: AsyncIterator[Union[PropertyRecord, AppealRecord]]) -> AsyncIterator[AppealRecord]:
+        """Analyzer stage: index properties, forward appeals and fold records into accumulators
+        
+        Records are folded in per batch, and patterns are refreshed after every
+        batch so they are available while the stream is still running.
+        """
+        analyzer = self.manager.active_agents['pattern_analyzer']
+        self.analysis = analyzer.new_accumulator()
+        batch_size = self.config.analysis_batch_size
+        batch = []
+        
+        async for record in records:
+            if isinstance(record, (PropertyRecord, PropertyRow)):
+                self.property_index.add(record)
+            batch.append(record)
+            if len(batch) >= batch_size:
+                self.analysis.update(batch, self.property_index.get)
+                self.patterns = analyzer.summarize(self.analysis)
+                batch = []
+            if not isinstance(record, (PropertyRecord, PropertyRow)):
+                yield record
+        
+        if batch:
+            self.analysis.update(batch, self.property_index.get)
+        self.patterns = analyzer.summarize(self.analysis)
+    
+    async def _process(self, appeals: AsyncIterator[AppealRecord]) -> AsyncIterator[TaskResult]:
+        """Processor stage: feed appeals through the bounded processor scheduler"""
+        scheduler = WorkScheduler(
+            self.manager.active_agents['processors'],
+            queue_size=self.config.queue_size,
+            max_in_flight=self.config.max_in_flight,
+            monitor=self.manager.monitor,
+            autoscaler=self.manager.autoscaler()
+        )
+        
+        join = self.property_index.view if self.config.zero_copy_handoff else self.property_index.join
+        
+        today = date.today()
+        
+        async def tasks():
+            index = 0
+            async for appeal in appeals:
+                yield WorkflowTask(
+                    task_id=f"T003_process_appeal_{index:03d}",
+                    task_type="process_appeal",
+                    parameters={"appeal": join(appeal)},
+                    priority=appeal_priority(appeal, self.property_index.get(appeal.property_id), today)
+                )
+                index += 1
+        
+        with self.manager.state.tracking(scheduler):
+            async for result in scheduler.stream(tasks()):
+                self.manager._record_tasks("processing", [result])
+                yield result
+    
+    async def _validate(self, results: AsyncIterator[TaskResult]) -> AsyncIterator[TaskResult]:
+        """Validator stage: shard fixed-size windows across validators and merge consensus"""
+        engine = self.manager._consensus_engine(flag_low_confidence=False)
+        window_size = self.config.validation_window
+        window: List[Dict[str, Any]] = []
+        
+        async for result in results:
+            yield result
+            if result.status == TaskStatus.FAILED:
+                self.failed_count += 1
+                continue
+            window.append(result.result)
+            if len(window) >= window_size:
+                self.manager._record_tasks("validation", await engine.validate(window))
+                window = []
+        
+        if window:
+            self.manager._record_tasks("validation", await engine.validate(window))
+        
+        self.validation_result = engine.result()
@@ -0,0 +1,86 @@
+from collections import deque
+from datetime import date
+from typing import Any, Deque, Dict, Iterator, Optional
+from ..data_collection.models import PropertyRecord, AppealRecord
+
+
+MIN_PRIORITY = 1
+MAX_PRIORITY = 10
+
+# (days until hearing, points): a hearing that has passed or is within a week is most urgent
+HEARING_URGENCY = ((7, 5), (30, 3), (90, 1))
+# (dollars at stake, points): assessed value minus the value requested
+DOLLAR_URGENCY = ((100000, 4), (25000, 2), (5000, 1))
+
+
+def appeal_priority(appeal: AppealRecord, record: Optional[PropertyRecord] = None, today: Optional[date] = None) -> int:
+    """WorkflowTask priority (1-10, higher is more urgent) from hearing date and dollars at stake"""
+    points = 0
+    
+    if appeal.hearing_date:
+        try:
+            days = (date.fromisoformat(appeal.hearing_date[:10]) - (today or date.today())).days
+        except ValueError:
+            days = None
+        if days is not None:
+            points += next((score for limit, score in HEARING_URGENCY if days <= limit), 0)
+    
+    if record is not None:
+        at_stake = record.assessed_value - appeal.requested_value
+        points += next((score for limit, score in DOLLAR_URGENCY if at_stake >= limit), 0)
+    
+    return min(MIN_PRIORITY + points, MAX_PRIORITY)
+
+
+class FairPriorityQueue:
+    """FIFO per priority class, drained by stride scheduling across classes.
+    
+    Each class gets a share of dispatches proportional to 2 ** (priority - 1),
+    so priority 1 gets one dispatch for every 512 of a backlogged priority
+    10: urgent work goes almost straight to the front while lower classes
+    still make progress however large the urgent backlog. A class that was
+    empty rejoins at the current virtual time rather than with banked
+    credit. push and pop are O(number of classes).
+    """
+    
+    def __init__(self):
+        self._classes: Dict[int, Deque[Any]] = {}
+        self._passes: Dict[int, float] = {}
+        self._virtual_time = 0.0
+        self._size = 0
+    
+    def push(self, priority: int, item: Any):
+        priority = min(max(priority, MIN_PRIORITY), MAX_PRIORITY)
+        items = self._classes.get(priority)
+        if items is None:
+            items = self._classes[priority] = deque()
+        if not items:
+            self._passes[priority] = max(self._passes.get(priority, 0.0), self._virtual_time)
+        items.append(item)
+        self._size += 1
+    
+    def pop(self) -> Any:
+        """Next item: from the non-empty class furthest behind its share, most urgent on ties"""
+        if not self._size:
+            raise IndexError("pop from an empty FairPriorityQueue")
+        # Order by when each class's next item would finish under its share
+        priority = min(
+            (priority for priority, items in self._classes.items() if items),
+            key=lambda priority: (self._passes[priority] + self._stride(priority), -priority)
+        )
+        self._virtual_time = self._passes[priority]
+        self._passes[priority] += self._stride(priority)
+        self._size -= 1
+        return self._classes[priority].popleft()
+    
+    @staticmethod
+    def _stride(priority: int) -> float:
+        return 1.0 / (1 << (priority - 1))
+    
+    def drain(self) -> Iterator[Any]:
+        """Pop every item in fair dispatch order"""
+        while self._size:
+            yield self.pop()
+    
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,122 @@
+import hashlib
+import itertools
+import json
+import sqlite3
+from typing import Any, Dict, Mapping, Optional
+
+
+def content_key(namespace: str, version: str, inputs: Mapping[str, Any]) -> str:
+    """Stable hash of an agent's inputs and the version of the rules applied to them"""
+    payload = json.dumps([namespace, version, dict(inputs)], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    """Content-addressed store of agent outputs backed by SQLite.
+    
+    Entries are keyed by content_key, so an appeal whose joined inputs and
+    rule version are unchanged since an earlier run is a hit and any edit
+    is a miss. The least recently used entries are evicted once the cache
+    exceeds max_entries or max_bytes of stored values. Writes are committed
+    every commit_interval puts and on flush, so a daily run pays for a
+    handful of transactions rather than one per appeal.
+    """
+    
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: Optional[int] = 100000,
+        max_bytes: Optional[int] = None,
+        commit_interval: int = 500
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.commit_interval = commit_interval
+        self.hits = 0
+        self.misses = 0
+        self._uncommitted = 0
+        
+        self.connection = sqlite3.connect(path or ":memory:")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, last_used INTEGER NOT NULL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+        
+        entries, total_bytes, clock = self.connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(MAX(last_used), 0) FROM results"
+        ).fetchone()
+        self.entries = entries
+        self.total_bytes = total_bytes
+        self._clock = itertools.count(clock + 1)
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value for key, marking it recently used; None on a miss"""
+        row = self.connection.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        self.connection.execute("UPDATE results SET last_used = ? WHERE key = ?", (next(self._clock), key))
+        return json.loads(row[0])
+    
+    def put(self, key: str, value: Any):
+        """Store a JSON-serializable value, evicting least recently used entries if over budget"""
+        payload = json.dumps(value, default=str)
+        previous = self.connection.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+        self.connection.execute(
+            "INSERT OR REPLACE INTO results (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+            (key, payload, len(payload), next(self._clock))
+        )
+        
+        if previous is None:
+            self.entries += 1
+        else:
+            self.total_bytes -= previous[0]
+        self.total_bytes += len(payload)
+        self._evict()
+        
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_interval:
+            self.flush()
+    
+    def flush(self):
+        """Commit pending writes"""
+        self.connection.commit()
+        self._uncommitted = 0
+    
+    def close(self):
+        self.flush()
+        self.connection.close()
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": self.entries,
+            "bytes": self.total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+    
+    def _over_budget(self) -> bool:
+        if self.max_entries is not None and self.entries > self.max_entries:
+            return True
+        return self.max_bytes is not None and self.total_bytes > self.max_bytes
+    
+    def _evict(self):
+        while self.entries and self._over_budget():
+            key, size = self.connection.execute(
+                "SELECT key, size FROM results ORDER BY last_used LIMIT 1"
+            ).fetchone()
+            self.connection.execute("DELETE FROM results WHERE key = ?", (key,))
+            self.entries -= 1
+            self.total_bytes -= size
+    
+    def __len__(self) -> int:
+        return self.entries
+    
+    def __contains__(self, key: str) -> bool:
+        return self.connection.execute("SELECT 1 FROM results WHERE key = ?", (key,)).fetchone() is not None
@@ -0,0 +1,88 @@
+import asyncio
+from typing import Any, AsyncIterable, Dict, List, Optional, Union
+from .models import SwarmConfig, SwarmState, WorkflowResult
+from .swarm_manager import SwarmManager, load_swarm_config
+from ..data_collection.models import PropertyRecord, AppealRecord
+
+
+class SwarmRuntime:
+    """Long-lived swarm that keeps its agent pool warm across workflows.
+    
+    Config is loaded and agents are started once. Each submission gets its
+    own SwarmManager, so completed tasks, timings and results are isolated
+    per workflow while the agents, execution backend, human handoff
+    queue, result cache and live state counters are shared. Agents run
+    one task at a time (BaseAgent.run_task), so concurrent workflows
+    interleave on the shared pool.
+    """
+    
+    def __init__(self, config: Optional[SwarmConfig] = None):
+        self.config = config if config is not None else load_swarm_config()
+        self._template: Optional[SwarmManager] = None
+        self.workflows_submitted = 0
+    
+    @property
+    def started(self) -> bool:
+        return self._template is not None
+    
+    async def start(self):
+        """Start the shared agent pool (idempotent)"""
+        if self._template is None:
+            template = SwarmManager(self.config)
+            await template.start_swarm()
+            self._template = template
+    
+    def snapshot(self) -> SwarmState:
+        """Live SwarmState across every workflow on the shared pool"""
+        if self._template is None:
+            raise RuntimeError("SwarmRuntime.start() must be called before taking a snapshot")
+        return self._template.snapshot()
+    
+    async def stop(self):
+        """Shut down the shared agent pool"""
+        if self._template is not None:
+            await self._template.stop_swarm()
+            self._template = None
+    
+    def manager(self) -> SwarmManager:
+        """A per-workflow manager bound to the warm agent pool"""
+        if self._template is None:
+            raise RuntimeError("SwarmRuntime.start() must be called before submitting workflows")
+        return SwarmManager(
+            self.config,
+            agents=self._template.active_agents,
+            backend=self._template.backend,
+            handoff_queue=self._template.handoff_queue,
+            result_cache=self._template.result_cache,
+            state=self._template.state,
+            processor_ids=self._template.processor_ids
+        )
+    
+    async def submit(
+        self,
+        parameters: Optional[Dict[str, Any]] = None,
+        source: Optional[AsyncIterable[Union[PropertyRecord, AppealRecord]]] = None,
+        streaming: bool = False
+    ) -> WorkflowResult:
+        """Run one workflow on the warm pool"""
+        await self.start()
+        self.workflows_submitted += 1
+        manager = self.manager()
+        try:
+            if streaming or source is not None:
+                return await manager.execute_streaming_workflow(source)
+            return await manager.execute_workflow(parameters)
+        finally:
+            # The per-workflow manager is discarded, so release its ledger spill file now
+            manager.task_ledger.close()
+    
+    async def submit_many(self, parameter_sets: List[Optional[Dict[str, Any]]]) -> List[WorkflowResult]:
+        """Run several workflows concurrently, e.g. one per municipality or intake day"""
+        return await asyncio.gather(*(self.submit(parameters) for parameters in parameter_sets))
+    
+    async def __aenter__(self):
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
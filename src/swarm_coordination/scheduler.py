@@ -0,0 +1,279 @@
+import asyncio
+import time
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Union
+from .models import WorkflowTask, TaskResult
+from .agents import BaseAgent
+from .priority import FairPriorityQueue
+from .monitor import AgentMonitor
+from .autoscaler import PoolAutoscaler
+
+
+_STOP = object()
+
+
+class _PendingTasks:
+    """Fair priority ordering for queued tasks; stop markers drain only after every task"""
+    
+    def __init__(self):
+        self.tasks = FairPriorityQueue()
+        self.stops = 0
+    
+    def __len__(self) -> int:
+        return len(self.tasks) + self.stops
+
+
+class PriorityTaskQueue(asyncio.Queue):
+    """Bounded asyncio queue that hands out (task, enqueued_at) items by WorkflowTask.priority"""
+    
+    def _init(self, maxsize):
+        self._queue = _PendingTasks()
+    
+    def _put(self, item):
+        if item is _STOP:
+            self._queue.stops += 1
+        else:
+            self._queue.tasks.push(item[0].priority, item)
+    
+    def _get(self):
+        if self._queue.tasks:
+            return self._queue.tasks.pop()
+        self._queue.stops -= 1
+        return _STOP
+
+
+class _InFlight:
+    """A dispatched task and every running copy of it"""
+    
+    __slots__ = ("task", "agent", "queue_wait", "runners", "done", "stolen")
+    
+    def __init__(self, task: WorkflowTask, agent: BaseAgent, queue_wait: float):
+        self.task = task
+        self.agent = agent
+        self.queue_wait = queue_wait
+        self.runners: List[asyncio.Future] = []
+        self.done = False
+        self.stolen = False
+
+
+class WorkScheduler:
+    """Bounded work queue feeding a fixed pool of agents.
+    
+    Each agent gets one worker that pulls the next task only when the agent
+    is idle, so at most ``max_in_flight`` tasks execute at once and at most
+    ``queue_size`` tasks are buffered ahead of them. Producers block when
+    the queue is full, which keeps memory flat regardless of backlog size.
+    Buffered tasks are dispatched by WorkflowTask.priority with fair
+    sharing across priority classes (see FairPriorityQueue).
+    """
+    
+    def __init__(
+        self,
+        agents: List[BaseAgent],
+        queue_size: int = 100,
+        max_in_flight: Optional[int] = None,
+        monitor: Optional[AgentMonitor] = None,
+        autoscaler: Optional[PoolAutoscaler] = None
+    ):
+        if not agents and autoscaler is None:
+            raise ValueError("WorkScheduler requires at least one agent")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        
+        self.agents = agents
+        self.queue_size = queue_size
+        if autoscaler is None:
+            self.max_in_flight = min(max_in_flight or len(agents), len(agents))
+        else:
+            # The autoscaler sizes the pool, but never beyond an explicit max_in_flight
+            self.max_in_flight = min(max_in_flight or autoscaler.max_size, autoscaler.max_size)
+        self.monitor = monitor
+        self.autoscaler = autoscaler
+        self.tasks_enqueued = 0
+        self.tasks_dispatched = 0
+        self.tasks_finished = 0
+        self.tasks_stolen = 0
+    
+    @property
+    def queue_depth(self) -> int:
+        return self.tasks_enqueued - self.tasks_dispatched
+    
+    @property
+    def in_flight(self) -> int:
+        return self.tasks_dispatched - self.tasks_finished
+    
+    async def stream(self, tasks: Union[Iterable[WorkflowTask], AsyncIterable[WorkflowTask]]) -> AsyncIterator[TaskResult]:
+        """Dispatch tasks to idle agents and yield results as they complete
+        
+        With a monitor, an agent that runs out of queued work steals tasks
+        from straggling agents: it runs a copy, the first copy to finish
+        wins and the other is cancelled. With an autoscaler, workers are
+        added and retired while the run progresses instead of one per agent,
+        still within max_in_flight.
+        """
+        pending = PriorityTaskQueue(maxsize=self.queue_size)
+        results = asyncio.Queue(maxsize=self.queue_size)
+        in_flight: Dict[str, _InFlight] = {}
+        workers: Dict[BaseAgent, asyncio.Task] = {}
+        started = 0
+        retiring = 0
+        closed = False
+        
+        async def produce():
+            try:
+                if hasattr(tasks, '__aiter__'):
+                    async for task in tasks:
+                        await pending.put((task, time.perf_counter()))
+                        self.tasks_enqueued += 1
+                else:
+                    for task in tasks:
+                        await pending.put((task, time.perf_counter()))
+                        self.tasks_enqueued += 1
+            except Exception as e:
+                await results.put(e)
+            finally:
+                await pending.put(_STOP)
+        
+        async def execute(agent: BaseAgent, entry: "_InFlight", task: WorkflowTask) -> bool:
+            """Run one copy of a task; False if the worker should stop after an error"""
+            runner = asyncio.ensure_future(agent.run_task(task))
+            entry.runners.append(runner)
+            try:
+                await asyncio.wait([runner])
+            except asyncio.CancelledError:
+                runner.cancel()
+                raise
+            
+            if runner.cancelled() or entry.done:
+                return True  # Another copy finished first
+            entry.done = True
+            self.tasks_finished += 1
+            in_flight.pop(entry.task.task_id, None)
+            for other in entry.runners:
+                if other is not runner:
+                    other.cancel()
+            
+            if runner.exception() is not None:
+                await results.put(runner.exception())
+                return False
+            
+            result = runner.result()
+            result.queue_wait = entry.queue_wait
+            if self.monitor is not None:
+                self.monitor.record(result.execution_time)
+            if self.autoscaler is not None:
+                self.autoscaler.record(result.execution_time)
+            await results.put(result)
+            return True
+        
+        async def steal(agent: BaseAgent) -> bool:
+            """Once the queue is drained, take over straggling tasks until none are left running"""
+            while in_flight:
+                now = time.time()
+                candidates = [entry for entry in in_flight.values() if not entry.stolen]
+                straggler = next((
+                    entry for entry in candidates
+                    if self.monitor.is_straggling(entry.agent, now)
+                ), None)
+                
+                if straggler is None:
+                    # Sleep until the next task could become a straggler or something finishes
+                    runners = [runner for entry in in_flight.values() for runner in entry.runners]
+                    timeout = max(min(
+                        (self.monitor.threshold() - self.monitor.silent_for(entry.agent, now) for entry in candidates),
+                        default=self.monitor.threshold()
+                    ), 0.01)
+                    await asyncio.wait(runners, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+                
+                straggler.stolen = True
+                self.tasks_stolen += 1
+                self.monitor.tasks_stolen += 1
+                stolen = straggler.task.model_copy(update={"assigned_agent": agent.agent_id})
+                if not await execute(agent, straggler, stolen):
+                    return False
+            return True
+        
+        async def work(agent: BaseAgent):
+            nonlocal retiring, closed
+            while True:
+                if retiring and not closed:
+                    retiring -= 1
+                    break  # Scaled down
+                
+                item = await pending.get()
+                if item is _STOP:
+                    closed = True
+                    pending.put_nowait(_STOP)  # Pass the stop on to the next worker
+                    if self.monitor is not None and not await steal(agent):
+                        return
+                    break
+                
+                task, enqueued_at = item
+                entry = _InFlight(task, agent, time.perf_counter() - enqueued_at)
+                in_flight[task.task_id] = entry
+                task.assigned_agent = agent.agent_id
+                self.tasks_dispatched += 1
+                if not await execute(agent, entry, task):
+                    return
+            
+            del workers[agent]
+            await results.put(_STOP)
+        
+        def start_worker(agent: BaseAgent):
+            nonlocal started
+            started += 1
+            workers[agent] = asyncio.create_task(work(agent))
+        
+        async def scale():
+            nonlocal retiring
+            while not closed:
+                await asyncio.sleep(self.autoscaler.interval)
+                if closed:
+                    return
+                live = len(workers) - retiring
+                desired = min(self.autoscaler.desired_size(self.queue_depth + self.in_flight, live), self.max_in_flight)
+                if desired == live:
+                    continue
+                self.autoscaler.resizes += 1
+                if desired < live:
+                    retiring += live - desired
+                    continue
+                # Cancel pending retirements before starting new workers
+                reinstated = min(retiring, desired - live)
+                retiring -= reinstated
+                for _ in range(desired - live - reinstated):
+                    start_worker(self.autoscaler.acquire(workers))
+        
+        running = [asyncio.create_task(produce())]
+        if self.autoscaler is None:
+            for agent in self.agents[:self.max_in_flight]:
+                start_worker(agent)
+        else:
+            for _ in range(min(self.autoscaler.min_size, self.max_in_flight)):
+                start_worker(self.autoscaler.acquire(workers))
+            running.append(asyncio.create_task(scale()))
+        
+        try:
+            stopped = 0
+            while not (closed and stopped == started):
+                item = await results.get()
+                if item is _STOP:
+                    stopped += 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            running.extend(workers.values())
+            for task in running:
+                task.cancel()
+            for entry in in_flight.values():
+                for runner in entry.runners:
+                    runner.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            if self.autoscaler is not None:
+                self.autoscaler.trim()
+    
+    async def run(self, tasks: Union[Iterable[WorkflowTask], AsyncIterable[WorkflowTask]]) -> List[TaskResult]:
+        """Dispatch all tasks and collect their results"""
+        return [result async for result in self.stream(tasks)]
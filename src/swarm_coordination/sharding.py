@@ -0,0 +1,237 @@
+import asyncio
+import json
+import multiprocessing
+import struct
+import sys
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from .models import SwarmConfig, TaskResult, ValidationResult
+from ..data_collection.models import PropertyRecord, AppealRecord
+from ..data_collection.property_index import PropertyIndex
+from ..data_collection.records import compact_appeals, compact_properties, export_record
+
+
+# Messages are length-prefixed JSON: a 4-byte big-endian size, then the UTF-8 body
+_HEADER = struct.Struct(">I")
+
+# Workflow stages a shard worker runs and reports tasks for
+SHARD_STAGES = ("processing", "validation")
+
+
+def shard_for(property_id: str, shard_count: int) -> int:
+    """Stable shard assignment, identical on every host and interpreter run"""
+    return zlib.crc32(property_id.encode()) % shard_count
+
+
+def partition_appeals(appeal_records: Sequence[AppealRecord], shard_count: int) -> List[List[AppealRecord]]:
+    """Split appeals by property_id hash so all appeals for a property land on one shard"""
+    shards: List[List[AppealRecord]] = [[] for _ in range(shard_count)]
+    for appeal in appeal_records:
+        shards[shard_for(appeal.property_id, shard_count)].append(appeal)
+    return shards
+
+
+async def read_message(reader: asyncio.StreamReader) -> Optional[Dict[str, Any]]:
+    """Read one framed message, or None when the peer closes the connection"""
+    try:
+        header = await reader.readexactly(_HEADER.size)
+        body = await reader.readexactly(_HEADER.unpack(header)[0])
+    except asyncio.IncompleteReadError:
+        return None
+    return json.loads(body)
+
+
+async def write_message(writer: asyncio.StreamWriter, message: Dict[str, Any]):
+    body = json.dumps(message, default=str).encode()
+    writer.write(_HEADER.pack(len(body)) + body)
+    await writer.drain()
+
+
+def _parse_address(address: str) -> Tuple[str, int]:
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+class ShardCoordinator:
+    """Sends appeal shards to shard workers and gathers their results.
+    
+    Appeals are partitioned by property_id hash into shard_count shards,
+    assigned round-robin to the worker addresses ("host:port"). Each
+    shard carries only the property records its appeals join against.
+    Workers process and validate their shards concurrently; the caller
+    merges the per-shard consensus snapshots and records the workers'
+    per-batch processing and validation tasks.
+    """
+    
+    def __init__(self, workers: Sequence[str], shard_count: Optional[int] = None):
+        if not workers:
+            raise ValueError("ShardCoordinator requires at least one worker address")
+        self.workers = [_parse_address(address) for address in workers]
+        self.shard_count = shard_count or len(self.workers)
+    
+    async def run(
+        self,
+        appeal_records: Sequence[AppealRecord],
+        property_index: PropertyIndex
+    ) -> Tuple[List[TaskResult], List[ValidationResult], Dict[str, List[TaskResult]]]:
+        """Process and validate every shard remotely
+        
+        Returns per-appeal results, per-shard consensus and the tasks the
+        workers ran, by stage ("processing" batches and "validation").
+        """
+        assignments: List[List[Dict[str, Any]]] = [[] for _ in self.workers]
+        for shard_id, appeals in enumerate(partition_appeals(appeal_records, self.shard_count)):
+            if not appeals:
+                continue
+            properties = {}
+            for appeal in appeals:
+                record = property_index.get(appeal.property_id)
+                if record is not None:
+                    properties[record.property_id] = record
+            assignments[shard_id % len(self.workers)].append({
+                "type": "shard",
+                "shard_id": shard_id,
+                "appeals": [export_record(appeal).model_dump(mode="json") for appeal in appeals],
+                "properties": [export_record(record).model_dump(mode="json") for record in properties.values()]
+            })
+        
+        responses = await asyncio.gather(*(
+            self._send(address, shards)
+            for address, shards in zip(self.workers, assignments)
+            if shards
+        ))
+        
+        results: List[TaskResult] = []
+        validations: List[ValidationResult] = []
+        tasks: Dict[str, List[TaskResult]] = {stage: [] for stage in SHARD_STAGES}
+        for response in sorted((response for batch in responses for response in batch), key=lambda r: r["shard_id"]):
+            results.extend(TaskResult(**result) for result in response["results"])
+            validations.append(ValidationResult(**response["validation"]))
+            for stage in SHARD_STAGES:
+                tasks[stage].extend(TaskResult(**task) for task in response["tasks"][stage])
+        return results, validations, tasks
+    
+    async def _send(self, address: Tuple[str, int], shards: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Pipeline shards to one worker over a single connection"""
+        reader, writer = await asyncio.open_connection(*address)
+        try:
+            for shard in shards:
+                await write_message(writer, shard)
+            
+            responses = []
+            for _ in shards:
+                response = await read_message(reader)
+                if response is None:
+                    raise ConnectionError(f"Shard worker {address[0]}:{address[1]} closed the connection")
+                if response["type"] == "error":
+                    raise RuntimeError(f"Shard {response['shard_id']} failed on {address[0]}:{address[1]}: {response['error']}")
+                responses.append(response)
+            return responses
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+
+async def run_shard(manager, message: Dict[str, Any]) -> Dict[str, Any]:
+    """Process and validate one shard on a local SwarmManager"""
+    shard_id = message["shard_id"]
+    appeals = [AppealRecord(**appeal) for appeal in message["appeals"]]
+    properties = [PropertyRecord(**record) for record in message["properties"]]
+    if manager.config.compact_records:
+        appeals, properties = compact_appeals(appeals), compact_properties(properties)
+    property_index = PropertyIndex(properties)
+    
+    try:
+        results = await manager._execute_processing(appeals, property_index)
+        validation = await manager._execute_validation(results)
+        # The tasks actually run (batches, validator shards) for the coordinator's ledger and metrics
+        tasks = {stage: list(manager.task_ledger.query(stage=stage)) for stage in SHARD_STAGES}
+    finally:
+        manager.task_ledger.close()
+    
+    def export(result: TaskResult) -> Dict[str, Any]:
+        return {**result.model_dump(mode="json"), "task_id": f"{result.task_id}_shard{shard_id:03d}"}
+    
+    return {
+        "type": "result",
+        "shard_id": shard_id,
+        "results": [export(result) for result in results],
+        "validation": validation.model_dump(mode="json"),
+        "tasks": {stage: [export(task) for task in tasks[stage]] for stage in SHARD_STAGES}
+    }
+
+
+async def serve_shards(host: str = "127.0.0.1", port: int = 0, config: Optional[SwarmConfig] = None, ready=None):
+    """Run a shard worker: a warm SwarmRuntime answering shard requests on host:port"""
+    from .runtime import SwarmRuntime
+    
+    async with SwarmRuntime(config) as runtime:
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            try:
+                while True:
+                    message = await read_message(reader)
+                    if message is None:
+                        break
+                    try:
+                        response = await run_shard(runtime.manager(), message)
+                    except Exception as e:
+                        response = {"type": "error", "shard_id": message.get("shard_id"), "error": str(e)}
+                    await write_message(writer, response)
+            finally:
+                writer.close()
+        
+        server = await asyncio.start_server(handle, host, port)
+        if ready is not None:
+            ready.send(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+
+
+def _worker_main(host: str, config: Optional[Dict[str, Any]], ready):
+    asyncio.run(serve_shards(host, 0, SwarmConfig(**config) if config else None, ready))
+
+
+class LocalShardWorkers:
+    """Shard workers running as processes on this host, for tests and single-box runs"""
+    
+    def __init__(self, count: int, config: Optional[SwarmConfig] = None, host: str = "127.0.0.1"):
+        self.count = count
+        self.config = config
+        self.host = host
+        self.processes: List[multiprocessing.Process] = []
+        self.addresses: List[str] = []
+    
+    def start(self) -> List[str]:
+        """Spawn the workers and wait until each is listening; returns their addresses"""
+        context = multiprocessing.get_context("spawn")
+        config = self.config.model_dump() if self.config is not None else None
+        for _ in range(self.count):
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(target=_worker_main, args=(self.host, config, sender), daemon=True)
+            process.start()
+            self.processes.append(process)
+            self.addresses.append(f"{self.host}:{receiver.recv()}")
+        return self.addresses
+    
+    def stop(self):
+        for process in self.processes:
+            process.terminate()
+        for process in self.processes:
+            process.join()
+        self.processes.clear()
+        self.addresses.clear()
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+if __name__ == "__main__":
+    # python -m src.swarm_coordination.sharding [host] [port]
+    asyncio.run(serve_shards(
+        sys.argv[1] if len(sys.argv) > 1 else "0.0.0.0",
+        int(sys.argv[2]) if len(sys.argv) > 2 else 8765
+    ))
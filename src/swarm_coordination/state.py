@@ -0,0 +1,111 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterable, List
+from .models import SwarmState, TaskResult, TaskStatus
+
+
+class SwarmStateTracker:
+    """Live swarm counters, updated in O(1) per task result.
+    
+    Results are folded into running totals, per-agent busy time and
+    one-second throughput buckets covering the last ``window_seconds``.
+    Queue depth and in-flight counts are read from the schedulers being
+    tracked at snapshot time, so monitoring adds no work to dispatch.
+    """
+    
+    def __init__(self, window_seconds: int = 10):
+        self.window_seconds = window_seconds
+        self.started_at = time.time()
+        self.total_processed = 0
+        self.completed = 0
+        self.failed = 0
+        self.busy_time: Dict[str, float] = {}
+        self._schedulers: List = []
+        self._recent: Deque[List[int]] = deque()
+    
+    def record(self, results: Iterable[TaskResult]):
+        """Fold finished task results into the counters"""
+        second = int(time.time())
+        for result in results:
+            self.total_processed += 1
+            if result.status == TaskStatus.FAILED:
+                self.failed += 1
+            else:
+                self.completed += 1
+            if result.execution_time is not None:
+                self.busy_time[result.agent_id] = self.busy_time.get(result.agent_id, 0.0) + result.execution_time
+            
+            if self._recent and self._recent[-1][0] == second:
+                self._recent[-1][1] += 1
+            else:
+                self._recent.append([second, 1])
+                while self._recent[0][0] <= second - self.window_seconds:
+                    self._recent.popleft()
+    
+    @contextmanager
+    def tracking(self, scheduler):
+        """Include a running WorkScheduler's queue depth and in-flight count in snapshots"""
+        self._schedulers.append(scheduler)
+        try:
+            yield scheduler
+        finally:
+            self._schedulers.remove(scheduler)
+    
+    def throughput(self, now: float) -> float:
+        """Tasks finished per second over the recent window"""
+        cutoff = int(now) - self.window_seconds
+        recent = sum(count for second, count in self._recent if second > cutoff)
+        return recent / min(self.window_seconds, max(now - self.started_at, 1.0))
+    
+    def snapshot(self, agents: Iterable) -> SwarmState:
+        """Point-in-time SwarmState; task lists are left empty, counts carry the totals"""
+        now = time.time()
+        uptime = max(now - self.started_at, 1e-9)
+        agent_infos = {agent.agent_id: agent.info() for agent in agents}
+        return SwarmState(
+            active_agents=agent_infos,
+            total_processed=self.total_processed,
+            success_rate=self.completed / self.total_processed if self.total_processed else 0.0,
+            completed_count=self.completed,
+            failed_count=self.failed,
+            queue_depth=sum(scheduler.queue_depth for scheduler in self._schedulers),
+            in_flight=sum(scheduler.in_flight for scheduler in self._schedulers),
+            throughput=self.throughput(now),
+            agent_utilization={
+                agent_id: min(self.busy_time.get(agent_id, 0.0) / uptime, 1.0)
+                for agent_id in agent_infos
+            },
+            uptime=uptime
+        )
+
+
+async def serve_state(snapshot: Callable[[], SwarmState], endpoint: str) -> asyncio.AbstractServer:
+    """Serve JSON snapshots over HTTP on "host:port" or "unix:/path/to.sock"
+    
+    Every GET returns the current snapshot, e.g. ``curl localhost:8787`` or
+    ``curl --unix-socket /tmp/swarm.sock http://swarm/``.
+    """
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass  # Headers are ignored
+            
+            if request_line.startswith(b"GET "):
+                status, body = b"200 OK", snapshot().model_dump_json().encode()
+            else:
+                status, body = b"405 Method Not Allowed", b'{"error": "GET only"}'
+            writer.write(
+                b"HTTP/1.1 " + status + b"\r\nContent-Type: application/json\r\n"
+                b"Content-Length: " + str(len(body)).encode() + b"\r\nConnection: close\r\n\r\n" + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+    
+    if endpoint.startswith("unix:"):
+        return await asyncio.start_unix_server(handle, endpoint[len("unix:"):])
+    host, _, port = endpoint.rpartition(":")
+    return await asyncio.start_server(handle, host or "127.0.0.1", int(port))
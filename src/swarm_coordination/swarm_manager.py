@@ -1,50 +1,125 @@
-import asyncio
+import itertools
 import time
 import yaml
-from typing import Dict, Any, List, Tuple
+from datetime import date
+from typing import Dict, Any, Iterator, List, Set, Tuple, AsyncIterable, AsyncIterator, Optional, Union
 from pathlib import Path
-from .models import SwarmConfig, WorkflowResult, TaskResult, ValidationResult
+from .models import SwarmConfig, SwarmState, WorkflowResult, TaskResult, TaskStatus, ValidationResult, HandoffCase, AgentInfo
+from .scheduler import WorkScheduler
+from .pipeline import StreamingPipeline
+from .consensus import ConsensusEngine, ConsensusAccumulator
+from .handoff import HumanHandoffQueue
+from .executors import ExecutionBackend, create_backend
+from .metrics import TaskTimings
+from .ledger import TaskLedger
+from .checkpoint import WorkflowCheckpoint
+from .result_cache import ResultCache
+from .sharding import ShardCoordinator
+from .priority import FairPriorityQueue, appeal_priority
+from .monitor import AgentMonitor
+from .autoscaler import PoolAutoscaler
+from .state import SwarmStateTracker, serve_state
 from .agents import (
     DataCollectorAgent, 
     PatternAnalyzerAgent, 
     ProcessorAgent, 
     ValidatorAgent, 
-    ReportGeneratorAgent
+    ReportGeneratorAgent,
+    expand_batch_result
 )
 from ..data_collection.models import PropertyRecord, AppealRecord
+from ..data_collection.property_index import PropertyIndex
+from ..data_collection.dataset import RecordDataset
+from ..data_collection.records import compact_appeals, compact_properties, record_dict
+
+
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent.parent / "claude-flow" / "swarm-config.yml"
+
+_config_cache: Dict[Path, Tuple[float, SwarmConfig]] = {}
+_workflow_counter = itertools.count(1)
+# Checkpoint files in use by a running workflow; one file cannot record two workflows at once
+_open_checkpoints: Set[Path] = set()
+
+
+def load_swarm_config(config_path: Path = DEFAULT_CONFIG_PATH) -> SwarmConfig:
+    """Parse swarm-config.yml into a SwarmConfig, re-reading only when the file changes"""
+    mtime = config_path.stat().st_mtime
+    cached = _config_cache.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1].model_copy()
+    
+    with open(config_path, 'r') as file:
+        yaml_config = yaml.safe_load(file)
+    
+    processor_swarm = yaml_config['specialized_agents']['processor_swarm']
+    validator_consensus = yaml_config['specialized_agents']['validator_consensus']
+    
+    # Convert YAML config to SwarmConfig
+    config = SwarmConfig(
+        max_agents=yaml_config.get('max_agents', 15),
+        topology=yaml_config.get('swarm_topology', 'mesh'),
+        coordination_protocol=yaml_config.get('coordination_protocol', 'consensus'),
+        processor_agents=processor_swarm['agents'],
+        validator_agents=validator_consensus['agents'],
+        validation_overlap=validator_consensus.get('overlap', 0.1),
+        correction_threshold=validator_consensus.get('correction_threshold', 0.7),
+        max_correction_rounds=validator_consensus.get('max_correction_rounds', 2),
+        execution_backend=yaml_config.get('execution_backend', 'inline'),
+        queue_size=processor_swarm.get('queue_size', 100),
+        max_in_flight=processor_swarm.get('max_in_flight')
+    )
+    _config_cache[config_path] = (mtime, config)
+    return config.model_copy()
 
 
 class SwarmManager:
     
-    def __init__(self, config: SwarmConfig = None):
+    def __init__(
+        self,
+        config: SwarmConfig = None,
+        agents: Optional[Dict[str, Any]] = None,
+        backend: Optional[ExecutionBackend] = None,
+        handoff_queue: Optional[HumanHandoffQueue] = None,
+        result_cache: Optional[ResultCache] = None,
+        state: Optional[SwarmStateTracker] = None,
+        processor_ids: Optional[Iterator[int]] = None
+    ):
+        """Agents, backend, handoff queue, result cache, state tracker and processor ID sequence may be shared from a SwarmRuntime"""
         if config is None:
             self.config = self._load_config_from_yaml()
         else:
             self.config = config
         
-        self.active_agents = {}
+        self.active_agents = agents if agents is not None else {}
+        self.owns_agents = agents is None
         self.task_queue = []
-        self.completed_tasks = []
+        self.task_ledger = TaskLedger(self.config.ledger_window, self.config.ledger_path)
+        self.completed_tasks = self.task_ledger.window
+        self.timings = TaskTimings()
         self.workflow_start_time = None
+        self.last_pipeline = None
+        self.handoff_queue = handoff_queue if handoff_queue is not None else HumanHandoffQueue(self.config.handoff_path)
+        self.backend = backend
+        self.result_cache = result_cache
+        self.monitor = (
+            AgentMonitor(self.config.straggler_factor, self.config.straggler_min_seconds)
+            if self.config.work_stealing else None
+        )
+        self.checkpoint: Optional[WorkflowCheckpoint] = None
+        self.state = state if state is not None else SwarmStateTracker()
+        self.state_server = None
+        # Autoscaled processor numbers continue across every manager on a shared pool
+        self.processor_ids = processor_ids if processor_ids is not None else itertools.count(self.config.processor_agents + 1)
     
     def _load_config_from_yaml(self) -> SwarmConfig:
         """Load configuration from the existing claude-flow/swarm-config.yml"""
-        config_path = Path(__file__).parent.parent.parent / "claude-flow" / "swarm-config.yml"
-        
-        with open(config_path, 'r') as file:
-            yaml_config = yaml.safe_load(file)
-        
-        # Convert YAML config to SwarmConfig
-        return SwarmConfig(
-            max_agents=yaml_config.get('max_agents', 15),
-            topology=yaml_config.get('swarm_topology', 'mesh'),
-            coordination_protocol=yaml_config.get('coordination_protocol', 'consensus'),
-            processor_agents=yaml_config['specialized_agents']['processor_swarm']['agents'],
-            validator_agents=yaml_config['specialized_agents']['validator_consensus']['agents']
-        )
+        return load_swarm_config()
     
     async def start_swarm(self):
         """Initialize all agents based on configuration"""
+        if not self.owns_agents:
+            return  # Warm agents shared from a SwarmRuntime
+        
         # Single specialized agents
         self.active_agents['data_collector'] = DataCollectorAgent("collector_001")
         self.active_agents['pattern_analyzer'] = PatternAnalyzerAgent("analyzer_001")
@@ -61,48 +136,134 @@ class SwarmManager:
             ValidatorAgent(f"validator_{i:03d}")
             for i in range(1, self.config.validator_agents + 1)
         ]
+        
+        # Processor and validator tasks are bounded by request_timeout; collection, analysis and
+        # reporting each run a whole stage in one task, so they get stage_timeout instead
+        for agent in self.active_agents['processors'] + self.active_agents['validators']:
+            agent.set_timeout(self.config.request_timeout, self.config.task_retries, self.config.retry_backoff)
+        for name in ('data_collector', 'pattern_analyzer', 'report_generator'):
+            self.active_agents[name].set_timeout(self.config.stage_timeout, self.config.task_retries, self.config.retry_backoff)
+        self.active_agents['data_collector'].set_request_timeout(self.config.request_timeout)
+        
+        # CPU-bound agents share one execution backend (inline or process pool)
+        self.backend = create_backend(
+            self.config.execution_backend,
+            max_workers=self.config.backend_workers,
+            batch_size=self.config.backend_batch_size
+        )
+        self.active_agents['pattern_analyzer'].set_backend(self.backend)
+        for processor in self.active_agents['processors']:
+            processor.set_backend(self.backend)
+        
+        # Processors and validators share one content-addressed cache across runs
+        if self.config.result_cache:
+            self.result_cache = ResultCache(
+                self.config.cache_path,
+                max_entries=self.config.cache_max_entries,
+                max_bytes=self.config.cache_max_bytes
+            )
+            for agent in self.active_agents['processors'] + self.active_agents['validators']:
+                agent.set_cache(self.result_cache)
+        
+        if self.config.state_endpoint:
+            self.state_server = await serve_state(self.snapshot, self.config.state_endpoint)
+    
+    async def stop_swarm(self):
+        """Release execution backend resources such as worker processes, and the ledger's temporary spill file"""
+        if self.owns_agents and self.backend is not None:
+            self.backend.shutdown()
+            self.backend = None
+        if self.owns_agents and self.result_cache is not None:
+            self.result_cache.close()
+            self.result_cache = None
+        if self.state_server is not None:
+            self.state_server.close()
+            await self.state_server.wait_closed()
+            self.state_server = None
+        self.task_ledger.close()
     
-    async def execute_workflow(self) -> WorkflowResult:
-        """Execute the complete workflow as defined in claude-flow config"""
+    async def execute_workflow(self, parameters: Optional[Dict[str, Any]] = None, resume: bool = False) -> WorkflowResult:
+        """Execute the complete workflow as defined in claude-flow config
+        
+        parameters are passed to the data collector (e.g. a municipality filter).
+        With checkpoint_path configured, resume skips appeals an earlier run
+        already processed and validated; a second workflow on the same
+        checkpoint file while one is running fails instead of clobbering it.
+        """
         self.workflow_start_time = time.time()
-        workflow_id = f"workflow_{int(self.workflow_start_time)}"
+        workflow_id = f"workflow_{int(self.workflow_start_time)}_{next(_workflow_counter):04d}"
+        self.checkpoint = None
         
         try:
+            self.checkpoint = self._open_checkpoint(resume)
+            
             # Following the data flow from swarm-config.yml:
             # collector → analyzer → processor_swarm → validator → reporter
             
             # 1. Data Collection
-            property_records, appeal_records = await self._execute_data_collection()
+            property_records, appeal_records = await self._execute_data_collection(parameters)
             
             # 2. Pattern Analysis
-            patterns = await self._execute_pattern_analysis({
-                'property_records': [record.model_dump() for record in property_records],
-                'appeal_records': [record.model_dump() for record in appeal_records]
-            })
+            dataset = RecordDataset.from_records(property_records, appeal_records) if self.config.columnar_dataset else None
+            if dataset is not None:
+                analysis_data = {'dataset': dataset}
+            elif self.config.zero_copy_handoff:
+                analysis_data = {
+                    'property_records': property_records,
+                    'appeal_records': appeal_records
+                }
+            else:
+                analysis_data = {
+                    'property_records': [record_dict(record) for record in property_records],
+                    'appeal_records': [record_dict(record) for record in appeal_records]
+                }
+            patterns = await self._execute_pattern_analysis(analysis_data)
             
-            # 3. Parallel Processing (processor swarm)
-            processing_results = await self._execute_processing(appeal_records)
+            # 3. Parallel Processing (processor swarm), joined against a property index
+            property_index = PropertyIndex(property_records)
+            if self.config.shard_workers:
+                # 3-4. Processing and validation fanned out to shard workers by property_id
+                processing_results, validation_result = await self._execute_sharded(appeal_records, property_index)
+            else:
+                processing_results = await self._execute_processing(appeal_records, property_index)
+                
+                # 4. Consensus Validation
+                validation_result = await self._execute_validation(processing_results)
             
-            # 4. Consensus Validation
-            validation_result = await self._execute_validation(processing_results)
+            # 4b. Feedback loop: validator → processor corrections for flagged appeals only
+            processing_results, validation_result = await self._execute_corrections(
+                appeal_records, property_index, processing_results, validation_result
+            )
+            
+            # 4c. Human handoff for cases still uncertain after corrections
+            handed_off = await self._execute_handoff(
+                appeal_records, property_index, processing_results, validation_result
+            )
             
             # 5. Report Generation
             report = await self._execute_report_generation({
                 'property_records': property_records,
                 'appeal_records': appeal_records,
+                'dataset': dataset,
                 'processing_results': processing_results,
                 'validation_result': validation_result,
                 'patterns': patterns
             })
             
+            if self.checkpoint is not None:
+                self.checkpoint.mark_complete()
+            if self.result_cache is not None:
+                self.result_cache.flush()
+            
             execution_time = time.time() - self.workflow_start_time
+            failed_tasks = sum(1 for result in processing_results if result.status == TaskStatus.FAILED)
             
             return WorkflowResult(
                 workflow_id=workflow_id,
                 success=True,
                 total_tasks=len(appeal_records) + 4,  # Appeals + 4 coordination tasks
-                completed_tasks=len(appeal_records) + 4,
-                failed_tasks=0,
+                completed_tasks=len(appeal_records) + 4 - failed_tasks,
+                failed_tasks=failed_tasks,
                 execution_time=execution_time,
                 results={
                     'property_records': len(property_records),
@@ -110,10 +271,154 @@ class SwarmManager:
                     'patterns': patterns,
                     'processing_results': len(processing_results),
                     'validation_confidence': validation_result.confidence,
+                    'human_handoff': handed_off,
+                    'stage_timing': self.timing_report()['stages'],
                     'report': report
                 }
             )
+        
+        except Exception as e:
+            execution_time = time.time() - self.workflow_start_time
+            results = {}
+            if self.checkpoint is not None:
+                # Persist whatever finished so a resumed run can pick up from here
+                self.checkpoint.flush(sync=True)
+                results = {
+                    'checkpoint': str(self.checkpoint.path),
+                    'processed_appeals': len(self.checkpoint.processed),
+                    'validated_appeals': len(self.checkpoint.validated)
+                }
+            return WorkflowResult(
+                workflow_id=workflow_id,
+                success=False,
+                total_tasks=0,
+                completed_tasks=0,
+                failed_tasks=1,
+                execution_time=execution_time,
+                results=results,
+                errors=[str(e)]
+            )
+        
+        finally:
+            if self.checkpoint is not None:
+                _open_checkpoints.discard(self.checkpoint.path.resolve())
+    
+    def _open_checkpoint(self, resume: bool) -> Optional[WorkflowCheckpoint]:
+        """Open the configured checkpoint, loading prior progress when resuming"""
+        if not self.config.checkpoint_path:
+            return None
+        path = Path(self.config.checkpoint_path).resolve()
+        if path in _open_checkpoints:
+            raise RuntimeError(f"Checkpoint {path} is in use by another running workflow; give concurrent workflows their own checkpoint_path")
+        checkpoint = WorkflowCheckpoint(self.config.checkpoint_path, self.config.checkpoint_interval)
+        if resume:
+            checkpoint.load()
+        else:
+            checkpoint.reset()
+        _open_checkpoints.add(path)
+        return checkpoint
+    
+    def autoscaler(self) -> Optional[PoolAutoscaler]:
+        """Processor pool autoscaler for one processing run, if autoscaling is enabled"""
+        if not self.config.autoscale:
+            return None
+        # Collector, analyzer and reporter plus the validators take the rest of max_agents
+        max_size = max(self.config.max_agents - 3 - self.config.validator_agents, self.config.min_processor_agents)
+        return PoolAutoscaler(
+            self.active_agents['processors'],
+            self._new_processor,
+            min_size=self.config.min_processor_agents,
+            max_size=max_size,
+            target_latency=self.config.autoscale_target_latency,
+            interval=self.config.autoscale_interval
+        )
+    
+    def _new_processor(self) -> ProcessorAgent:
+        """A processor configured like those created by start_swarm"""
+        processor = ProcessorAgent(f"processor_{next(self.processor_ids):03d}")
+        if self.backend is not None:
+            processor.set_backend(self.backend)
+        processor.set_cache(self.result_cache)
+        processor.set_timeout(self.config.request_timeout, self.config.task_retries, self.config.retry_backoff)
+        return processor
+    
+    def all_agents(self) -> List[Any]:
+        """Every active agent, flattening the processor and validator pools"""
+        agents = []
+        for entry in self.active_agents.values():
+            agents.extend(entry if isinstance(entry, list) else [entry])
+        return agents
+    
+    def agent_states(self) -> Dict[str, AgentInfo]:
+        """Current status and last heartbeat of every agent"""
+        return {agent.agent_id: agent.info() for agent in self.all_agents()}
+    
+    def detect_stragglers(self) -> List[str]:
+        """IDs of busy agents whose heartbeat is overdue"""
+        monitor = self.monitor or AgentMonitor(self.config.straggler_factor, self.config.straggler_min_seconds)
+        return [agent.agent_id for agent in monitor.stragglers(self.all_agents())]
+    
+    def snapshot(self) -> SwarmState:
+        """Live SwarmState: counters, queue depth, throughput and per-agent utilization"""
+        return self.state.snapshot(self.all_agents())
+    
+    def _record_tasks(self, stage: str, results: List[TaskResult]):
+        """Record completed task results in the ledger and fold their timings into the histograms"""
+        self.task_ledger.record(stage, results)
+        self.timings.record(stage, results)
+        self.state.record(results)
+    
+    def timing_report(self) -> Dict[str, Any]:
+        """Queue-wait and run-time p50/p95/p99 per stage and per agent"""
+        return self.timings.report()
+    
+    async def stream_workflow(
+        self,
+        source: Optional[AsyncIterable[Union[PropertyRecord, AppealRecord]]] = None
+    ) -> AsyncIterator[TaskResult]:
+        """Run the workflow as a streaming pipeline, yielding recommendations as they are produced
+        
+        If source is given it replaces the data collector and must yield each
+        property record before any appeal that references it.
+        """
+        pipeline = StreamingPipeline(self, source)
+        self.last_pipeline = pipeline
+        async for result in pipeline.stream():
+            yield result
+    
+    async def execute_streaming_workflow(
+        self,
+        source: Optional[AsyncIterable[Union[PropertyRecord, AppealRecord]]] = None
+    ) -> WorkflowResult:
+        """Execute the workflow in streaming mode with bounded memory"""
+        self.workflow_start_time = time.time()
+        workflow_id = f"workflow_{int(self.workflow_start_time)}_{next(_workflow_counter):04d}"
+        
+        try:
+            async for _ in self.stream_workflow(source):
+                pass
+            
+            pipeline = self.last_pipeline
+            execution_time = time.time() - self.workflow_start_time
+            appeal_count = pipeline.analysis.appeal_count
             
+            return WorkflowResult(
+                workflow_id=workflow_id,
+                success=True,
+                total_tasks=appeal_count + 4,
+                completed_tasks=pipeline.processed_count - pipeline.failed_count + 4,
+                failed_tasks=pipeline.failed_count,
+                execution_time=execution_time,
+                results={
+                    'property_records': pipeline.analysis.property_count,
+                    'appeal_records': appeal_count,
+                    'patterns': pipeline.patterns,
+                    'processing_results': pipeline.processed_count,
+                    'validation_confidence': pipeline.validation_result.confidence,
+                    'report': pipeline.report
+                }
+            )
+        
         except Exception as e:
             execution_time = time.time() - self.workflow_start_time
             return WorkflowResult(
@@ -126,7 +431,7 @@ class SwarmManager:
                 errors=[str(e)]
             )
     
-    async def _execute_data_collection(self) -> Tuple[List[PropertyRecord], List[AppealRecord]]:
+    async def _execute_data_collection(self, parameters: Optional[Dict[str, Any]] = None) -> Tuple[List[PropertyRecord], List[AppealRecord]]:
         """Execute data collection using the data collector agent"""
         from .models import WorkflowTask
         
@@ -134,22 +439,36 @@ class SwarmManager:
         task = WorkflowTask(
             task_id="T001_data_collection",
             task_type="data_collection",
-            parameters={"source": "lackawanna"}
+            parameters={
+                "source": "lackawanna",
+                **(parameters or {}),
+                "handoff": "reference" if self.config.zero_copy_handoff else "dict"
+            }
         )
         
-        result = await collector.execute_task(task)
-        self.completed_tasks.append(result)
+        result = await collector.run_task(task)
+        self._record_tasks("collection", [result])
+        if result.status == TaskStatus.FAILED:
+            raise RuntimeError(f"Data collection failed: {result.error_message}")
         
-        # Convert back to model objects
-        property_records = [
-            PropertyRecord(**record) 
-            for record in result.result.get('property_records', [])
-        ]
-        appeal_records = [
-            AppealRecord(**record) 
-            for record in result.result.get('appeal_records', [])
-        ]
+        if self.config.zero_copy_handoff:
+            # Already validated PropertyRecord/AppealRecord instances
+            property_records = result.result.get('property_records', [])
+            appeal_records = result.result.get('appeal_records', [])
+        else:
+            # Convert back to model objects
+            property_records = [
+                PropertyRecord(**record) 
+                for record in result.result.get('property_records', [])
+            ]
+            appeal_records = [
+                AppealRecord(**record) 
+                for record in result.result.get('appeal_records', [])
+            ]
         
+        if self.config.compact_records:
+            # Validated once above; the rest of the workflow carries slotted rows
+            return compact_properties(property_records), compact_appeals(appeal_records)
         return property_records, appeal_records
     
     async def _execute_pattern_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -163,70 +482,335 @@ class SwarmManager:
             parameters={"data": data}
         )
         
-        result = await analyzer.execute_task(task)
-        self.completed_tasks.append(result)
+        result = await analyzer.run_task(task)
+        self._record_tasks("analysis", [result])
         
         return result.result
     
-    async def _execute_processing(self, appeal_records: List[AppealRecord]) -> List[TaskResult]:
-        """Execute parallel processing using the processor swarm"""
+    async def _execute_processing(
+        self,
+        appeal_records: List[AppealRecord],
+        property_index: Optional[PropertyIndex] = None,
+        correction_round: int = 0
+    ) -> List[TaskResult]:
+        """Execute processing through a bounded work queue feeding the processor swarm"""
         from .models import WorkflowTask
         
-        processors = self.active_agents['processors']
-        tasks = []
+        scheduler = WorkScheduler(
+            self.active_agents['processors'],
+            queue_size=self.config.queue_size,
+            max_in_flight=self.config.max_in_flight,
+            monitor=self.monitor,
+            autoscaler=self.autoscaler()
+        )
+        
+        if property_index is None:
+            property_index = PropertyIndex()
+        
+        join = property_index.view if self.config.zero_copy_handoff else property_index.join
         
-        # Distribute appeals across processors
+        # Appeals a resumed run already processed keep their checkpointed results
+        results = []
+        checkpoint = self.checkpoint
+        if checkpoint is not None and not correction_round and checkpoint.processed:
+            results = [checkpoint.processed[appeal.appeal_id] for appeal in appeal_records if appeal.appeal_id in checkpoint.processed]
+            appeal_records = [appeal for appeal in appeal_records if appeal.appeal_id not in checkpoint.processed]
+        
+        # Urgent appeals (imminent hearings, large dollar deltas) go first, fairly across priority classes
+        today = date.today()
+        prioritized = FairPriorityQueue()
         for i, appeal in enumerate(appeal_records):
-            processor = processors[i % len(processors)]
-            task = WorkflowTask(
-                task_id=f"T003_process_appeal_{i:03d}",
+            priority = appeal_priority(appeal, property_index.get(appeal.property_id), today)
+            prioritized.push(priority, (i, appeal, priority))
+        
+        # Appeals are dispatched in chunks, one task and one compact result per chunk;
+        # corrections are few and targeted, so they stay one task per appeal
+        batch_size = 1 if correction_round else max(self.config.process_batch_size, 1)
+        batch_chunks: Dict[str, list] = {}
+        task_prefix = f"T003_correction_{correction_round}" if correction_round else "T003_process_appeal"
+        
+        def appeal_task(prefix: str, i: int, appeal: AppealRecord, priority) -> WorkflowTask:
+            return WorkflowTask(
+                task_id=f"{prefix}_{i:03d}",
                 task_type="process_appeal",
-                parameters={"appeal": appeal.model_dump()}
+                parameters=(
+                    {"appeal": join(appeal), "correction_round": correction_round}
+                    if correction_round else {"appeal": join(appeal)}
+                ),
+                priority=priority
             )
-            tasks.append(processor.execute_task(task))
         
-        # Execute all processing tasks in parallel
-        results = await asyncio.gather(*tasks)
-        self.completed_tasks.extend(results)
+        def batch_task(index: int, chunk) -> WorkflowTask:
+            task_id = f"T003_process_batch_{index:03d}"
+            batch_chunks[task_id] = chunk
+            return WorkflowTask(
+                task_id=task_id,
+                task_type="process_appeal_batch",
+                parameters={"appeals": [join(appeal) for _, appeal, _ in chunk]},
+                priority=max(priority for _, _, priority in chunk)
+            )
+        
+        def build_tasks():
+            # Tasks are built lazily so only queue_size of them exist ahead of the agents
+            if batch_size == 1:
+                for entry in prioritized.drain():
+                    yield appeal_task(task_prefix, *entry)
+                return
+            
+            chunk = []
+            batches = 0
+            for entry in prioritized.drain():
+                chunk.append(entry)
+                if len(chunk) == batch_size:
+                    yield batch_task(batches, chunk)
+                    batches += 1
+                    chunk = []
+            if chunk:
+                yield batch_task(batches, chunk)
+        
+        def collect(result: TaskResult):
+            results.append(result)
+            appeal_id = result.result.get("appeal_id") if result.result else None
+            if checkpoint is not None and appeal_id is not None:
+                checkpoint.record_processed(appeal_id, result)
         
+        # A batch that times out or fails is retried one appeal per task, so a
+        # slow or bad appeal fails alone instead of taking its chunk with it
+        retries = []
+        with self.state.tracking(scheduler):
+            async for result in scheduler.stream(build_tasks()):
+                self._record_tasks("processing", [result])
+                chunk = batch_chunks.pop(result.task_id, None)
+                if chunk is None:
+                    collect(result)
+                elif result.status != TaskStatus.COMPLETED and len(chunk) > 1:
+                    retries.extend(chunk)
+                else:
+                    for appeal_result in expand_batch_result(result, [appeal.appeal_id for _, appeal, _ in chunk]):
+                        collect(appeal_result)
+            
+            if retries:
+                retry_tasks = (appeal_task("T003_process_retry", *entry) for entry in retries)
+                async for result in scheduler.stream(retry_tasks):
+                    self._record_tasks("processing", [result])
+                    collect(result)
+        
+        if checkpoint is not None:
+            checkpoint.flush(sync=True)
         return results
     
     async def _execute_validation(self, processing_results: List[TaskResult]) -> ValidationResult:
-        """Execute consensus validation using validator agents"""
-        from .models import WorkflowTask
+        """Execute sharded consensus validation using validator agents"""
+        checkpoint = self.checkpoint
+        engine = self._consensus_engine()
         
-        validators = self.active_agents['validators']
-        validation_tasks = []
+        # Timed-out tasks produced no recommendation to validate
+        processing_results = [result for result in processing_results if result.status == TaskStatus.COMPLETED]
         
-        # All validators validate the same results for consensus
-        for i, validator in enumerate(validators):
-            task = WorkflowTask(
-                task_id=f"T004_validation_{i:03d}",
-                task_type="validation",
-                parameters={"results": [result.result for result in processing_results]}
+        if checkpoint is not None and checkpoint.validation is not None:
+            # Resume from the checkpointed consensus and validate only what it does not cover
+            self._restore_engine(engine, checkpoint.validation)
+            processing_results = [
+                result for result in processing_results
+                if result.result.get("appeal_id") not in checkpoint.validated
+            ]
+        
+        # Each result is validated by one validator, plus a sampled cross-check overlap
+        validation_results = await engine.validate([result.result for result in processing_results])
+        self._record_tasks("validation", validation_results)
+        
+        validation_result = engine.result()
+        if checkpoint is not None:
+            checkpoint.record_validation(
+                [result.result.get("appeal_id") for result in processing_results],
+                validation_result
             )
-            validation_tasks.append(validator.execute_task(task))
+        return validation_result
+    
+    async def _execute_sharded(
+        self,
+        appeal_records: List[AppealRecord],
+        property_index: PropertyIndex
+    ) -> Tuple[List[TaskResult], ValidationResult]:
+        """Process and validate on shard workers, merging their consensus snapshots
         
-        # Execute all validations in parallel
-        validation_results = await asyncio.gather(*validation_tasks)
-        self.completed_tasks.extend(validation_results)
+        The workers' batch and validation tasks are recorded like local ones.
+        With a checkpoint, appeals an earlier run already validated are not
+        sent again, and shard results are checkpointed as they come back.
+        """
+        checkpoint = self.checkpoint
+        engine = self._consensus_engine()
+        results = []
+        if checkpoint is not None and checkpoint.validation is not None:
+            self._restore_engine(engine, checkpoint.validation)
+            results = [checkpoint.processed[appeal.appeal_id] for appeal in appeal_records if appeal.appeal_id in checkpoint.validated]
+            appeal_records = [appeal for appeal in appeal_records if appeal.appeal_id not in checkpoint.validated]
+        if not appeal_records:
+            return results, engine.result()
         
-        # Calculate consensus
-        confidence_scores = [
-            result.result['validation_result']['confidence'] 
-            for result in validation_results
-        ]
-        consensus_confidence = sum(confidence_scores) / len(confidence_scores)
+        coordinator = ShardCoordinator(self.config.shard_workers, self.config.shard_count)
+        processing_results, shard_validations, tasks = await coordinator.run(appeal_records, property_index)
+        for stage, stage_tasks in tasks.items():
+            self._record_tasks(stage, stage_tasks)
         
-        return ValidationResult(
-            confidence=consensus_confidence,
-            validated=consensus_confidence >= 0.7,
-            consensus_score=consensus_confidence,
-            validator_count=len(validators)
+        for validation in shard_validations:
+            engine.accumulator.merge_snapshot(validation)
+            engine.flagged.update(validation.details.get("flagged_appeals", {}))
+            engine.disputed.update(validation.details.get("disputed_appeals", {}))
+        
+        validation_result = engine.result()
+        if checkpoint is not None:
+            for result in processing_results:
+                if result.result:
+                    checkpoint.record_processed(result.result["appeal_id"], result)
+            checkpoint.record_validation(
+                [result.result["appeal_id"] for result in processing_results if result.status == TaskStatus.COMPLETED],
+                validation_result
+            )
+        return results + processing_results, validation_result
+    
+    def _consensus_engine(self, flag_low_confidence: bool = True) -> ConsensusEngine:
+        """Consensus engine over the validator pool, flagging results below correction_threshold"""
+        return ConsensusEngine(
+            self.active_agents['validators'],
+            overlap=self.config.validation_overlap,
+            flag_below=self.config.correction_threshold if flag_low_confidence else None
         )
     
+    @staticmethod
+    def _restore_engine(engine: ConsensusEngine, validation_result: ValidationResult):
+        """Seed a consensus engine with an earlier snapshot, including its outstanding flags"""
+        engine.accumulator = ConsensusAccumulator.from_result(validation_result)
+        engine.flagged = dict(validation_result.details.get("flagged_appeals", {}))
+        engine.disputed = dict(validation_result.details.get("disputed_appeals", {}))
+    
+    async def _execute_corrections(
+        self,
+        appeal_records: List[AppealRecord],
+        property_index: PropertyIndex,
+        processing_results: List[TaskResult],
+        validation_result: ValidationResult
+    ) -> Tuple[List[TaskResult], ValidationResult]:
+        """Re-process only the appeals validators flagged, re-validating just the corrections"""
+        flagged = validation_result.details.get("flagged_appeals", {})
+        if not flagged or self.config.correction_threshold is None:
+            return processing_results, validation_result
+        
+        engine = self._consensus_engine()
+        self._restore_engine(engine, validation_result)
+        
+        # A resumed run does not re-correct appeals an earlier run already corrected
+        already_corrected = self.checkpoint.corrected if self.checkpoint is not None else set()
+        positions = {
+            result.result.get("appeal_id"): i
+            for i, result in enumerate(processing_results)
+            if result.result.get("appeal_id") in flagged and result.result.get("appeal_id") not in already_corrected
+        }
+        
+        rounds_run = 0
+        for correction_round in range(1, self.config.max_correction_rounds + 1):
+            flagged_ids = set(engine.flagged) & positions.keys()
+            if not flagged_ids:
+                break
+            rounds_run = correction_round
+            
+            appeals = [appeal for appeal in appeal_records if appeal.appeal_id in flagged_ids]
+            corrected = await self._execute_processing(appeals, property_index, correction_round)
+            
+            previous = engine.retract(list(flagged_ids))
+            validation_tasks = await engine.validate([result.result for result in corrected])
+            self._record_tasks("correction", validation_tasks)
+            
+            improved = False
+            for result in corrected:
+                appeal_id = result.result.get("appeal_id")
+                processing_results[positions[appeal_id]] = result
+                if result.result.get("confidence_score", 0.0) > previous.get(appeal_id, 0.0):
+                    improved = True
+            
+            if self.checkpoint is not None:
+                self.checkpoint.record_validation([], engine.result(), corrected_ids=flagged_ids)
+            
+            # Deterministic re-runs that change nothing will not converge further
+            if not improved:
+                break
+        
+        final = engine.result()
+        final.details["correction_rounds"] = rounds_run
+        return processing_results, final
+    
+    async def _execute_handoff(
+        self,
+        appeal_records: List[AppealRecord],
+        property_index: PropertyIndex,
+        processing_results: List[TaskResult],
+        validation_result: ValidationResult
+    ) -> int:
+        """Queue low-confidence and disputed appeals for human review without blocking the run"""
+        flagged = validation_result.details.get("flagged_appeals", {})
+        disputed = validation_result.details.get("disputed_appeals", {})
+        if not flagged and not disputed:
+            return 0
+        
+        recommendations = {
+            result.result.get("appeal_id"): result.result.get("recommendation")
+            for result in processing_results
+            if result.result.get("appeal_id") in flagged or result.result.get("appeal_id") in disputed
+        }
+        
+        already_handed_off = self.checkpoint.handed_off if self.checkpoint is not None else set()
+        handed_off = []
+        for appeal in appeal_records:
+            if appeal.appeal_id in already_handed_off:
+                continue
+            if appeal.appeal_id in disputed:
+                reason, confidence = "validator_disagreement", disputed[appeal.appeal_id]
+            elif appeal.appeal_id in flagged:
+                reason, confidence = "low_confidence", flagged[appeal.appeal_id]
+            else:
+                continue
+            
+            record = property_index.get(appeal.property_id)
+            self.handoff_queue.push(HandoffCase(
+                appeal_id=appeal.appeal_id,
+                property_id=appeal.property_id,
+                reason=reason,
+                confidence=confidence,
+                recommendation=recommendations.get(appeal.appeal_id),
+                dollar_at_stake=max(record.assessed_value - appeal.requested_value, 0) if record else 0,
+                hearing_date=appeal.hearing_date
+            ))
+            handed_off.append(appeal.appeal_id)
+        
+        if self.checkpoint is not None:
+            self.checkpoint.record_handoff(handed_off)
+        return len(handed_off)
+    
     async def _execute_report_generation(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute report generation using the report generator agent"""
+        dataset = data.get('dataset')
+        if dataset is None:
+            return await self._generate_partial_report(
+                processed_appeals=len(data.get('processing_results', [])),
+                total_appeals=len(data.get('appeal_records', [])),
+                sample_appeals=data.get('processing_results', [])[:5]
+            )
+        
+        return await self._generate_partial_report(
+            processed_appeals=len(data.get('processing_results', [])),
+            total_appeals=len(dataset.appeals),
+            sample_appeals=data.get('processing_results', [])[:5],
+            average_reduction=dataset.average_requested_reduction()
+        )
+    
+    async def _generate_partial_report(
+        self,
+        processed_appeals: int,
+        total_appeals: int,
+        sample_appeals: List[Any],
+        average_reduction: float = 15000  # Mock calculation unless computed from a dataset
+    ) -> Dict[str, Any]:
+        """Generate the partial report from counts and a handful of sample results"""
         from .models import WorkflowTask
         
         reporter = self.active_agents['report_generator']
@@ -236,16 +820,16 @@ class SwarmManager:
             task_id="T005_partial_report",
             task_type="generate_partial_report",
             parameters={"data": {
-                "processed_appeals": len(data.get('processing_results', [])),
-                "total_appeals": len(data.get('appeal_records', [])),
+                "processed_appeals": processed_appeals,
+                "total_appeals": total_appeals,
                 "approval_rate": 0.3,  # Mock calculation
-                "average_reduction": 15000,  # Mock calculation
-                "sample_appeals": data.get('processing_results', [])[:5]
+                "average_reduction": average_reduction,
+                "sample_appeals": sample_appeals
             }}
         )
         
-        partial_result = await reporter.execute_task(partial_task)
-        self.completed_tasks.append(partial_result)
+        partial_result = await reporter.run_task(partial_task)
+        self._record_tasks("reporting", [partial_result])
         
         return {
             'partial_report': partial_result.result,
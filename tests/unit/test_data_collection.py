@@ -4,6 +4,9 @@ from unittest.mock import Mock, AsyncMock, patch
 import pandas as pd
 from src.data_collection.web_scraper import LackawannaDataCollector
 from src.data_collection.models import PropertyRecord, AppealRecord
+from src.data_collection.property_index import PropertyIndex, JoinedAppeal
+from src.data_collection.dataset import RecordDataset, DictionaryColumn, street_of
+from src.data_collection.records import PropertyRow, AppealRow, compact_appeals, compact_properties, export_record
 
 
 class TestLackawannaDataCollector:
@@ -136,4 +139,223 @@ class TestLackawannaDataCollector:
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 1
         assert 'property_id' in df.columns
-        assert df.iloc[0]['property_id'] == '12-345-67'
\ No newline at end of file
+        assert df.iloc[0]['property_id'] == '12-345-67'
+        assert df['property_type'].dtype == 'category'
+    
+    @pytest.mark.asyncio
+    async def test_collect_dataset(self, collector, sample_property_data, sample_appeal_data):
+        async def request(endpoint):
+            return [sample_appeal_data] if endpoint == '/appeals' else sample_property_data
+        
+        with patch.object(collector, '_make_request', side_effect=request), \
+                patch('src.data_collection.web_scraper.PropertyRecord') as property_record, \
+                patch('src.data_collection.web_scraper.AppealRecord') as appeal_record:
+            dataset = await collector.collect_dataset(['12-345-67'])
+        
+        property_record.assert_not_called()
+        appeal_record.assert_not_called()
+        assert len(dataset.properties) == 1
+        assert dataset.properties.row(0)['assessed_value'] == 125000
+        assert dataset.property_records()[0] == PropertyRecord(**sample_property_data)
+        assert len(dataset.appeals) == 1
+        assert dataset.appeals['reason'].value_counts() == {'Overassessment': 1}
+
+
+class TestPropertyIndex:
+    
+    @pytest.fixture
+    def property_record(self):
+        return PropertyRecord(
+            property_id='12-345-67',
+            address='123 Main St, Scranton, PA',
+            assessed_value=125000,
+            market_value=150000,
+            owner_name='John Doe',
+            property_type='Residential'
+        )
+    
+    def test_join_enriches_appeal(self, property_record):
+        index = PropertyIndex([property_record])
+        appeal = AppealRecord(
+            appeal_id='AP-2024-001',
+            property_id='12-345-67',
+            appeal_date='2024-01-15',
+            status='Pending',
+            requested_value=100000,
+            reason='Overassessment'
+        )
+        
+        joined = index.join(appeal)
+        
+        assert joined['assessed_value'] == 125000
+        assert joined['market_value'] == 150000
+        assert joined['requested_value'] == 100000
+        assert index.unmatched_appeals == 0
+    
+    def test_join_unmatched_appeal(self, property_record):
+        index = PropertyIndex([property_record])
+        appeal = AppealRecord(
+            appeal_id='AP-2024-002',
+            property_id='99-999-99',
+            appeal_date='2024-01-15',
+            status='Pending',
+            requested_value=100000,
+            reason='Overassessment'
+        )
+        
+        joined = index.join(appeal)
+        
+        assert 'assessed_value' not in joined
+        assert index.unmatched_appeals == 1
+        assert '12-345-67' in index
+        assert len(index) == 1
+    
+    def test_view_reads_through_without_copying(self, property_record):
+        index = PropertyIndex([property_record])
+        appeal = AppealRecord(
+            appeal_id='AP-2024-001',
+            property_id='12-345-67',
+            appeal_date='2024-01-15',
+            status='Pending',
+            requested_value=100000,
+            reason='Overassessment'
+        )
+        
+        view = index.view(appeal)
+        
+        assert isinstance(view, JoinedAppeal)
+        assert view.appeal is appeal
+        assert view.property is property_record
+        assert view['assessed_value'] == 125000
+        assert view.get('requested_value') == 100000
+        assert dict(view) == index.join(appeal)
+
+
+class TestCompactRecords:
+    
+    @pytest.fixture
+    def records(self):
+        property_record = PropertyRecord(
+            property_id='12-345-67',
+            address='123 Main St',
+            assessed_value=125000,
+            market_value=150000,
+            owner_name='John Doe',
+            property_type='Residential'
+        )
+        appeal = AppealRecord(
+            appeal_id='AP-2024-001',
+            property_id='12-345-67',
+            appeal_date='2024-01-15',
+            status='Pending',
+            requested_value=100000,
+            reason='Overassessment',
+            hearing_date='2024-03-01'
+        )
+        return property_record, appeal
+    
+    def test_rows_round_trip_through_models(self, records):
+        property_record, appeal = records
+        
+        [property_row], [appeal_row] = compact_properties([property_record]), compact_appeals([appeal])
+        
+        assert not hasattr(property_row, '__dict__')
+        assert appeal_row.hearing_date == '2024-03-01'
+        assert export_record(property_row) == property_record
+        assert export_record(appeal_row) == appeal
+        assert export_record(appeal) is appeal
+        assert compact_appeals([appeal_row])[0] is appeal_row
+    
+    def test_rows_join_like_models(self, records):
+        property_record, appeal = records
+        index = PropertyIndex(compact_properties([property_record]))
+        
+        appeal_row = AppealRow.from_record(appeal)
+        
+        assert index.join(appeal_row) == PropertyIndex([property_record]).join(appeal)
+        assert dict(index.view(appeal_row)) == index.join(appeal_row)
+    
+    def test_export_validates_rows(self, records):
+        property_row = PropertyRow.from_record(records[0])
+        property_row.assessed_value = "not a number"
+        
+        with pytest.raises(ValueError):
+            property_row.to_record()
+
+
+class TestRecordDataset:
+    
+    @pytest.fixture
+    def records(self):
+        properties = [
+            PropertyRecord(
+                property_id=f'12-345-{i:02d}',
+                address=f'{i} Main St',
+                assessed_value=100000 + i * 1000,
+                market_value=110000,
+                owner_name='John Doe',
+                property_type='Commercial' if i % 3 == 0 else 'Residential'
+            )
+            for i in range(6)
+        ]
+        appeals = [
+            AppealRecord(
+                appeal_id=f'AP-2024-{i:03d}',
+                property_id=f'12-345-{i:02d}',
+                appeal_date='2024-01-15',
+                status='Pending',
+                requested_value=90000,
+                reason='Overassessment' if i % 2 else 'Clerical error',
+                final_value=95000 if i == 1 else None
+            )
+            for i in range(8)  # The last two have no collected property
+        ]
+        return properties, appeals
+    
+    def test_dictionary_encodes_low_cardinality_columns(self, records):
+        dataset = RecordDataset.from_records(*records)
+        
+        property_type = dataset.properties['property_type']
+        assert isinstance(property_type, DictionaryColumn)
+        assert property_type.codes.dtype == 'int8'
+        assert property_type.value_counts() == {'Commercial': 2, 'Residential': 4}
+        assert dataset.appeals['reason'].equals('Overassessment').sum() == 4
+        assert dataset.appeals['reason'].equals('Fraud').sum() == 0
+        assert dataset.properties['assessed_value'].dtype == 'int64'
+    
+    def test_round_trips_to_validated_records(self, records):
+        properties, appeals = records
+        dataset = RecordDataset.from_records(compact_properties(properties), compact_appeals(appeals))
+        
+        assert dataset.property_records() == properties
+        assert dataset.appeal_records() == appeals
+    
+    def test_joined_appeals_match_property_index(self, records):
+        properties, appeals = records
+        index = PropertyIndex(properties)
+        
+        joined = RecordDataset.from_records(properties, appeals).joined_appeals()
+        
+        for row, appeal in zip(joined.itertuples(), appeals):
+            expected = index.join(appeal)
+            assert row.appeal_id == expected['appeal_id']
+            if 'assessed_value' in expected:
+                assert row.assessed_value == expected['assessed_value']
+            else:
+                assert pd.isna(row.assessed_value)
+    
+    def test_later_duplicate_property_wins(self, records):
+        properties, appeals = records
+        updated = properties[0].model_copy(update={'assessed_value': 1})
+        
+        dataset = RecordDataset.from_records(properties + [updated], appeals[:1])
+        
+        assert dataset.property_positions().tolist() == [6]
+        assert RecordDataset.from_records([], appeals[:1]).property_positions().tolist() == [-1]
+    
+    def test_street_is_derived_from_address(self, records):
+        dataset = RecordDataset.from_records(*records)
+        
+        assert street_of('123 Main St, Scranton, PA') == 'Main St'
+        assert street_of('Rural Route 5') == 'Rural Route 5'
+        assert dataset.properties['street'].value_counts() == {'Main St': 6}
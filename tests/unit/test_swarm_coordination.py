@@ -1,22 +1,79 @@
 import pytest
 import asyncio
+import itertools
+import numpy as np
+import pandas as pd
+from datetime import date
 from unittest.mock import Mock, AsyncMock, patch
 from src.swarm_coordination.swarm_manager import SwarmManager
+from src.swarm_coordination.scheduler import WorkScheduler
+from src.swarm_coordination.pipeline import StreamingPipeline
+from src.swarm_coordination.batch_evaluation import evaluate_appeal_block, score_appeals
+from src.swarm_coordination.consensus import ConsensusEngine
+from src.swarm_coordination.handoff import HumanHandoffQueue
+from src.swarm_coordination.executors import ProcessPoolBackend, create_backend
+from src.swarm_coordination.metrics import LatencyHistogram
+from src.swarm_coordination.runtime import SwarmRuntime
+from src.swarm_coordination.ledger import TaskLedger
+from src.swarm_coordination.checkpoint import WorkflowCheckpoint
+from src.swarm_coordination.result_cache import ResultCache, content_key
+from src.swarm_coordination.sharding import LocalShardWorkers, ShardCoordinator, partition_appeals, shard_for
+from src.swarm_coordination.priority import FairPriorityQueue, appeal_priority
+from src.swarm_coordination.monitor import AgentMonitor
+from src.swarm_coordination.state import SwarmStateTracker
+from src.swarm_coordination.autoscaler import PoolAutoscaler
+from src.swarm_coordination.accumulators import HeavyHitters, PatternAccumulator, QuantileDigest, RunningMoments
+from src.swarm_coordination import swarm_manager as swarm_manager_module
 from src.swarm_coordination.agents import (
     DataCollectorAgent, 
     PatternAnalyzerAgent, 
     ProcessorAgent, 
     ValidatorAgent, 
-    ReportGeneratorAgent
+    ReportGeneratorAgent,
+    compute_pattern_totals,
+    expand_batch_result,
+    score_appeal
 )
 from src.swarm_coordination.models import (
     SwarmConfig, 
     TaskResult, 
     AgentStatus, 
     WorkflowTask,
-    ValidationResult
+    ValidationResult,
+    HandoffCase,
+    SwarmState
 )
 from src.data_collection.models import PropertyRecord, AppealRecord
+from src.data_collection.property_index import PropertyIndex
+from src.data_collection.records import PropertyRow, AppealRow
+from src.data_collection.dataset import RecordDataset
+
+
+def make_records(count):
+    """Matching property and appeal records, one appeal per property"""
+    properties = [
+        PropertyRecord(
+            property_id=f"12-345-{i:02d}",
+            address=f"{i} Main St",
+            assessed_value=150000,
+            market_value=140000,
+            owner_name="John Doe",
+            property_type="Residential"
+        )
+        for i in range(count)
+    ]
+    appeals = [
+        AppealRecord(
+            appeal_id=f"AP-2024-{i:03d}",
+            property_id=f"12-345-{i:02d}",
+            appeal_date="2024-01-15",
+            status="Pending",
+            requested_value=130000,
+            reason="Overassessment"
+        )
+        for i in range(count)
+    ]
+    return properties, appeals
 
 
 class TestSwarmManager:
@@ -69,6 +126,187 @@ class TestSwarmManager:
             )
         ]
     
+    @pytest.mark.asyncio
+    async def test_streaming_workflow_execution(self, swarm_manager, sample_property_records, sample_appeal_records):
+        await swarm_manager.start_swarm()
+        
+        async def source():
+            for record in sample_property_records + sample_appeal_records:
+                yield record
+        
+        result = await swarm_manager.execute_streaming_workflow(source())
+        
+        assert result.success == True
+        assert result.results['property_records'] == 2
+        assert result.results['appeal_records'] == 1
+        assert result.results['processing_results'] == 1
+        assert result.results['report']['report_status'] == 'partial_generated'
+    
+    @pytest.mark.asyncio
+    async def test_streaming_yields_before_collection_finishes(self, swarm_manager):
+        await swarm_manager.start_swarm()
+        collection_finished = False
+        
+        async def source():
+            nonlocal collection_finished
+            for i in range(50):
+                yield AppealRecord(
+                    appeal_id=f"AP-2024-{i:03d}",
+                    property_id="12-345-67",
+                    appeal_date="2024-01-15",
+                    status="Pending",
+                    requested_value=100000,
+                    reason="Overassessment"
+                )
+                await asyncio.sleep(0.01)
+            collection_finished = True
+        
+        stream = swarm_manager.stream_workflow(source())
+        first = await stream.__anext__()
+        
+        assert first.status == "completed"
+        assert collection_finished == False
+        await stream.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_processing_joins_property_values(self, swarm_manager):
+        await swarm_manager.start_swarm()
+        property_index = PropertyIndex([
+            PropertyRecord(
+                property_id="12-345-67",
+                address="123 Main St",
+                assessed_value=100000,
+                market_value=100000,
+                owner_name="John Doe",
+                property_type="Residential"
+            )
+        ])
+        appeal = AppealRecord(
+            appeal_id="AP-2024-001",
+            property_id="12-345-67",
+            appeal_date="2024-01-15",
+            status="Pending",
+            requested_value=90000,
+            reason="Overassessment"
+        )
+        
+        results = await swarm_manager._execute_processing([appeal], property_index)
+        
+        assert results[0].result["recommendation"] == "Approve reduction"
+    
+    @pytest.mark.asyncio
+    async def test_corrections_reprocess_only_flagged_appeals(self, swarm_manager):
+        await swarm_manager.start_swarm()
+        appeals = [
+            AppealRecord(
+                appeal_id=f"AP-2024-{i:03d}",
+                property_id="12-345-67",
+                appeal_date="2024-01-15",
+                status="Pending",
+                requested_value=50000 if i < 2 else 90000,
+                reason="Overassessment"
+            )
+            for i in range(6)
+        ]
+        property_index = PropertyIndex([
+            PropertyRecord(
+                property_id="12-345-67",
+                address="123 Main St",
+                assessed_value=100000,
+                market_value=100000,
+                owner_name="John Doe",
+                property_type="Residential"
+            )
+        ])
+        
+        processing_results = await swarm_manager._execute_processing(appeals, property_index)
+        validation_result = await swarm_manager._execute_validation(processing_results)
+        assert set(validation_result.details["flagged_appeals"]) == {"AP-2024-000", "AP-2024-001"}
+        
+        reprocessed = []
+        
+        async def improving_process(self, appeal_data):
+            reprocessed.append(appeal_data.get("appeal_id"))
+            return {"recommendation": "Partial reduction", "confidence_score": 0.8, "reasoning": "Reviewed"}
+        
+        with patch.object(ProcessorAgent, '_process_appeal', improving_process):
+            results, corrected = await swarm_manager._execute_corrections(
+                appeals, property_index, processing_results, validation_result
+            )
+        
+        assert sorted(reprocessed) == ["AP-2024-000", "AP-2024-001"]
+        assert corrected.details["flagged_appeals"] == {}
+        assert corrected.details["results_count"] == 6
+        assert corrected.confidence == pytest.approx((4 * 0.85 + 2 * 0.8) / 6)
+        assert results[0].result["correction_round"] == 1
+        assert len(results) == 6
+    
+    @pytest.mark.asyncio
+    async def test_uncertain_appeals_handed_off(self, swarm_manager):
+        await swarm_manager.start_swarm()
+        property_index = PropertyIndex([
+            PropertyRecord(
+                property_id="12-345-67",
+                address="123 Main St",
+                assessed_value=100000,
+                market_value=100000,
+                owner_name="John Doe",
+                property_type="Residential"
+            )
+        ])
+        appeals = [
+            AppealRecord(
+                appeal_id="AP-2024-001",
+                property_id="12-345-67",
+                appeal_date="2024-01-15",
+                status="Pending",
+                requested_value=50000,
+                reason="Overassessment"
+            ),
+            AppealRecord(
+                appeal_id="AP-2024-002",
+                property_id="12-345-67",
+                appeal_date="2024-01-15",
+                status="Pending",
+                requested_value=90000,
+                reason="Overassessment"
+            )
+        ]
+        
+        processing_results = await swarm_manager._execute_processing(appeals, property_index)
+        validation_result = await swarm_manager._execute_validation(processing_results)
+        processing_results, validation_result = await swarm_manager._execute_corrections(
+            appeals, property_index, processing_results, validation_result
+        )
+        handed_off = await swarm_manager._execute_handoff(
+            appeals, property_index, processing_results, validation_result
+        )
+        
+        assert handed_off == 1
+        case = swarm_manager.handoff_queue.pop()
+        assert case.appeal_id == "AP-2024-001"
+        assert case.reason == "low_confidence"
+        assert case.dollar_at_stake == 50000
+        assert case.recommendation == "Partial reduction"
+    
+    @pytest.mark.asyncio
+    async def test_task_timings_recorded(self, swarm_manager, sample_property_records, sample_appeal_records):
+        swarm_manager.config.process_batch_size = 5
+        await swarm_manager.start_swarm()
+        
+        results = await swarm_manager._execute_processing(sample_appeal_records * 20, PropertyIndex(sample_property_records))
+        
+        assert len(results) == 20
+        assert all(result.execution_time >= 0.1 for result in results)
+        assert all(result.queue_wait is not None for result in results)
+        
+        report = swarm_manager.timing_report()
+        processing = report["stages"]["processing"]
+        assert processing["run"]["count"] == 4  # One timing per dispatched batch
+        assert processing["run"]["p50"] >= 0.1
+        assert processing["wait"]["p99"] >= processing["wait"]["p50"]
+        assert report["agents"]["processor_001"]["run"]["count"] >= 1
+    
     def test_swarm_manager_initialization(self, swarm_manager, swarm_config):
         assert swarm_manager.config == swarm_config
         assert swarm_manager.active_agents == {}
@@ -113,6 +351,17 @@ class TestSwarmManager:
                             mock_processing.assert_called_once()
                             mock_validation.assert_called_once()
                             mock_report.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_collection_hands_off_compact_rows(self, swarm_manager):
+        await swarm_manager.start_swarm()
+        
+        property_records, appeal_records = await swarm_manager._execute_data_collection()
+        results = await swarm_manager._execute_processing(appeal_records, PropertyIndex(property_records))
+        
+        assert isinstance(property_records[0], PropertyRow)
+        assert isinstance(appeal_records[0], AppealRow)
+        assert results[0].result["appeal_id"] == appeal_records[0].appeal_id
 
 
 class TestDataCollectorAgent:
@@ -144,6 +393,18 @@ class TestDataCollectorAgent:
             assert result.status == "completed"
             assert "property_records" in result.result
             mock_scrape.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_reference_handoff_returns_typed_records(self, agent):
+        result = await agent.execute_task(WorkflowTask(
+            task_id="T001",
+            task_type="data_collection",
+            parameters={"source": "lackawanna", "handoff": "reference"}
+        ))
+        
+        assert result.status == "completed"
+        assert isinstance(result.result["property_records"][0], PropertyRecord)
+        assert isinstance(result.result["appeal_records"][0], AppealRecord)
 
 
 class TestPatternAnalyzerAgent:
@@ -177,6 +438,56 @@ class TestPatternAnalyzerAgent:
         assert result.status == "completed"
         assert "patterns" in result.result
         assert "statistics" in result.result
+    
+    @pytest.mark.asyncio
+    async def test_dataset_analysis_groups_by_type_street_and_reason(self, agent):
+        properties = [
+            PropertyRecord(
+                property_id=property_id,
+                address=address,
+                assessed_value=assessed_value,
+                market_value=market_value,
+                owner_name="John Doe",
+                property_type=property_type
+            )
+            for property_id, address, assessed_value, market_value, property_type in [
+                ("1", "10 Main St, Scranton, PA", 100000, 100000, "Residential"),
+                ("2", "12 Main St, Scranton, PA", 300000, 200000, "Commercial"),
+                ("3", "5 Oak Ave, Scranton, PA", 200000, 250000, "Residential")
+            ]
+        ]
+        appeals = [
+            AppealRecord(
+                appeal_id=appeal_id,
+                property_id=property_id,
+                appeal_date="2024-01-15",
+                status="Pending",
+                requested_value=requested_value,
+                reason=reason
+            )
+            for appeal_id, property_id, requested_value, reason in [
+                ("AP-2024-001", "2", 250000, "Overassessment"),
+                ("AP-2024-002", "3", 150000, "Overassessment"),
+                ("AP-2024-003", "9", 90000, "Clerical error")  # No collected property
+            ]
+        ]
+        
+        result = await agent.execute_task(WorkflowTask(
+            task_id="T002",
+            task_type="pattern_analysis",
+            parameters={"data": {"dataset": RecordDataset.from_records(properties, appeals)}}
+        ))
+        
+        groups = result.result["groups"]
+        assert groups["by_property_type"]["Residential"]["property_count"] == 2
+        assert groups["by_property_type"]["Residential"]["avg_assessed_value"] == 150000
+        assert groups["by_property_type"]["Commercial"]["appeal_rate"] == 1.0
+        assert groups["by_street"]["Main St"]["avg_assessment_ratio"] == pytest.approx(1.25)
+        assert groups["by_street"]["Oak Ave"]["appeal_count"] == 1
+        assert groups["by_reason"]["Overassessment"]["avg_requested_reduction"] == 50000
+        assert groups["by_reason"]["Clerical error"]["appeal_count"] == 1
+        assert result.result["statistics"]["total_appeals"] == 3
+        assert result.result["statistics"]["avg_market_value"] == pytest.approx(550000 / 3)
 
 
 class TestProcessorAgent:
@@ -205,6 +516,84 @@ class TestProcessorAgent:
         assert result.status == "completed"
         assert "recommendation" in result.result
         assert "confidence_score" in result.result
+    
+    
+    @pytest.mark.asyncio
+    async def test_evaluate_appeal_block_task(self, agent):
+        appeals = pd.DataFrame({
+            'appeal_id': ['AP-2024-001', 'AP-2024-002'],
+            'assessed_value': [100000, 125000],
+            'market_value': [100000, 150000],
+            'requested_value': [90000, 100000],
+            'reason': ['Overassessment', 'Overassessment']
+        })
+        
+        result = await agent.execute_task(WorkflowTask(
+            task_id="T003",
+            task_type="evaluate_appeal_block",
+            parameters={"appeals": appeals}
+        ))
+        
+        assert result.status == "completed"
+        assert result.result["evaluated_count"] == 2
+        assert list(result.result["evaluations"]["recommendation"]) == ["Approve reduction", "Deny appeal"]
+
+
+class TestBatchEvaluation:
+    
+    @pytest.mark.asyncio
+    async def test_matches_scalar_processing(self):
+        agent = ProcessorAgent("processor_001")
+        appeals = [
+            {
+                'appeal_id': f'AP-{i:03d}',
+                'assessed_value': assessed,
+                'market_value': market,
+                'requested_value': requested,
+                'reason': reason
+            }
+            for i, (assessed, market, requested, reason) in enumerate([
+                (100000, 100000, 90000, 'Overassessment'),
+                (100000, 100000, 50000, 'Overassessment'),
+                (100000, 100000, 80000, 'Overassessment'),
+                (125000, 150000, 100000, 'Overassessment'),
+                (100000, 100000, 90000, 'Clerical Error'),
+                (0, 0, 0, 'Overassessment')
+            ])
+        ]
+        
+        with patch('asyncio.sleep', new=AsyncMock()):
+            expected = [await agent._process_appeal(appeal) for appeal in appeals]
+        evaluations = evaluate_appeal_block(pd.DataFrame(appeals))
+        
+        assert list(evaluations["recommendation"]) == [e["recommendation"] for e in expected]
+        assert list(evaluations["confidence_score"]) == [e["confidence_score"] for e in expected]
+        assert list(evaluations["reasoning"]) == [e["reasoning"] for e in expected]
+    
+    def test_missing_market_value_defaults_to_assessed(self):
+        evaluations = evaluate_appeal_block({
+            'assessed_value': [100000, 100000],
+            'market_value': [None, 200000],
+            'requested_value': [90000, 90000],
+            'reason': ['Overassessment', 'Overassessment']
+        })
+        
+        assert list(evaluations["assessment_ratio"]) == [1.0, 0.5]
+        assert list(evaluations["recommendation"]) == ["Approve reduction", "Deny appeal"]
+    
+    def test_score_appeals_matches_block_evaluation(self):
+        appeals = [
+            {'assessed_value': 100000, 'market_value': None, 'requested_value': 90000, 'reason': 'Overassessment'},
+            {'assessed_value': 100000, 'market_value': 100000, 'requested_value': 50000, 'reason': 'Overassessment'},
+            {'assessed_value': 125000, 'market_value': 150000, 'requested_value': 100000, 'reason': 'Overassessment'},
+            {'assessed_value': 100000, 'requested_value': 90000, 'reason': 'Clerical Error'}
+        ]
+        evaluations = evaluate_appeal_block(pd.DataFrame(appeals))
+        scores = score_appeals(appeals)
+        
+        assert [s["recommendation"] for s in scores] == list(evaluations["recommendation"])
+        assert [s["confidence_score"] for s in scores] == list(evaluations["confidence_score"])
+        assert [s["reasoning"] for s in scores] == list(evaluations["reasoning"])
 
 
 class TestValidatorAgent:
@@ -336,4 +725,1240 @@ class TestSwarmCoordination:
         
         # All processors should complete their tasks
         assert len(results) == 8
-        assert all(result.status == "completed" for result in results)
\ No newline at end of file
+        assert all(result.status == "completed" for result in results)
+
+class TestWorkScheduler:
+    
+    @pytest.fixture
+    def appeal_tasks(self):
+        return [
+            WorkflowTask(
+                task_id=f"T{i:03d}",
+                task_type="process_appeal",
+                parameters={"appeal": {
+                    'appeal_id': f'AP-2024-{i:03d}',
+                    'assessed_value': 100000,
+                    'market_value': 100000,
+                    'requested_value': 90000,
+                    'reason': 'Overassessment'
+                }}
+            )
+            for i in range(20)
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_all_tasks_processed_with_bounded_concurrency(self, appeal_tasks):
+        processors = [ProcessorAgent(f"processor_{i}") for i in range(4)]
+        scheduler = WorkScheduler(processors, queue_size=2, max_in_flight=3)
+        
+        in_flight = 0
+        peak_in_flight = 0
+        
+        for processor in processors:
+            original = processor.execute_task
+            
+            async def tracked(task, original=original):
+                nonlocal in_flight, peak_in_flight
+                in_flight += 1
+                peak_in_flight = max(peak_in_flight, in_flight)
+                try:
+                    return await original(task)
+                finally:
+                    in_flight -= 1
+            
+            processor.execute_task = tracked
+        
+        results = await scheduler.run(appeal_tasks)
+        
+        assert len(results) == 20
+        assert all(result.status == "completed" for result in results)
+        assert peak_in_flight == 3
+        assert processors[3].tasks_completed == 0
+    
+    @pytest.mark.asyncio
+    async def test_backpressure_limits_buffered_tasks(self, appeal_tasks):
+        processors = [ProcessorAgent("processor_0")]
+        scheduler = WorkScheduler(processors, queue_size=2)
+        
+        pulled = 0
+        
+        def task_source():
+            nonlocal pulled
+            for task in appeal_tasks:
+                pulled += 1
+                yield task
+        
+        stream = scheduler.stream(task_source())
+        await stream.__anext__()
+        
+        # One executing, queue_size buffered, one held by the blocked producer
+        assert pulled <= 1 + 2 + 2
+        await stream.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_agent_error_propagates(self, appeal_tasks):
+        processor = ProcessorAgent("processor_0")
+        processor.execute_task = AsyncMock(side_effect=RuntimeError("boom"))
+        scheduler = WorkScheduler([processor])
+        
+        with pytest.raises(RuntimeError):
+            await scheduler.run(appeal_tasks)
+
+
+class TestConsensusEngine:
+    
+    @pytest.fixture
+    def processing_results(self):
+        return [
+            {'appeal_id': f'AP-2024-{i:03d}', 'confidence_score': 0.85 if i % 2 else 0.65}
+            for i in range(60)
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_each_result_validated_once_without_overlap(self, processing_results):
+        validators = [ValidatorAgent(f"validator_{i}") for i in range(3)]
+        engine = ConsensusEngine(validators, overlap=0.0)
+        
+        task_results = await engine.validate(processing_results)
+        consensus = engine.result()
+        
+        assert sum(result.result["validated_count"] for result in task_results) == 60
+        assert consensus.confidence == pytest.approx(0.75)
+        assert consensus.validated == True
+        assert consensus.validator_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_overlap_cross_checks_sample(self, processing_results):
+        validators = [ValidatorAgent(f"validator_{i}") for i in range(3)]
+        engine = ConsensusEngine(validators, overlap=0.1)
+        
+        task_results = await engine.validate(processing_results)
+        consensus = engine.result()
+        
+        # 60 primary validations plus a 1-in-10 cross-check sample of each shard
+        assert sum(result.result["validated_count"] for result in task_results) == 66
+        assert consensus.details["results_count"] == 60
+        assert consensus.details["cross_checked_count"] == 6
+        assert consensus.consensus_score == pytest.approx(1.0)
+    
+    @pytest.mark.asyncio
+    async def test_incremental_batches_merge(self, processing_results):
+        engine = ConsensusEngine([ValidatorAgent("validator_0"), ValidatorAgent("validator_1")])
+        
+        await engine.validate(processing_results[:10])
+        await engine.validate(processing_results[10:])
+        
+        assert engine.result().details["results_count"] == 60
+        assert engine.result().confidence == pytest.approx(0.75)
+
+
+class TestHumanHandoffQueue:
+    
+    @staticmethod
+    def case(appeal_id, dollar_at_stake, hearing_date=None):
+        return HandoffCase(
+            appeal_id=appeal_id,
+            reason="low_confidence",
+            confidence=0.65,
+            dollar_at_stake=dollar_at_stake,
+            hearing_date=hearing_date
+        )
+    
+    def test_highest_value_then_earliest_hearing_first(self):
+        queue = HumanHandoffQueue()
+        queue.push(self.case("AP-1", 10000, "2024-09-01"))
+        queue.push(self.case("AP-2", 50000))
+        queue.push(self.case("AP-3", 10000, "2024-08-01"))
+        
+        assert [queue.pop().appeal_id for _ in range(3)] == ["AP-2", "AP-3", "AP-1"]
+        assert queue.pop() is None
+    
+    def test_repush_replaces_entry(self):
+        queue = HumanHandoffQueue()
+        queue.push(self.case("AP-1", 10000))
+        queue.push(self.case("AP-2", 20000))
+        queue.push(self.case("AP-1", 30000))
+        
+        assert len(queue) == 2
+        assert queue.pop().appeal_id == "AP-1"
+        assert queue.pop().appeal_id == "AP-2"
+    
+    def test_queue_persists_across_restarts(self, tmp_path):
+        path = tmp_path / "handoff.jsonl"
+        queue = HumanHandoffQueue(str(path))
+        queue.push(self.case("AP-1", 10000))
+        queue.push(self.case("AP-2", 20000))
+        queue.push(self.case("AP-3", 5000))
+        assert queue.pop().appeal_id == "AP-2"
+        
+        reopened = HumanHandoffQueue(str(path))
+        assert [case.appeal_id for case in reopened.pending()] == ["AP-1", "AP-3"]
+        
+        reopened.compact()
+        assert len(path.read_text().splitlines()) == 2
+        assert HumanHandoffQueue(str(path)).peek().appeal_id == "AP-1"
+
+
+class TestExecutionBackends:
+    
+    @pytest.mark.asyncio
+    async def test_process_backend_batches_preserve_order(self):
+        backend = ProcessPoolBackend(max_workers=2, batch_size=3)
+        try:
+            results = await backend.map(abs, list(range(-10, 0)))
+            assert results == list(range(10, 0, -1))
+            assert await backend.run(max, 3, 7) == 7
+        finally:
+            backend.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_processor_block_evaluation_in_process_pool(self):
+        agent = ProcessorAgent("processor_001")
+        agent.set_backend(create_backend("process", max_workers=2, batch_size=2))
+        appeals = pd.DataFrame({
+            'appeal_id': [f'AP-{i:03d}' for i in range(5)],
+            'assessed_value': [100000] * 5,
+            'market_value': [100000] * 5,
+            'requested_value': [90000, 50000, 90000, 50000, 90000],
+            'reason': ['Overassessment'] * 5
+        })
+        
+        try:
+            result = await agent.execute_task(WorkflowTask(
+                task_id="T003",
+                task_type="evaluate_appeal_block",
+                parameters={"appeals": appeals}
+            ))
+        finally:
+            agent.backend.shutdown()
+        
+        assert result.result["evaluated_count"] == 5
+        assert list(result.result["evaluations"]["appeal_id"]) == list(appeals["appeal_id"])
+    
+    @pytest.mark.asyncio
+    async def test_swarm_runs_with_process_backend(self):
+        swarm_manager = SwarmManager(SwarmConfig(execution_backend="process", backend_workers=2))
+        await swarm_manager.start_swarm()
+        try:
+            result = await swarm_manager.execute_workflow()
+        finally:
+            await swarm_manager.stop_swarm()
+        
+        assert result.success == True
+        assert result.results['processing_results'] == 1
+    
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError):
+            create_backend("gpu")
+
+
+class TestLatencyHistogram:
+    
+    def test_quantiles_within_bucket_error(self):
+        histogram = LatencyHistogram()
+        for i in range(1, 1001):
+            histogram.record(i / 1000)
+        
+        summary = histogram.summary()
+        assert summary["count"] == 1000
+        assert summary["p50"] == pytest.approx(0.5, rel=0.05)
+        assert summary["p95"] == pytest.approx(0.95, rel=0.05)
+        assert summary["p99"] == pytest.approx(0.99, rel=0.05)
+        assert summary["max"] == 1.0
+    
+    def test_empty_histogram(self):
+        assert LatencyHistogram().summary()["p50"] is None
+
+
+class TestSwarmRuntime:
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_workflows_share_warm_agents(self):
+        async with SwarmRuntime(SwarmConfig(processor_agents=2, validator_agents=2)) as runtime:
+            processors = runtime.manager().active_agents['processors']
+            
+            results = await runtime.submit_many([{"municipality": name} for name in ("Scranton", "Dunmore", "Olyphant")])
+            
+            assert all(result.success for result in results)
+            assert len({result.workflow_id for result in results}) == 3
+            assert runtime.manager().active_agents['processors'] is processors
+            assert sum(processor.tasks_completed for processor in processors) == 3
+    
+    @pytest.mark.asyncio
+    async def test_per_workflow_task_isolation(self):
+        async with SwarmRuntime(SwarmConfig()) as runtime:
+            first, second = runtime.manager(), runtime.manager()
+            
+            await first.execute_workflow()
+            
+            assert len(first.completed_tasks) > 0
+            assert second.completed_tasks == []
+            assert first.active_agents is second.active_agents
+            
+            # A per-workflow manager must not tear down the shared pool
+            await first.stop_swarm()
+            assert runtime.manager().backend is not None
+    
+    def test_manager_requires_started_runtime(self):
+        with pytest.raises(RuntimeError):
+            SwarmRuntime(SwarmConfig()).manager()
+    
+    def test_yaml_config_cached(self):
+        swarm_manager_module._config_cache.clear()
+        with patch.object(swarm_manager_module.yaml, 'safe_load', wraps=swarm_manager_module.yaml.safe_load) as mock_load:
+            first = SwarmManager()
+            second = SwarmManager()
+        
+        assert mock_load.call_count == 1
+        assert first.config == second.config
+        assert first.config is not second.config
+
+
+class TestTaskLedger:
+    
+    @staticmethod
+    def results(count, status="completed"):
+        return [
+            TaskResult(task_id=f"T{i:03d}", agent_id=f"processor_{i % 2}", status=status, result={"appeal_id": f"AP-{i:03d}"})
+            for i in range(count)
+        ]
+    
+    def test_window_bounded_and_spilled_results_queryable(self, tmp_path):
+        ledger = TaskLedger(window_size=10, spill_path=str(tmp_path / "ledger.jsonl"))
+        
+        ledger.record("processing", self.results(25))
+        ledger.record("validation", self.results(2, status="failed"))
+        
+        assert len(ledger.window) <= 10
+        assert len(ledger) == 27
+        assert ledger.spilled + len(ledger.window) == 27
+        assert [result.task_id for result in ledger.query(stage="processing")] == [f"T{i:03d}" for i in range(25)]
+        assert len(list(ledger.query(agent_id="processor_1"))) == 13
+        assert ledger.query(task_id="T003").__next__().result == {"appeal_id": "AP-003"}
+        
+        summary = ledger.summary()
+        assert summary["by_status"] == {"completed": 25, "failed": 2}
+        assert summary["by_stage"] == {"processing": 25, "validation": 2}
+    
+    def test_shared_spill_file_isolated_per_ledger(self, tmp_path):
+        path = str(tmp_path / "ledger.jsonl")
+        first, second = TaskLedger(window_size=4, spill_path=path), TaskLedger(window_size=4, spill_path=path)
+        
+        first.record("processing", self.results(10))
+        second.record("processing", self.results(6))
+        
+        assert len(list(first.query())) == 10
+        assert len(list(second.query())) == 6
+    
+    def test_close_deletes_temporary_spill_file_only(self, tmp_path):
+        temporary = TaskLedger(window_size=4)
+        configured = TaskLedger(window_size=4, spill_path=str(tmp_path / "ledger.jsonl"))
+        temporary.record("processing", self.results(10))
+        configured.record("processing", self.results(10))
+        spill_file = temporary.spill_path
+        
+        temporary.close()
+        configured.close()
+        
+        assert spill_file.exists() is False
+        assert configured.spill_path.exists()
+    
+    @pytest.mark.asyncio
+    async def test_runtime_submissions_leave_no_spill_files(self):
+        managers = []
+        async with SwarmRuntime(SwarmConfig(ledger_window=2)) as runtime:
+            new_manager = runtime.manager
+            
+            def tracked_manager():
+                managers.append(new_manager())
+                return managers[-1]
+            
+            with patch.object(runtime, 'manager', tracked_manager):
+                result = await runtime.submit()
+        
+        assert result.success
+        assert managers[0].task_ledger.spilled > 0
+        assert managers[0].task_ledger.spill_path is None
+    
+    @pytest.mark.asyncio
+    async def test_manager_completed_tasks_stay_bounded(self, tmp_path):
+        swarm_manager = SwarmManager(SwarmConfig(ledger_window=8, ledger_path=str(tmp_path / "ledger.jsonl"), process_batch_size=1))
+        await swarm_manager.start_swarm()
+        appeals = [
+            AppealRecord(
+                appeal_id=f"AP-2024-{i:03d}",
+                property_id="12-345-67",
+                appeal_date="2024-01-15",
+                status="Pending",
+                requested_value=100000,
+                reason="Overassessment"
+            )
+            for i in range(30)
+        ]
+        
+        await swarm_manager._execute_processing(appeals)
+        
+        assert len(swarm_manager.completed_tasks) <= 8
+        assert swarm_manager.completed_tasks is swarm_manager.task_ledger.window
+        assert len(list(swarm_manager.task_ledger.query(stage="processing"))) == 30
+
+
+class TestWorkflowCheckpoint:
+    
+    def test_truncated_final_line_ignored(self, tmp_path):
+        path = tmp_path / "checkpoint.jsonl"
+        checkpoint = WorkflowCheckpoint(str(path), interval=2)
+        checkpoint.reset()
+        for i in range(3):
+            checkpoint.record_processed(f"AP-{i}", TaskResult(task_id=f"T{i}", agent_id="processor_001", status="completed"))
+        
+        # Only the first interval was flushed; simulate a crash mid-write after it
+        with open(path, 'a') as file:
+            file.write('{"type": "processed", "appeal_')
+        
+        restored = WorkflowCheckpoint(str(path)).load()
+        assert set(restored.processed) == {"AP-0", "AP-1"}
+    
+    @pytest.mark.asyncio
+    async def test_resume_skips_processed_and_validated_appeals(self, tmp_path):
+        config = SwarmConfig(checkpoint_path=str(tmp_path / "checkpoint.jsonl"), checkpoint_interval=5)
+        records = make_records(12)
+        
+        first = SwarmManager(config)
+        await first.start_swarm()
+        with patch.object(first, '_execute_data_collection', AsyncMock(return_value=records)), \
+                patch.object(first, '_execute_report_generation', AsyncMock(side_effect=RuntimeError("reporter crashed"))):
+            failed = await first.execute_workflow()
+        
+        assert not failed.success
+        assert failed.results["processed_appeals"] == 12
+        assert failed.results["validated_appeals"] == 12
+        
+        resumed = SwarmManager(config)
+        await resumed.start_swarm()
+        with patch.object(resumed, '_execute_data_collection', AsyncMock(return_value=records)):
+            result = await resumed.execute_workflow(resume=True)
+        
+        assert result.success
+        assert result.results["processing_results"] == 12
+        assert result.results["validation_confidence"] == pytest.approx(first.checkpoint.validation.confidence)
+        assert list(resumed.task_ledger.query(stage="processing")) == []
+        assert list(resumed.task_ledger.query(stage="validation")) == []
+        assert resumed.checkpoint.completed
+        
+        # Appeals collected since the checkpoint are the only ones processed and validated
+        extended = SwarmManager(config)
+        await extended.start_swarm()
+        with patch.object(extended, '_execute_data_collection', AsyncMock(return_value=make_records(15))):
+            result = await extended.execute_workflow(resume=True)
+        
+        assert result.success
+        assert result.results["processing_results"] == 15
+        assert len(list(extended.task_ledger.query(stage="processing"))) == 1  # One batch of the 3 new appeals
+        assert extended.checkpoint.validation.details["results_count"] == 15
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_workflows_cannot_share_checkpoint(self, tmp_path):
+        path = tmp_path / "checkpoint.jsonl"
+        records = make_records(4)
+        
+        async with SwarmRuntime(SwarmConfig(checkpoint_path=str(path))) as runtime:
+            with patch.object(SwarmManager, '_execute_data_collection', AsyncMock(return_value=records)):
+                results = await runtime.submit_many([None, None])
+                rerun = await runtime.submit()
+        
+        assert sorted(result.success for result in results) == [False, True]
+        assert "in use by another running workflow" in next(result for result in results if not result.success).errors[0]
+        assert rerun.success
+        assert set(WorkflowCheckpoint(str(path)).load().processed) == {appeal.appeal_id for appeal in records[1]}
+
+
+class TestResultCache:
+    
+    def test_least_recently_used_evicted_over_entry_budget(self):
+        cache = ResultCache(max_entries=3)
+        for key in ["a", "b", "c"]:
+            cache.put(key, {"value": key})
+        
+        cache.get("a")  # "b" is now the least recently used
+        cache.put("d", {"value": "d"})
+        
+        assert len(cache) == 3
+        assert "b" not in cache
+        assert cache.get("a") == {"value": "a"}
+    
+    def test_size_budget_and_persistence(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        cache = ResultCache(path, max_entries=None, max_bytes=100)
+        for i in range(10):
+            cache.put(f"key-{i}", "x" * 20)
+        cache.close()
+        
+        reopened = ResultCache(path, max_entries=None, max_bytes=100)
+        assert reopened.total_bytes <= 100
+        assert reopened.get("key-9") == "x" * 20
+        assert reopened.get("key-0") is None
+    
+    def test_content_key_tracks_inputs_and_rule_version(self):
+        appeal = {"appeal_id": "AP-1", "assessed_value": 150000, "requested_value": 130000}
+        
+        assert content_key("process_appeal", "1", appeal) == content_key("process_appeal", "1", dict(reversed(appeal.items())))
+        assert content_key("process_appeal", "1", appeal) != content_key("process_appeal", "2", appeal)
+        assert content_key("process_appeal", "1", appeal) != content_key("process_appeal", "1", {**appeal, "requested_value": 120000})
+    
+    @pytest.mark.asyncio
+    async def test_incremental_run_computes_only_changed_appeals(self):
+        swarm_manager = SwarmManager(SwarmConfig(result_cache=True))
+        await swarm_manager.start_swarm()
+        properties, appeals = make_records(10)
+        index = PropertyIndex(properties)
+        
+        first = await swarm_manager._execute_processing(appeals, index)
+        await swarm_manager._execute_validation(first)
+        hits_before = swarm_manager.result_cache.hits
+        
+        # Next day's snapshot: one appeal amended, the rest unchanged
+        appeals[0] = appeals[0].model_copy(update={"requested_value": 90000})
+        with patch('src.swarm_coordination.agents.score_appeals', wraps=score_appeals) as scorer:
+            second = await swarm_manager._execute_processing(appeals, index)
+        validation = await swarm_manager._execute_validation(second)
+        
+        assert [len(call.args[0]) for call in scorer.call_args_list] == [1]
+        assert {result.result["appeal_id"]: result.result["recommendation"] for result in second}["AP-2024-000"] == "Partial reduction"
+        assert validation.details["results_count"] == 10
+        assert swarm_manager.result_cache.hits - hits_before >= 9 + 9
+        await swarm_manager.stop_swarm()
+
+
+class TestSharding:
+    
+    def test_partition_is_stable_and_keeps_properties_together(self):
+        _, appeals = make_records(20)
+        appeals += [appeal.model_copy(update={"appeal_id": appeal.appeal_id + "-B"}) for appeal in appeals]
+        
+        shards = partition_appeals(appeals, 4)
+        
+        assert sum(len(shard) for shard in shards) == 40
+        for shard_id, shard in enumerate(shards):
+            assert all(shard_for(appeal.property_id, 4) == shard_id for appeal in shard)
+        assert shard_for("12-345-67", 4) == shard_for("12-345-67", 4)
+    
+    @pytest.mark.asyncio
+    async def test_sharded_workflow_matches_single_process(self):
+        config = SwarmConfig(processor_agents=2, validator_agents=2, validation_overlap=0.0)
+        properties, appeals = make_records(12)
+        appeals[3] = appeals[3].model_copy(update={"requested_value": 90000})  # flagged below threshold
+        
+        local = SwarmManager(config)
+        await local.start_swarm()
+        index = PropertyIndex(properties)
+        expected_results = await local._execute_processing(appeals, index)
+        expected = await local._execute_validation(expected_results)
+        
+        with LocalShardWorkers(2, config) as workers:
+            sharded = SwarmManager(config.model_copy(update={"shard_workers": workers.addresses, "shard_count": 3}))
+            await sharded.start_swarm()
+            results, validation = await sharded._execute_sharded(appeals, index)
+        
+        assert sorted(result.result["appeal_id"] for result in results) == sorted(appeal.appeal_id for appeal in appeals)
+        assert validation.confidence == pytest.approx(expected.confidence)
+        assert validation.details["results_count"] == 12
+        assert validation.details["flagged_appeals"] == expected.details["flagged_appeals"] == {"AP-2024-003": 0.65}
+        
+        # One ledger entry per shard batch, plus the shards' validation tasks
+        processing = list(sharded.task_ledger.query(stage="processing"))
+        assert len(processing) == sum(1 for shard in partition_appeals(appeals, 3) if shard)
+        assert all(task.task_id.startswith("T003_process_batch_") for task in processing)
+        assert list(sharded.task_ledger.query(stage="validation"))
+    
+    @pytest.mark.asyncio
+    async def test_sharded_workflow_resumes_from_checkpoint(self, tmp_path):
+        config = SwarmConfig(processor_agents=2, validator_agents=2, checkpoint_path=str(tmp_path / "checkpoint.jsonl"))
+        records = make_records(8)
+        
+        with LocalShardWorkers(2, config.model_copy(update={"checkpoint_path": None})) as workers:
+            config = config.model_copy(update={"shard_workers": workers.addresses})
+            first = SwarmManager(config)
+            await first.start_swarm()
+            with patch.object(first, '_execute_data_collection', AsyncMock(return_value=records)), \
+                    patch.object(first, '_execute_report_generation', AsyncMock(side_effect=RuntimeError("reporter crashed"))):
+                failed = await first.execute_workflow()
+            
+            resumed = SwarmManager(config)
+            await resumed.start_swarm()
+            with patch.object(resumed, '_execute_data_collection', AsyncMock(return_value=records)):
+                result = await resumed.execute_workflow(resume=True)
+        
+        assert failed.results["processed_appeals"] == failed.results["validated_appeals"] == 8
+        assert result.success
+        assert result.results["processing_results"] == 8
+        assert result.results["validation_confidence"] == pytest.approx(first.checkpoint.validation.confidence)
+        assert list(resumed.task_ledger.query(stage="processing")) == []
+    
+    @pytest.mark.asyncio
+    async def test_unreachable_worker_raises(self):
+        _, appeals = make_records(2)
+        coordinator = ShardCoordinator(["127.0.0.1:1"])
+        
+        with pytest.raises(OSError):
+            await coordinator.run(appeals, PropertyIndex())
+
+
+class TestPriorityScheduling:
+    
+    def test_appeal_priority_from_hearing_date_and_dollars(self):
+        today = date(2024, 3, 1)
+        record = PropertyRecord(
+            property_id="12-345-67",
+            address="123 Main St",
+            assessed_value=400000,
+            market_value=380000,
+            owner_name="John Doe",
+            property_type="Commercial"
+        )
+        appeal = AppealRecord(
+            appeal_id="AP-2024-001",
+            property_id="12-345-67",
+            appeal_date="2024-01-15",
+            status="Pending",
+            requested_value=390000,
+            reason="Overassessment"
+        )
+        
+        assert appeal_priority(appeal, today=today) == 1
+        assert appeal_priority(appeal.model_copy(update={"hearing_date": "2024-03-05"}), today=today) == 6
+        assert appeal_priority(appeal.model_copy(update={"hearing_date": "2024-04-15"}), today=today) == 2
+        assert appeal_priority(appeal.model_copy(update={"requested_value": 250000}), record, today) == 5
+        assert appeal_priority(
+            appeal.model_copy(update={"requested_value": 250000, "hearing_date": "2024-02-20"}), record, today
+        ) == 10
+    
+    def test_fair_queue_favours_urgent_without_starving(self):
+        queue = FairPriorityQueue()
+        for i in range(3):
+            queue.push(1, ("low", i))
+        for i in range(600):
+            queue.push(10, ("urgent", i))
+        
+        order = list(queue.drain())
+        low_positions = [i for i, (kind, _) in enumerate(order) if kind == "low"]
+        
+        assert order[0] == ("urgent", 0)
+        assert low_positions[0] == 512
+        assert [item for kind, item in order if kind == "low"] == [0, 1, 2]
+    
+    @pytest.mark.asyncio
+    async def test_scheduler_dispatches_buffered_tasks_by_priority(self):
+        processor = ProcessorAgent("processor_001")
+        dispatched = []
+        
+        async def record(task):
+            dispatched.append(task.task_id)
+            return TaskResult(task_id=task.task_id, agent_id=processor.agent_id, status="completed")
+        
+        processor.execute_task = record
+        tasks = [
+            WorkflowTask(task_id=f"T{i:03d}", task_type="process_appeal", priority=priority)
+            for i, priority in enumerate([1, 1, 9, 1, 5])
+        ]
+        
+        await WorkScheduler([processor], queue_size=10).run(tasks)
+        
+        assert dispatched == ["T002", "T004", "T000", "T001", "T003"]
+
+
+class TestWorkStealing:
+    
+    @staticmethod
+    def stall_on(processor, task_id, seconds):
+        original = processor.execute_task
+        
+        async def execute(task):
+            if task.task_id == task_id:
+                await processor._start_task(task)
+                await asyncio.sleep(seconds)  # Stuck: no heartbeat
+            return await original(task)
+        
+        processor.execute_task = execute
+    
+    @pytest.mark.asyncio
+    async def test_idle_agent_steals_straggling_task(self):
+        processors = [ProcessorAgent(f"processor_{i}") for i in range(2)]
+        self.stall_on(processors[0], "T000", 30)
+        tasks = [
+            WorkflowTask(
+                task_id=f"T{i:03d}",
+                task_type="process_appeal",
+                parameters={"appeal": {"appeal_id": f"AP-2024-{i:03d}", "assessed_value": 100000, "reason": "Overassessment"}}
+            )
+            for i in range(4)
+        ]
+        scheduler = WorkScheduler(processors, monitor=AgentMonitor(factor=2.0, min_seconds=0.2))
+        
+        results = await asyncio.wait_for(scheduler.run(tasks), timeout=5)
+        
+        assert sorted(result.task_id for result in results) == ["T000", "T001", "T002", "T003"]
+        assert next(result for result in results if result.task_id == "T000").agent_id == "processor_1"
+        assert scheduler.tasks_stolen == 1
+        assert processors[0].status == AgentStatus.IDLE
+    
+    @pytest.mark.asyncio
+    async def test_heartbeats_and_straggler_detection(self):
+        swarm_manager = SwarmManager(SwarmConfig(straggler_min_seconds=0.05))
+        await swarm_manager.start_swarm()
+        processor = swarm_manager.active_agents['processors'][0]
+        
+        await processor._start_task(WorkflowTask(task_id="T001", task_type="process_appeal"))
+        assert swarm_manager.detect_stragglers() == []
+        
+        await asyncio.sleep(0.1)
+        assert swarm_manager.detect_stragglers() == [processor.agent_id]
+        
+        processor.heartbeat()
+        states = swarm_manager.agent_states()
+        assert swarm_manager.detect_stragglers() == []
+        assert states[processor.agent_id].status == AgentStatus.BUSY
+        assert states[processor.agent_id].current_task == "T001"
+        assert len(states) == 3 + swarm_manager.config.processor_agents + swarm_manager.config.validator_agents
+    
+    @pytest.mark.asyncio
+    async def test_slow_healthy_batch_is_not_a_straggler(self):
+        swarm_manager = SwarmManager(SwarmConfig(straggler_min_seconds=0.25))
+        await swarm_manager.start_swarm()
+        processor = swarm_manager.active_agents['processors'][0]
+        properties, appeals = make_records(100)
+        index = PropertyIndex(properties)
+        evaluate = processor.backend.run
+        
+        async def slow_run(fn, *args):
+            await asyncio.sleep(0.1)
+            return await evaluate(fn, *args)
+        
+        with patch.object(processor.backend, 'run', slow_run):
+            batch = asyncio.create_task(processor.run_task(WorkflowTask(
+                task_id="T003_process_batch_000",
+                task_type="process_appeal_batch",
+                parameters={"appeals": [index.join(appeal) for appeal in appeals]}
+            )))
+            stragglers = []
+            while not batch.done():
+                stragglers.extend(swarm_manager.detect_stragglers())
+                await asyncio.sleep(0.02)
+        
+        assert batch.result().result["batch_size"] == 100
+        assert batch.result().execution_time > swarm_manager.config.straggler_min_seconds
+        assert stragglers == []
+
+
+class TestTaskTimeouts:
+    
+    @pytest.mark.asyncio
+    async def test_hung_task_fails_after_retries(self):
+        processor = ProcessorAgent("processor_001")
+        processor.set_timeout(0.05, retries=2, retry_backoff=0.01)
+        attempts = 0
+        
+        async def hang(task):
+            nonlocal attempts
+            attempts += 1
+            await processor._start_task(task)
+            await asyncio.sleep(10)
+        
+        processor.execute_task = hang
+        result = await processor.run_task(WorkflowTask(task_id="T001", task_type="process_appeal"))
+        
+        assert result.status == "failed"
+        assert "Timed out" in result.error_message
+        assert attempts == 3
+        assert processor.status == AgentStatus.IDLE
+    
+    @pytest.mark.asyncio
+    async def test_retry_with_backoff_recovers(self):
+        processor = ProcessorAgent("processor_001")
+        processor.set_timeout(0.5, retries=1, retry_backoff=0.01)
+        original = processor.execute_task
+        attempts = 0
+        
+        async def flaky(task):
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                await asyncio.sleep(10)
+            return await original(task)
+        
+        processor.execute_task = flaky
+        result = await processor.run_task(WorkflowTask(
+            task_id="T001",
+            task_type="process_appeal",
+            parameters={"appeal": {"appeal_id": "AP-2024-001", "assessed_value": 100000}}
+        ))
+        
+        assert result.status == "completed"
+        assert attempts == 2
+    
+    @pytest.mark.asyncio
+    async def test_hung_appeal_does_not_stall_workflow(self):
+        swarm_manager = SwarmManager(SwarmConfig(request_timeout=1, processor_agents=2, work_stealing=False, process_batch_size=1))
+        await swarm_manager.start_swarm()
+        properties, appeals = make_records(6)
+        
+        for processor in swarm_manager.active_agents['processors']:
+            original = processor.execute_task
+            
+            async def execute(task, original=original):
+                if task.parameters["appeal"]["appeal_id"] == "AP-2024-002":
+                    await asyncio.sleep(60)
+                return await original(task)
+            
+            processor.execute_task = execute
+        
+        with patch.object(swarm_manager, '_execute_data_collection', AsyncMock(return_value=(properties, appeals))):
+            result = await asyncio.wait_for(swarm_manager.execute_workflow(), timeout=10)
+        
+        assert result.success
+        assert result.failed_tasks == 1
+        assert result.results["processing_results"] == 6
+        assert result.results["validation_confidence"] == pytest.approx(0.85)
+    
+    @pytest.mark.asyncio
+    async def test_hung_appeal_fails_alone_in_batched_run(self):
+        swarm_manager = SwarmManager(SwarmConfig(request_timeout=1, processor_agents=2, work_stealing=False, process_batch_size=3))
+        await swarm_manager.start_swarm()
+        properties, appeals = make_records(6)
+        
+        for processor in swarm_manager.active_agents['processors']:
+            original = processor.execute_task
+            
+            async def execute(task, original=original):
+                batch = task.parameters.get("appeals") or [task.parameters["appeal"]]
+                if any(appeal["appeal_id"] == "AP-2024-002" for appeal in batch):
+                    await asyncio.sleep(60)
+                return await original(task)
+            
+            processor.execute_task = execute
+        
+        results = await asyncio.wait_for(
+            swarm_manager._execute_processing(appeals, PropertyIndex(properties)), timeout=10
+        )
+        
+        assert len(results) == 6
+        assert [result.status for result in results].count("failed") == 1
+        assert sorted(result.result["appeal_id"] for result in results if result.status == "completed") == [
+            appeal.appeal_id for appeal in appeals if appeal.appeal_id != "AP-2024-002"
+        ]
+        retried = [task.task_id for task in swarm_manager.task_ledger.query(stage="processing") if "retry" in task.task_id]
+        assert len(retried) == 3
+    
+    @pytest.mark.asyncio
+    async def test_collection_longer_than_request_timeout_succeeds(self):
+        swarm_manager = SwarmManager(SwarmConfig(request_timeout=1))
+        await swarm_manager.start_swarm()
+        collector = swarm_manager.active_agents['data_collector']
+        properties, appeals = make_records(2)
+        
+        async def slow_request(records, parameters):
+            await asyncio.sleep(0.6)  # Each request within request_timeout, the whole scrape beyond it
+            return records
+        
+        with patch.object(collector, '_scrape_property_data', lambda parameters: slow_request(properties, parameters)), \
+                patch.object(collector, '_scrape_appeal_data', lambda parameters: slow_request(appeals, parameters)):
+            collected = await swarm_manager._execute_data_collection()
+        
+        assert [len(records) for records in collected] == [2, 2]
+    
+    @pytest.mark.asyncio
+    async def test_stalled_scrape_request_fails_collection(self):
+        collector = DataCollectorAgent("collector_001")
+        collector.set_request_timeout(0.05)
+        
+        async def stall(parameters):
+            await asyncio.sleep(10)
+        
+        with patch.object(collector, '_scrape_appeal_data', stall):
+            result = await collector.run_task(WorkflowTask(task_id="T001_data_collection", task_type="data_collection"))
+        
+        assert result.status == "failed"
+        assert result.error_message == "Scrape request timed out after 0.05s"
+        assert collector.status == AgentStatus.IDLE
+
+
+class TestSwarmState:
+    
+    @pytest.mark.asyncio
+    async def test_snapshot_counts_tasks_and_utilization(self):
+        swarm_manager = SwarmManager(SwarmConfig(processor_agents=2, process_batch_size=1))
+        await swarm_manager.start_swarm()
+        properties, appeals = make_records(6)
+        
+        await swarm_manager._execute_processing(appeals, PropertyIndex(properties))
+        state = swarm_manager.snapshot()
+        
+        assert state.total_processed == 6
+        assert state.completed_count == 6
+        assert state.success_rate == 1.0
+        assert state.queue_depth == 0 and state.in_flight == 0
+        assert state.throughput > 0
+        assert state.agent_utilization["processor_001"] > 0
+        assert state.active_agents["processor_001"].tasks_completed == 3
+    
+    @pytest.mark.asyncio
+    async def test_tracks_running_scheduler_queue_depth(self):
+        tracker = SwarmStateTracker()
+        scheduler = WorkScheduler([ProcessorAgent("processor_001")])
+        scheduler.tasks_enqueued, scheduler.tasks_dispatched = 5, 2
+        
+        with tracker.tracking(scheduler):
+            state = tracker.snapshot([])
+        
+        assert (state.queue_depth, state.in_flight) == (3, 2)
+        assert tracker.snapshot([]).queue_depth == 0
+    
+    @pytest.mark.asyncio
+    async def test_unix_socket_endpoint_serves_json(self, tmp_path):
+        path = str(tmp_path / "swarm.sock")
+        swarm_manager = SwarmManager(SwarmConfig(state_endpoint=f"unix:{path}"))
+        await swarm_manager.start_swarm()
+        
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.write(b"GET / HTTP/1.1\r\nHost: swarm\r\n\r\n")
+        response = await reader.read()
+        writer.close()
+        await swarm_manager.stop_swarm()
+        
+        headers, body = response.split(b"\r\n\r\n", 1)
+        assert headers.startswith(b"HTTP/1.1 200 OK")
+        assert SwarmState.model_validate_json(body).active_agents["collector_001"].status == AgentStatus.IDLE
+
+
+class TestPoolAutoscaler:
+    
+    @staticmethod
+    def appeal_tasks(count):
+        return [
+            WorkflowTask(
+                task_id=f"T{i:03d}",
+                task_type="process_appeal",
+                parameters={"appeal": {"appeal_id": f"AP-2024-{i:03d}", "assessed_value": 100000}}
+            )
+            for i in range(count)
+        ]
+    
+    def test_desired_size_tracks_backlog_and_latency(self):
+        autoscaler = PoolAutoscaler([], ProcessorAgent, min_size=1, max_size=6, target_latency=1.0)
+        assert autoscaler.desired_size(backlog=100, current=3) == 3  # No latency observed yet
+        
+        for _ in range(10):
+            autoscaler.record(0.1)
+        
+        assert autoscaler.desired_size(backlog=2, current=3) == 1
+        assert autoscaler.desired_size(backlog=35, current=1) == 4
+        assert autoscaler.desired_size(backlog=1000, current=1) == 6
+    
+    @pytest.mark.asyncio
+    async def test_pool_grows_under_backlog_and_shrinks_after(self):
+        pool = [ProcessorAgent("processor_001")]
+        created = itertools.count(2)
+        autoscaler = PoolAutoscaler(
+            pool,
+            lambda: ProcessorAgent(f"processor_{next(created):03d}"),
+            min_size=1,
+            max_size=6,
+            target_latency=0.2,
+            interval=0.05
+        )
+        scheduler = WorkScheduler(pool, queue_size=50, autoscaler=autoscaler)
+        
+        results = await scheduler.run(self.appeal_tasks(40))
+        
+        assert sorted(result.task_id for result in results) == [f"T{i:03d}" for i in range(40)]
+        assert autoscaler.peak_size == 6
+        assert len({result.agent_id for result in results}) > 1
+        assert len(pool) == 1
+    
+    @pytest.mark.asyncio
+    async def test_autoscaling_respects_max_in_flight(self):
+        pool = [ProcessorAgent("processor_001")]
+        created = itertools.count(2)
+        autoscaler = PoolAutoscaler(
+            pool,
+            lambda: ProcessorAgent(f"processor_{next(created):03d}"),
+            min_size=1,
+            max_size=6,
+            target_latency=0.2,
+            interval=0.05
+        )
+        scheduler = WorkScheduler(pool, queue_size=50, max_in_flight=3, autoscaler=autoscaler)
+        
+        results = await scheduler.run(self.appeal_tasks(40))
+        
+        assert len(results) == 40
+        assert autoscaler.peak_size == 3
+        assert len({result.agent_id for result in results}) <= 3
+    
+    @pytest.mark.asyncio
+    async def test_small_job_stays_on_min_pool(self):
+        swarm_manager = SwarmManager(SwarmConfig(autoscale=True, autoscale_interval=0.05))
+        await swarm_manager.start_swarm()
+        properties, appeals = make_records(2)
+        
+        results = await swarm_manager._execute_processing(appeals, PropertyIndex(properties))
+        
+        assert len(results) == 2
+        assert {result.agent_id for result in results} == {"processor_001"}
+        assert len(swarm_manager.active_agents['processors']) == swarm_manager.config.processor_agents
+    
+    def test_trim_keeps_original_pool(self):
+        pool = [ProcessorAgent("processor_001"), ProcessorAgent("processor_002"), ProcessorAgent("processor_003")]
+        original = list(pool)
+        autoscaler = PoolAutoscaler(pool, lambda: ProcessorAgent("processor_004"), min_size=1, max_size=4)
+        
+        for _ in range(4):
+            autoscaler.acquire(set(pool))
+        autoscaler.trim()
+        
+        assert pool == original
+    
+    @pytest.mark.asyncio
+    async def test_runtime_managers_share_processor_ids(self):
+        async with SwarmRuntime(SwarmConfig(autoscale=True)) as runtime:
+            processor_ids = {runtime.manager()._new_processor().agent_id for _ in range(3)}
+        
+        assert processor_ids == {"processor_009", "processor_010", "processor_011"}
+
+
+class TestBatchedDispatch:
+    
+    @pytest.mark.asyncio
+    async def test_batch_task_returns_compact_result(self):
+        agent = ProcessorAgent("processor_001")
+        properties, appeals = make_records(3)
+        index = PropertyIndex(properties)
+        joined = [index.join(appeal) for appeal in appeals]
+        
+        result = await agent.execute_task(WorkflowTask(
+            task_id="T003_process_batch_000",
+            task_type="process_appeal_batch",
+            parameters={"appeals": joined}
+        ))
+        
+        assert result.status == "completed"
+        assert result.result["batch_size"] == 3
+        assert result.result["appeal_ids"] == [appeal.appeal_id for appeal in appeals]
+        assert result.result["recommendations"] == [score_appeal(appeal)["recommendation"] for appeal in joined]
+        assert result.execution_time < 0.2  # Simulated latency is paid once per batch
+    
+    def test_expand_batch_result_matches_per_appeal_shape(self):
+        batch = TaskResult(
+            task_id="T003_process_batch_000",
+            agent_id="processor_001",
+            status="completed",
+            result={
+                "appeal_ids": ["AP-2024-001", "AP-2024-002"],
+                "recommendations": ["Approve reduction", "Deny appeal"],
+                "confidence_scores": [0.85, 0.75],
+                "reasonings": ["inflated", "reasonable"],
+                "batch_size": 2,
+                "processed_timestamp": "2024-07-14T10:00:00Z"
+            },
+            execution_time=0.1
+        )
+        
+        expanded = expand_batch_result(batch, ["AP-2024-001", "AP-2024-002"])
+        
+        assert [result.result["appeal_id"] for result in expanded] == ["AP-2024-001", "AP-2024-002"]
+        assert expanded[1].result["recommendation"] == "Deny appeal"
+        assert expanded[1].result["confidence_score"] == 0.75
+        assert all(result.execution_time == 0.1 for result in expanded)
+        
+        failed = batch.model_copy(update={"status": "failed", "result": None, "error_message": "Timed out"})
+        assert [result.status for result in expand_batch_result(failed, ["AP-2024-001", "AP-2024-002"])] == ["failed", "failed"]
+    
+    @pytest.mark.asyncio
+    async def test_manager_dispatches_batches_with_same_recommendations(self):
+        properties, appeals = make_records(12)
+        
+        batched = SwarmManager(SwarmConfig(process_batch_size=5))
+        await batched.start_swarm()
+        batched_results = await batched._execute_processing(appeals, PropertyIndex(properties))
+        
+        single = SwarmManager(SwarmConfig(process_batch_size=1))
+        await single.start_swarm()
+        single_results = await single._execute_processing(appeals, PropertyIndex(properties))
+        
+        assert len(list(batched.task_ledger.query(stage="processing"))) == 3
+        assert len(list(single.task_ledger.query(stage="processing"))) == 12
+        
+        def recommendations(results):
+            return sorted((result.result["appeal_id"], result.result["recommendation"]) for result in results)
+        
+        assert recommendations(batched_results) == recommendations(single_results)
+
+
+class TestColumnarDataset:
+    
+    def test_dataset_totals_match_record_totals(self):
+        properties, appeals = make_records(10)
+        
+        from_records = compute_pattern_totals({"property_records": properties, "appeal_records": appeals})
+        from_dataset = compute_pattern_totals({"dataset": RecordDataset.from_records(properties, appeals)})
+        
+        assert from_dataset == pytest.approx(from_records)
+    
+    @pytest.mark.asyncio
+    async def test_zero_market_value_matches_record_path(self):
+        properties, appeals = make_records(4)
+        properties[0] = properties[0].model_copy(update={"market_value": 0})
+        agent = PatternAnalyzerAgent("analyzer_001")
+        
+        results = {}
+        for name, data in [
+            ("records", {"property_records": properties, "appeal_records": appeals}),
+            ("dataset", {"dataset": RecordDataset.from_records(properties, appeals)})
+        ]:
+            results[name] = await agent.execute_task(WorkflowTask(
+                task_id="T002",
+                task_type="pattern_analysis",
+                parameters={"data": data}
+            ))
+        
+        from_dataset = compute_pattern_totals({"dataset": RecordDataset.from_records(properties, appeals)})
+        assert from_dataset == pytest.approx(compute_pattern_totals({"property_records": properties, "appeal_records": appeals}))
+        assert np.isfinite(from_dataset["assessment_ratio_sum"])
+        assert results["dataset"].result["patterns"] == results["records"].result["patterns"]
+        for group in results["dataset"].result["groups"]["by_street"].values():
+            assert np.isfinite(group["avg_assessment_ratio"])
+    
+    @pytest.mark.asyncio
+    async def test_processor_evaluates_dataset_block(self):
+        properties, appeals = make_records(4)
+        index = PropertyIndex(properties)
+        
+        result = await ProcessorAgent("processor_001").execute_task(WorkflowTask(
+            task_id="T003",
+            task_type="evaluate_appeal_block",
+            parameters={"appeals": RecordDataset.from_records(properties, appeals)}
+        ))
+        
+        evaluations = result.result["evaluations"]
+        assert list(evaluations["recommendation"]) == [score_appeal(index.join(appeal))["recommendation"] for appeal in appeals]
+    
+    @pytest.mark.asyncio
+    async def test_workflow_analyzes_and_reports_from_dataset(self):
+        swarm_manager = SwarmManager(SwarmConfig())
+        await swarm_manager.start_swarm()
+        properties, appeals = make_records(5)
+        
+        with patch.object(swarm_manager, '_execute_data_collection', AsyncMock(return_value=(properties, appeals))):
+            result = await swarm_manager.execute_workflow()
+        
+        assert result.success
+        assert result.results["patterns"]["statistics"]["total_properties"] == 5
+        summary = result.results["report"]["partial_report"]["report"]["summary"]
+        assert summary["total_appeals"] == 5
+        assert summary["average_reduction"] == pytest.approx(20000)
+
+
+class TestPatternAccumulators:
+    
+    def test_running_moments_match_batch_statistics(self):
+        values = np.random.default_rng(0).normal(200000, 30000, 10000)
+        first, second = RunningMoments(), RunningMoments()
+        for chunk in np.array_split(values[:6000], 7):
+            first.update(chunk)
+        second.update(values[6000:])
+        
+        first.merge(second)
+        
+        assert first.count == 10000
+        assert first.mean == pytest.approx(values.mean())
+        assert first.variance == pytest.approx(values.var())
+    
+    def test_quantile_digest_is_accurate_and_bounded(self):
+        values = np.random.default_rng(1).lognormal(12, 0.5, 200000)
+        shards = [QuantileDigest(), QuantileDigest()]
+        for i, chunk in enumerate(np.array_split(values, 40)):
+            shards[i % 2].update(chunk)
+        
+        digest = shards[0]
+        digest.merge(shards[1])
+        
+        assert len(digest.means) <= digest.compression / 2 + 1
+        for q in (0.01, 0.5, 0.9, 0.99):
+            assert digest.quantile(q) == pytest.approx(np.quantile(values, q), rel=0.02)
+        assert digest.quantile(0.0) == values.min()
+        assert QuantileDigest().quantile(0.5) is None
+    
+    def test_heavy_hitters_keep_frequent_values(self):
+        stream = ["Overassessment"] * 500 + ["Clerical error"] * 200 + [f"street {i}" for i in range(1000)]
+        np.random.default_rng(2).shuffle(stream)
+        first, second = HeavyHitters(capacity=8), HeavyHitters(capacity=8)
+        first.update(stream[:900])
+        second.update(stream[900:])
+        
+        first.merge(second)
+        
+        assert len(first.counts) <= 8
+        assert list(first.top(2)) == ["Overassessment", "Clerical error"]
+        assert 500 - first.total / 9 <= first.top(1)["Overassessment"] <= 500
+    
+    def test_record_batches_dataset_and_shards_agree(self):
+        properties, appeals = make_records(20)
+        properties = [record.model_copy(update={"assessed_value": 100000 + i * 5000}) for i, record in enumerate(properties)]
+        index = PropertyIndex(properties)
+        records = properties + appeals
+        
+        batched = PatternAccumulator()
+        for start in range(0, len(records), 7):
+            batched.update(records[start:start + 7], index.get)
+        
+        columnar = PatternAccumulator()
+        columnar.update_dataset(RecordDataset.from_records(properties, appeals))
+        
+        shards = [PatternAccumulator(), PatternAccumulator()]
+        shards[0].update(properties[:10] + appeals[:10], index.get)
+        shards[1].update(properties[10:] + appeals[10:], index.get)
+        shards[0].merge(shards[1])
+        
+        expected = batched.distributions()
+        for accumulator in (columnar, shards[0]):
+            distributions = accumulator.distributions()
+            assert accumulator.totals() == pytest.approx(batched.totals())
+            for name in ("assessed_value", "market_value", "assessment_ratio", "requested_reduction"):
+                assert distributions[name] == pytest.approx(expected[name])
+            assert distributions["top_reasons"] == expected["top_reasons"] == {"Overassessment": 20}
+        assert expected["requested_reduction"]["mean"] == pytest.approx(147500 - 130000)
+    
+    def test_zero_market_value_does_not_poison_ratios(self):
+        properties, appeals = make_records(4)
+        properties[0] = properties[0].model_copy(update={"market_value": 0})
+        accumulator, other = PatternAccumulator(), PatternAccumulator()
+        accumulator.update(properties[:2])
+        other.update(properties[2:])
+        
+        accumulator.merge(other)
+        
+        ratio = accumulator.distributions()["assessment_ratio"]
+        assert all(np.isfinite(value) for value in ratio.values())
+        assert accumulator.totals() == pytest.approx(compute_pattern_totals({"property_records": properties, "appeal_records": []}))
+    
+    @pytest.mark.asyncio
+    async def test_streaming_patterns_refresh_per_batch(self):
+        swarm_manager = SwarmManager(SwarmConfig(analysis_batch_size=4))
+        await swarm_manager.start_swarm()
+        properties, appeals = make_records(10)
+        
+        async def source():
+            for record in properties + appeals:
+                yield record
+        
+        pipeline = StreamingPipeline(swarm_manager, source())
+        stream = pipeline.stream()
+        await stream.__anext__()
+        
+        assert pipeline.patterns["statistics"]["total_properties"] == 10
+        await stream.aclose()
+        
+        result = await swarm_manager.execute_streaming_workflow(source())
+        distributions = result.results["patterns"]["distributions"]
+        assert distributions["top_reasons"] == {"Overassessment": 10}
+        assert distributions["assessment_ratio"]["p50"] == pytest.approx(150000 / 140000)